@@ -17,17 +17,23 @@ import os
 import re
 import sys
 import json
+import mmap
 import base64
+import pickle
 import argparse
-import matplotlib
-import collections
+from array import array
+from types import SimpleNamespace
+from bisect import bisect_left, bisect_right
 from html import escape
+from stat import S_ISREG
 from hashlib import md5
-import matplotlib.pyplot as plt
-from dataclasses import dataclass, field
+from functools import partial, lru_cache
+from itertools import groupby
+from operator import itemgetter
+from dataclasses import dataclass, field, fields
 from collections import defaultdict
-from typing import List, Union, Iterator, Optional, Dict, Tuple, Any, TypedDict
-matplotlib.use('Agg')
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union, Iterator, Optional, Dict, Tuple, Any, FrozenSet, Sequence, TypedDict
 @dataclass
 class LDFSignal:
     """
@@ -62,6 +68,7 @@ class LDFFrame:
         publisher (str): Nó que publica o frame
         size (int): Tamanho do frame em bytes (1-8)
         signals (List[LDFSignal]): Lista de sinais contidos no frame
+        signal_names (FrozenSet[str]): Nomes dos sinais do frame, para testes de pertinência
     """
 
     name: str
@@ -71,12 +78,17 @@ class LDFFrame:
     signals: List[LDFSignal] = field(default_factory=list)
     frame_type: str = "standard"
     associated_frames: List[str] = field(default_factory=list)
+    signal_names: FrozenSet[str] = field(default_factory=frozenset)
 @dataclass
 class LDFData:
     nodes: Dict[str, Any]
     frames: Dict[str, LDFFrame]
     schedules: Dict[str, List[Dict[str, Union[str, int]]]]
     signal_encoding: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    frames_by_id: Dict[int, LDFFrame] = field(default_factory=dict)
+    signal_to_frame_id: Dict[str, Optional[int]] = field(default_factory=dict)
+    signals_by_name: Dict[str, LDFSignal] = field(default_factory=dict)
+    parse_warnings: List[str] = field(default_factory=list)
 @dataclass
 class DBCSignal:
     name: str
@@ -105,6 +117,20 @@ class DBCMessage:
     nr_of_repetition: Optional[int] = None
     cycle_time_fast: Optional[int] = None
     delay_time: Optional[int] = None
+    signal_names: FrozenSet[str] = field(default_factory=frozenset)
+    mux_switch_signal: Optional[DBCSignal] = None
+    mux_switch_required_bytes: int = 0
+def _add_slots(cls):
+    """Recria uma dataclass com __slots__ (o mesmo que dataclass(slots=True), disponível só a partir do Python 3.10)."""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+@_add_slots
 @dataclass
 class LogEntry:
     """
@@ -115,7 +141,7 @@ class LogEntry:
         bus_type (str): Tipo de bus ('LIN' ou 'CAN')
         direction (str): Direção da mensagem ('Rx' ou 'Tx')
         frame_id (int): ID do frame/mensagem
-        data (List[int]): Dados em bytes
+        data (bytes): Dados em bytes
         channel (int): Canal de comunicação
         dlc (int): Data Length Code
         flags (str): Flags adicionais da mensagem
@@ -125,7 +151,7 @@ class LogEntry:
     frame_id: str
     frame_id_int: int
     type: str
-    data: List[int]
+    data: bytes
     raw_line: str
     declared_checksum: Optional[int] = None
     csm: Optional[str] = None
@@ -133,6 +159,73 @@ class LogEntry:
     event_channel: Optional[int] = None
     full_time_tbit: Optional[float] = None
     header_time_tbit: Optional[float] = None
+    type_lower: str = field(init=False, repr=False)
+    def __post_init__(self):
+        type_lower = LOG_ENTRY_TYPE_LOWER.get(self.type)
+        if type_lower is None:
+            type_lower = LOG_ENTRY_TYPE_LOWER[self.type] = sys.intern(self.type.lower())
+        self.type_lower = type_lower
+# Cache de type.lower() por tipo de entrada (são poucos valores distintos: Rx, Tx, TransmErr...)
+LOG_ENTRY_TYPE_LOWER: Dict[str, str] = {}
+@dataclass
+class PhysicalLimits:
+    """Limites da camada física derivados da configuração, calculados uma vez por análise."""
+    nominal_baudrate: float
+    baudrate_tol_bps: float
+    bit_duration_s: float
+    bit_duration_us: float
+    break_min_bits: float
+    break_max_bits: float
+    break_abs_tol_us: float
+    nominal_min_break_us: float
+    nominal_max_break_us: float
+    break_lower_limit_us: float
+    break_upper_limit_us: float
+    timing_rel_tol_factor: float
+    jitter_effective_s: float
+    expected_byte_duration_s: float
+    byte_tolerance_s: float
+    min_ifs_s: float
+    frame_duration_by_dlc_s: Tuple[Tuple[float, float], ...] = ()
+@dataclass
+class SlotTimingStats:
+    """Acumuladores de atraso observado (ms) de um slot de schedule table (média/M2 de Welford)."""
+    __slots__ = ('mean_ms', 'm2_ms', 'count', 'min_ms', 'max_ms')
+    mean_ms: float
+    m2_ms: float
+    count: int
+    min_ms: float
+    max_ms: float
+@dataclass
+class NodeResponseStats:
+    """Acumuladores de tempo de resposta (s) de um nó slave."""
+    __slots__ = ('min_s', 'max_s', 'sum_s', 'count', 'frames_published')
+    min_s: float
+    max_s: float
+    sum_s: float
+    count: int
+    frames_published: int
+@dataclass
+class SignalStats:
+    """Faixa observada (física e de exibição) e ocorrências de um sinal decodificado."""
+    __slots__ = ('min_phys', 'max_phys', 'min_display', 'max_display', 'unit', 'encoding_type', 'first_ts', 'last_ts', 'count')
+    min_phys: float
+    max_phys: float
+    min_display: Optional[Union[str, float]]
+    max_display: Optional[Union[str, float]]
+    unit: str
+    encoding_type: str
+    first_ts: Optional[float]
+    last_ts: Optional[float]
+    count: int
+@dataclass
+class SlaveFaultStats:
+    """Ocorrências de um sinal de erro (response_error) reportado por um nó slave."""
+    __slots__ = ('count', 'first_ts', 'last_ts', 'node_name')
+    count: int
+    first_ts: Optional[float]
+    last_ts: Optional[float]
+    node_name: Optional[str]
 class AggregatedMessageData(TypedDict):
     name: str
     id: int
@@ -141,10 +234,20 @@ class AggregatedMessageData(TypedDict):
     node_name: Optional[str]
     attributes: Dict[str, Any]
 # PADRÕES DE EXPRESSÕES REGULARES PARA PARSING DE LOGS
-LIN_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+(?P<id>[0-9A-Fa-f]+)\s+(?P<type>\w+)(?:\s+(?P<dl>\d+))?(?P<data>(?:\s+[0-9A-Fa-f]{2}){0,})(?:.*?checksum\s*=\s*(?P<checksum>[0-9A-Fa-f]{2}))?(?:.*?header\s*time\s*=\s*(?P<header_time>\s*\d+))?(?:.*?full\s*time\s*=\s*(?P<full_time>\s*\d+))?(?:.*?SOF\s*=\s*(?P<sof>\s*\d+\.\d+))?(?:.*?BR\s*=\s*(?P<br>\s*\d+))?(?:.*?break\s*=\s*(?P<break_info>[\d\s]+))?(?:.*?EOH\s*=\s*(?P<eoh>\s*\d+\.\d+))?(?:.*?EOB\s*=\s*(?P<eob>[\d\.\s]+))?(?:.*?EOF\s*=\s*(?P<eof>\s*\d+\.\d+))?(?:.*?RBR\s*=\s*(?P<rbr>\s*\d+))?(?:.*?HBR\s*=\s*(?P<hbr>[\d\.]+))?(?:.*?HSO\s*=\s*(?P<hso>\s*\d+))?(?:.*?RSO\s*=\s*(?P<rso>\s*\d+))?(?:.*?CSM\s*=\s*(?P<csm>\w+))?', re.IGNORECASE)
+# Grupos atômicos e quantificadores possessivos (Python 3.11+) evitam backtracking em linhas malformadas
+REGEX_ATOMIC_GROUP = '(?>' if sys.version_info >= (3, 11) else '(?:'
+REGEX_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+LIN_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+(?P<id>[0-9A-Fa-f]+)\s+(?P<type>\w+)(?:\s+(?P<dl>\d+))?(?P<data>(?:\s+[0-9A-Fa-f]{2}){0,})', re.IGNORECASE)
+LIN_PHYSICAL_FIELDS = ('sof', 'br', 'break_info', 'eoh', 'eob', 'eof', 'rbr', 'hbr', 'hso', 'rso')
+LIN_FIELDS_PATTERN = re.compile((r'(?:.*?checksum\s*=\s*(?P<checksum>[0-9A-Fa-f]{2}))?(?:.*?header\s*time\s*=\s*(?P<header_time>\s*\d+))?(?:.*?full\s*time\s*=\s*(?P<full_time>\s*\d+))?(?:.*?SOF\s*=\s*(?P<sof>\s*\d+\.\d+))?(?:.*?BR\s*=\s*(?P<br>\s*\d+))?(?:.*?break\s*=\s*(?P<break_info>[\d\s]+))?(?:.*?EOH\s*=\s*(?P<eoh>\s*\d+\.\d+))?(?:.*?EOB\s*=\s*(?P<eob>\d+(?:\.\d*)?(?:\s+\d+(?:\.\d*)?)*))?(?:.*?EOF\s*=\s*(?P<eof>\s*\d+\.\d+))?(?:.*?RBR\s*=\s*(?P<rbr>\s*\d+))?(?:.*?HBR\s*=\s*(?P<hbr>\d+(?:\.\d*)?))?(?:.*?HSO\s*=\s*(?P<hso>\s*\d+))?(?:.*?RSO\s*=\s*(?P<rso>\s*\d+))?(?:.*?CSM\s*=\s*(?P<csm>\w+))?').replace('(?:', REGEX_ATOMIC_GROUP), re.IGNORECASE)
 CANFD_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+CANFD\s+(?P<channel>\d+)\s+(?P<type>\w+)\s+(?P<id>[0-9A-Fa-f]+)(?:\s+(?P<flags>[\w\s]+))?(?:\s+(?P<dl>\d+))?(?P<data>(?:\s+[0-9A-Fa-f]{2}){0,}).*', re.IGNORECASE)
 CAN_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+(?P<channel>\d+)\s+(?P<id>[0-9A-Fa-f]+)(?:\s+F)?\s+(?P<type>\w+)(?:\s*d\s*(?P<dl>\d+))?(?P<data>(?:\s+[0-9A-Fa-f]{2}){0,}).*', re.IGNORECASE)
 EVENT_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+SleepModeEvent\s+(?P<event_channel>\d+)\s+(?P<detail>.+)', re.IGNORECASE)
+SLEEP_EVENT_WAKE_RE = re.compile(r'wak(?:ing|e) up', re.IGNORECASE)
+SLEEP_EVENT_ENTER_RE = re.compile(r'entering sleep mode', re.IGNORECASE)
+LOGGER_START_RE = re.compile(r'starting up|waking up', re.IGNORECASE)
+# Tipos de entrada LIN que abrem um ciclo implícito (sem evento de wake-up)
+LIN_CYCLE_FRAME_TYPES = frozenset(('Rx', 'Tx', 'TransmErr', 'RcvError'))
 SPIKE_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+Spike\s+Rx\s+(?P<detail>.+)', re.IGNORECASE)
 TRANSERR_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+(?P<id>[0-9A-Fa-f]+)\s+TransmErr\b.*', re.IGNORECASE)
 RCVERR_PATTERN = re.compile(r'^\s*(?P<ts>\d+\.\d+)\s+Li\s+(?P<id>[0-9A-Fa-f]+)?\s*(?:\d+)?\s*RcvError:.*', re.IGNORECASE)
@@ -155,13 +258,14 @@ DBC_BA_DEF_DEF_RE = re.compile(r'BA_DEF_DEF_\s+"([^"]+)"\s+([^;]+);', re.IGNOREC
 DBC_BA_NON_OBJECT_SPECIFIC_RE = re.compile(r'BA_\s+"([^"]+)"\s+(?!BO_\s|SG_\s|BU_\s)([^;]+);', re.IGNORECASE)
 DBC_BA_RE = re.compile(r'BA_\s+"([^"]+)"\s+(?:BO_\s+(\d+)\s+)?(?:SG_\s+(\d+)\s+([\w\d]+)\s+)?(?:BU_\s+([\w\d]+)\s+)?([^;]+);', re.IGNORECASE)
 DBC_BA_SIMPLE_ATTR_RE = re.compile(r'BA_\s+"([^"]+)"\s+([^;]+);')
+DBC_BA_BO_RE = re.compile(r'BA_\s+"([^"]+)"\s+BO_\s+(\d+)\s+([^;]+);')
 NODE_BLOCK_RE = re.compile(r'Nodes\s*{(.*?)}', re.IGNORECASE | re.DOTALL)
 MASTER_NODE_RE = re.compile(r'Master\s*:\s*([^\s,;]+)\s*,\s*([\d\.]+)\s*ms(?:\s*,\s*([\d\.]+)\s*ms)?', re.IGNORECASE)
 SLAVE_NODES_RE = re.compile(r'Slaves\s*:\s*([^;]+)', re.IGNORECASE)
 SIGNAL_DEF_RE = re.compile(r'\s*(\w+)\s*:\s*(\d+)\s*,\s*\d+\s*,\s*(\w+)(?:\s*,\s*([\w\s,]+))?\s*;', re.IGNORECASE)
 ENCODING_TYPE_BLOCK_RE = re.compile(r'Signal_encoding_types\s*{(.*?)}\s*(?:Node_attributes|Schedule_tables|$)', re.IGNORECASE | re.DOTALL)
 ENCODING_CHUNK_RE = re.compile(r'(\w+)\s*{(.*?)}', re.IGNORECASE | re.DOTALL)
-PHYSICAL_VALUE_RE = re.compile(r'physical_value\s*,\s*\d+\s*,\s*\d+\s*,\s*([\d\.\-eE]+)\s*,\s*([\d\.\-eE]+)\s*,\s*"([^"]*)"', re.IGNORECASE)
+PHYSICAL_VALUE_RE = re.compile(r'physical_value\s*,\s*\d+\s*,\s*\d+\s*,\s*([\d\.\-eE]+)\s*,\s*([\d\.\-eE]+)\s*,\s*"([^"]*)"(?:[^\[;]*\[([\d\.\-eE]+)\|([\d\.\-eE]+)\])?', re.IGNORECASE)
 LOGICAL_VALUE_RE = re.compile(r'logical_value\s*,\s*(\d+)\s*,\s*"([^"]+)"', re.IGNORECASE)
 SIGNAL_REPR_BLOCK_RE = re.compile(r'Signal_representation\s*{(.*?)}', re.IGNORECASE | re.DOTALL)
 SIGNAL_REPR_LINE_RE = re.compile(r'\s*(\w+)\s*:\s*([^;]+);', re.IGNORECASE)
@@ -170,23 +274,41 @@ FRAME_DEF_RE = re.compile(r'(\w+)\s*:\s*(0x[0-9A-Fa-f]+|\d+)\s*,\s*(\w+)\s*,\s*(
 FRAME_SIG_RE = re.compile(r'\s*(\w+)\s*,\s*(\d+)\s*;', re.IGNORECASE)
 DIAG_FRAME_BLOCK_RE = re.compile(r'Diagnostic_frames\s*{(.*?)}\s*(?=(\w+\s*{)|$)', re.IGNORECASE | re.DOTALL)
 DIAG_FRAME_DEF_RE = re.compile(r'(\w+)\s*:\s*(0x[0-9A-Fa-f]+|\d+)\s*{([^}]*)}', re.IGNORECASE | re.DOTALL)
+LDF_NESTED_BLOCK_RE = re.compile(r'(Signals|Sporadic_frames|Event_triggered_frames|Node_attributes)\s*{', re.IGNORECASE)
+NODE_ATTR_NAME_RE = re.compile(r'^\s*(\w+)\s*{', re.MULTILINE)
+RESPONSE_ERROR_RE = re.compile(r'response_error\s*=\s*(\w+)\s*;', re.IGNORECASE)
 SCHEDULE_TABLE_BLOCK_RE = re.compile(r'Schedule_tables\s*{(.*?)}\s*$', re.IGNORECASE | re.DOTALL)
-SCHEDULE_TABLE_DEF_RE = re.compile(r'(\w+)\s*{\s*(.*?)\s*}', re.IGNORECASE | re.DOTALL)
-SCHEDULE_ENTRY_RE = re.compile(r'(\w+)\s+delay\s+(\d+)\s*ms\s*;', re.IGNORECASE)
+SCHEDULE_TOKEN_RE = re.compile(r'(?P<table>\w+)\s*{|(?P<close>})|(?P<frame>\w+)\s+delay\s+(?P<delay>\d+)\s*ms\s*;', re.IGNORECASE)
 DBC_VAL_RE = re.compile(r'VAL_\s+(\d+)\s+(\w+)\s+((?:\s*\d+\s+"[^"]+"\s*)+);')
 MSG_DEF_RE = re.compile(r'BO_\s+(\d+)\s+(\w+)\s*:\s*(\d+)\s+([\w\-\_]+)', re.IGNORECASE)
-DBC_SIG_RE = re.compile(r'\s*SG_\s+(\w+)\s*([mM]\d*)?\s*:\s*(\d+)\|(\d+)@(\d)([\+\-])\s+\(([\d\.\-eE]+),([\d\.\-eE]+)\)\s+\[([\d\.\-eE]+)\|([\d\.\-eE]+)\]\s+"([^"]*)"\s+([\w\s,]+)', re.IGNORECASE)
+# Forma completa (min|max, unidade, receptores) ou, se ela falhar, a forma simples ([...] "unidade"), cuja unidade vem no último grupo
+DBC_SIG_RE = re.compile(r'\s*SG_\s+(\w+)\s*([mM]\d*)?\s*:\s*(\d+)\|(\d+)@(\d)([\+\-])\s+\(([\d\.\-eE]+),([\d\.\-eE]+)\)\s+\[(?:([\d\.\-eE]+)\|([\d\.\-eE]+)\]\s+"([^"]*)"\s+([\w,][\w\s,]*' + REGEX_POSSESSIVE + r')|.*?\]\s+"([^"]*)")', re.IGNORECASE)
 PHYSICAL_ERROR_LABELS = {'baudrate_deviation':'Baudrate Deviation','break_field_error_too_short':'Break Field Too Short','break_field_error_too_long':'Break Field Too Long','delimiter_duration_error':'Delimiter Field Duration Mismatch','header_duration_error':'Header Duration Mismatch','frame_duration_error':'Frame Duration Mismatch','byte_timing_error':'Byte Interval Mismatch','ifs_error_too_short':'Inter-Frame Spacing Too Short','hso_duration_error':'Header Sync Field Offset/Duration Error','rso_duration_error':'Response Sync Field Offset/Duration Error'}
+PHYSICAL_ERROR_ROW_HTML = "<tr><td><code>0x%X</code></td><td><code>%s</code></td><td>%d</td><td><code>%s</code></td><td><code>%s</code></td><td>%.6f</td></tr>"
+TIMING_MISMATCH_ROW_HTML = "<tr><td><code>%s</code></td><td>%d</td><td><code>%s</code></td><td><code>%s</code></td><td>%d</td><td>%.2f</td><td>%s</td></tr>"
+SEQUENCE_MISMATCH_ROW_HTML = "<tr><td>#%s</td><td>%.6f</td><td><code>%s</code></td><td><code>%s</code></td><td>%s</td></tr>"
+INTRUSION_FRAME_ROW_HTML = "<tr><td>%.6f</td><td><code>%s</code></td><td><code>%s</code></td></tr>"
+# Faixas de taxa de resposta dos slaves: < 95% KO, < 100% WARN, senão OK
+RELIABILITY_RATE_THRESHOLDS = (95.0, 100.0)
+RELIABILITY_RATE_STATUS = ('KO', 'WARN', 'OK')
 COMMA_OUTSIDE_BRACES = re.compile(r',(?![^{}]*\})')
-DBC_SIG_RE_SIMPLE = re.compile(r'\s*SG_\s+(\w+)\s*([mM]\d*)?\s*:\s*(\d+)\|(\d+)@(\d)([\+\-])\s+\(([\d\.\-eE]+),([\d\.\-eE]+)\)\s+\[.*?\]\s+"([^"]*)"', re.IGNORECASE)
 DBC_VAL_RE = re.compile(r'VAL_\s+(\d+)\s+(\w+)\s+((?:\s*\d+\s+"[^"]+"\s*)+);', re.IGNORECASE)
 VAL_PAIR_RE = re.compile(r'(\d+)\s+"([^"]+)"')
+# Palavras-chave de linha DBC tratadas por parse_dbc_single_file (bytes -> str); as demais linhas são ignoradas sem decodificar
+DBC_LINE_KEYWORDS = {keyword.encode(): keyword for keyword in ('BO_', 'SG_', 'BA_', 'BA_DEF_DEF_', 'VAL_')}
+# Discriminador do tipo de barramento da linha; dentro de cada grupo, o primeiro padrão que casa vence
+LOG_LINE_BUS_RE = re.compile(r'^\s*\d+\.\d+\s+(?:(?P<lin>Li)|(?P<canfd>CANFD)|(?P<can>\d+))\s', re.IGNORECASE)
+LOG_LINE_PATTERNS = {'lin': (('spike', SPIKE_PATTERN), ('transerr', TRANSERR_PATTERN), ('rcverr', RCVERR_PATTERN), ('lin', LIN_PATTERN), ('event', EVENT_PATTERN)), 'canfd': (('canfd', CANFD_PATTERN),), 'can': (('can', CAN_PATTERN),)}
 LIN_INACTIVITY_THRESHOLD_S = 0.5
+# Tamanho aproximado dos blocos do log decodificados de uma vez em parse_log
+LOG_READ_CHUNK_BYTES = 1 << 20
+PHYSICAL_METRIC_KEYS = ('baudrate_values', 'header_duration_values', 'frame_duration_values', 'hso_values_s', 'rso_values_s')
 # CONSTANTES DE CONFIGURAÇÃO E THRESHOLDS DE VALIDAÇÃO
 DEFAULT_PHYSICAL_MASTER_SYNC_BYTE_BITS = 24
 DEFAULT_PHYSICAL_SLAVE_SYNC_BYTE_BITS = 14
 PHYSICAL_COMPARISON_EPSILON = 1e-6
 DEFAULT_LIN_BAUDRATE = 19200
+LIN_MAX_DLC = 8
 DEFAULT_PHYSICAL_BAUDRATE_TOLERANCE_PERC = 2.0
 DEFAULT_PHYSICAL_BREAK_MIN_BITS = 13
 DEFAULT_PHYSICAL_BREAK_MAX_BITS = 18
@@ -199,48 +321,58 @@ DEFAULT_SUMMARY_LIMIT = 10
 SCRIPT_NAME = "LINSpector"
 SCRIPT_VERSION = "0.5.0"
 DEFAULT_GATEWAY_TOLERANCE_S = 0.022
+REPORT_WRITE_BUFFER_BYTES = 1 << 20
+GATEWAY_MISMATCH_EXAMPLES_LIMIT = 10 # Exemplos guardados por mapeamento (o relatório só exibe estes)
+# Cabeçalhos fixos das tabelas de erro do relatório
+TRANSMISSION_ERRORS_TABLE_HEADER = "<details close><summary>Transmission Errors</summary><table>\n<thead><tr><th>Error Type</th><th>Affected ID</th><th>Occurrences</th><th>First Timestamp (s)</th></tr></thead><tbody>"
+FRAMES_AFTER_SLEEP_TABLE_HEADER = "<details close><summary>LIN Frames Detected After Sleep</summary><table>\n<thead><tr><th>Frame ID</th><th>Occurrences</th><th>First Timestamp (s)</th><th>Example Log Line</th></tr></thead><tbody>"
+FOREIGN_LIN_IDS_TABLE_HEADER = "<details close><summary>Foreign LIN IDs</summary><table>\n<thead><tr><th>Foreign ID</th><th>Occurrences</th><th>First Occurrence (s)</th><th>Last Occurrence (s)</th></tr></thead><tbody>"
+SIGNAL_RANGE_ERRORS_TABLE_HEADER = "<details close><summary>Signals Out of Range</summary><table>\n<thead><tr><th>Network</th><th>Signal</th><th>Out of Range Count</th><th>Example Value</th><th>First Seen (s)</th><th>Last Seen (s)</th></tr></thead><tbody>"
+SYNC_ERRORS_TABLE_HEADER = "<details close><summary>Timestamp Synchronization Issues</summary><table>\n<thead><tr><th>Issue Type</th><th>Occurrences</th><th>Example Details</th><th>First Timestamp (s)</th></tr></thead><tbody>"
+PARITY_ERRORS_TABLE_HEADER = "<details close><summary>LIN PID Parity Errors</summary><table>\n<thead><tr><th>Received PID</th><th>Expected PID</th><th>Occurrences</th><th>First Timestamp (s)</th></tr></thead><tbody>"
+DLC_ERRORS_TABLE_HEADER = "<details close><summary>LIN DLC Errors</summary><table>\n<thead><tr><th>ID</th><th>Frame Name</th><th>Expected</th><th>Observed</th><th>Count</th><th>First Seen (s)</th></tr></thead><tbody>"
+CHECKSUM_ERRORS_TABLE_HEADER = "<details close><summary>LIN Checksum Errors</summary><table>\n<thead><tr><th>ID</th><th>Frame Name</th><th>Expected</th><th>Observed</th><th>Count</th><th>First Seen (s)</th></tr></thead><tbody>"
+SLAVE_FAULTS_TABLE_HEADER = "<details close><summary>Slave Faults Detected</summary>\n<table><thead><tr><th>Slave Node</th><th>Error Signal Name</th><th>Times Reported</th><th>First Timestamp (s)</th><th>Last Timestamp (s)</th></tr></thead><tbody>"
+ERROR_TABLE_FOOTER = "</tbody></table></details>"
 DEFAULT_BUS_LOAD_WINDOW_S = 1.0
+BUS_LOAD_PLOT_MIN_WINDOWS = 2 # Com menos janelas o gráfico não mostra evolução alguma
 LINSPECTOR_CSS = "<style>:root {--bg-color: #f8f9fa; --text-color: #212529; --text-secondary-color: #495057; --accent-color: #059669; --border-color: #dee2e6; --header-bg: #ffffff; --header-border: #ced4da; --table-header-bg: #e9ecef; --table-row-hover-bg: #dde6f0; --code-bg: #e9ecef; --details-bg: #ffffff; --summary-bg: #f1f3f5; --summary-hover-bg: #e9ecef; --summary-open-bg: #343a40; --summary-open-text: #ffffff; --status-ok-text: #198754; --status-warn-text: #fd7e14; --status-ko-text: #dc3545;}@media (prefers-color-scheme: dark) {:root {--bg-color: #121212; --text-color: #e8e6e3; --text-secondary-color: #adb5bd; --accent-color: #34d399; --border-color: #343a40; --header-bg: #1c1c1c; --header-border: #343a40; --table-header-bg: #2c2c2e; --table-row-hover-bg: #3a3a3c; --code-bg: #2c2c2e; --details-bg: #1c1c1c; --summary-bg: #2c2c2e; --summary-hover-bg: #3a3a3c; --summary-open-bg: #065f46; --summary-open-text: #ffffff; --status-ok-text: #28a745; --status-warn-text: #ffc107; --status-ko-text: #f04a5f;} tbody tr:nth-child(even){ background-color: #1a1a1a; }}body {font-family: -apple-system, BlinkMacSystemFont, \"Segoe UI\", Roboto, \"Helvetica Neue\", Arial, Ubuntu, sans-serif; margin: 0; padding: 0 2rem 2rem 2rem; line-height: 1.6; font-size: 16px; background-color: var(--bg-color); color: var(--text-color);} .report-header {display: flex; justify-content: center; align-items: center; gap: 1em; background: var(--header-bg); border-bottom: 1px solid var(--border-color); padding: 1.2em 1.5em; margin: 0 -2rem 2.5rem -2rem; font-size: 1.1em; position: sticky; top: 0; z-index: 10; box-shadow: 0 2px 4px rgba(0,0,0,0.05);} .report-title {font-size: 1.25em; font-weight: 600;} .report-meta {color: var(--text-secondary-color);} h1, .main-title {font-size: 2.2rem; color: var(--text-color); border-left: 5px solid var(--accent-color); padding: .6em 1em; margin: 2rem 0 1.5rem 0; background: var(--summary-bg); font-weight: 700; letter-spacing: .01em;} h2 {font-size: 1.6rem; color: var(--text-color); border-bottom: 2px solid var(--border-color); padding-bottom: .3em; margin: 2.5rem 0 1.5rem 0; font-weight: 600;} h3 {font-size: 1.3rem; color: var(--text-color); margin: 2rem 0 1rem 0; font-weight: 600;} h4 {font-size: 1.1rem; color: var(--text-color); margin: 1.5rem 0 .8rem 0; font-weight: 600;} table {border-collapse: collapse; width: 100%; margin-bottom: 2rem; border: 1px solid var(--border-color); box-shadow: 0 1px 3px rgba(0,0,0,0.04);} th, td {padding: .75rem 1rem; text-align: left; border-bottom: 1px solid var(--border-color);} th {background: var(--table-header-bg); font-weight: 600; text-transform: uppercase; font-size: .8em; letter-spacing: .05em;} tbody tr:hover {background-color: var(--table-row-hover-bg);} details {margin: 1rem 0; border: 1px solid var(--border-color); background-color: var(--details-bg); overflow: hidden;} summary {padding: 1rem 1.2rem; cursor: pointer; font-weight: 600; background-color: var(--summary-bg); color: var(--text-color); display: flex; align-items: center; transition: background-color 0.2s ease-in-out; font-size: 1.1em; list-style: none;} summary::-webkit-details-marker {display: none;} summary:hover {background-color: var(--summary-hover-bg);} summary::before {content: '▶'; margin-right: .8em; font-size: .8em; color: var(--text-secondary-color); transition: transform 0.2s ease-in-out;} details[open] > summary {background-color: var(--summary-open-bg); color: var(--summary-open-text); border-bottom: 1px solid var(--border-color);} details[open] > summary::before {transform: rotate(90deg); color: var(--summary-open-text);} details > :not(summary) {padding: 1.5rem;} code, .id-badge {font-family: \"SF Mono\", \"Fira Mono\", \"Consolas\", \"Menlo\", monospace; font-size: 0.9em; background-color: var(--code-bg); color: var(--text-color); padding: .2em .4em;} .status-ok {color: var(--status-ok-text); font-weight: 700;} .status-warn {color: var(--status-warn-text); font-weight: 700;} .status-ko {color: var(--status-ko-text); font-weight: 700;} .status-na {color: var(--text-secondary-color); font-style: italic; font-weight: 500;} .status-info {color: var(--accent-color); font-weight: 700;}</style>"
-def _generate_bus_load_plot_base64(bus_load_data_percent: list, window_size_s: float) -> str:
+def _generate_bus_load_plot_base64(bus_load_data_percent: Sequence[float], window_size_s: float) -> str:
     if not bus_load_data_percent:
         return ""
     try:
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except OSError:
-            plt.style.use('ggplot')
-        fig, ax = plt.subplots(figsize=(10, 2.5), dpi=90)
-        time_axis = [i * window_size_s for i in range(len(bus_load_data_percent))]
-        ax.plot(time_axis, bus_load_data_percent, color='#059669', linewidth=1.2, label='Bus Load')
-        ax.fill_between(time_axis, bus_load_data_percent, color='#059669', alpha=0.1)
-        avg_load = sum(bus_load_data_percent) / len(bus_load_data_percent) if bus_load_data_percent else 0
-        max_load = max(bus_load_data_percent) if bus_load_data_percent else 0
-        ax.axhline(y=avg_load, color='#E67E22', linestyle='--', linewidth=1, label=f'Avg: {avg_load:.2f}%')
-        ax.axhline(y=max_load, color='#D9534F', linestyle=':', linewidth=1, label=f'Peak: {max_load:.2f}%')
-        ax.set_ylabel('Bus Load (%)', fontsize=10)
-        ax.set_xlabel(f'Time (s)', fontsize=10)
-        ax.set_ylim(0, 105)
-        ax.set_xlim(0, time_axis[-1] if time_axis else 1)
-        ax.legend(loc='upper center', bbox_to_anchor=(0.5, 1.15), ncol=3, fancybox=True, shadow=False, fontsize='small')
-        ax.tick_params(axis='both', which='major', labelsize=8)
-        fig.tight_layout(pad=0.5)
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png')
-        plt.close(fig)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        return f"data:image/png;base64,{img_base64}"
+        import matplotlib.style
+        from matplotlib.figure import Figure
+        plot_style = 'seaborn-v0_8-whitegrid' if 'seaborn-v0_8-whitegrid' in matplotlib.style.available else 'ggplot'
+        with matplotlib.style.context(plot_style):
+            fig = Figure(figsize=(10, 2.5), dpi=90)
+            ax = fig.subplots()
+            time_axis = [i * window_size_s for i in range(len(bus_load_data_percent))]
+            ax.plot(time_axis, bus_load_data_percent, color='#059669', linewidth=1.2, label='Bus Load')
+            ax.fill_between(time_axis, bus_load_data_percent, color='#059669', alpha=0.1)
+            avg_load = sum(bus_load_data_percent) / len(bus_load_data_percent) if bus_load_data_percent else 0
+            max_load = max(bus_load_data_percent) if bus_load_data_percent else 0
+            ax.axhline(y=avg_load, color='#E67E22', linestyle='--', linewidth=1, label=f'Avg: {avg_load:.2f}%')
+            ax.axhline(y=max_load, color='#D9534F', linestyle=':', linewidth=1, label=f'Peak: {max_load:.2f}%')
+            ax.set_ylabel('Bus Load (%)', fontsize=10)
+            ax.set_xlabel(f'Time (s)', fontsize=10)
+            ax.set_ylim(0, 105)
+            ax.set_xlim(0, time_axis[-1] if time_axis else 1)
+            ax.legend(loc='upper center', bbox_to_anchor=(0.5, 1.15), ncol=3, fancybox=True, shadow=False, fontsize='small')
+            ax.tick_params(axis='both', which='major', labelsize=8)
+            fig.tight_layout(pad=0.5)
+            buf = io.BytesIO()
+            fig.savefig(buf, format='png')
+        return base64.b64encode(buf.getbuffer()).decode('ascii')
     except Exception as e:
         print(f"Warning: Could not generate LIN bus load plot. Reason: {e}")
         return ""
 def smart_split(rhs: str) -> list[str]:
-    return [tok.strip() for tok in COMMA_OUTSIDE_BRACES.split(rhs) if tok.strip()]
-def calculate_pid(frame_id: int) -> int:
-    if not (0 <= frame_id <= 0x3F): raise ValueError(f"Frame ID {frame_id} (0x{frame_id:X}) out of range for PID (0-63).")
-    id_bits = frame_id & 0x3F
-    p0 = ((id_bits >> 0)&1)^((id_bits >> 1)&1)^((id_bits >> 2)&1)^((id_bits >> 4)&1)
-    p1 = (~(((id_bits >> 1)&1)^((id_bits >> 3)&1)^((id_bits >> 4)&1)^((id_bits >> 5)&1)))&1
-    return (id_bits | (p0 << 6) | (p1 << 7)) & 0xFF
+    parts = rhs.split(',') if '}' not in rhs else COMMA_OUTSIDE_BRACES.split(rhs)
+    return [tok for tok in map(str.strip, parts) if tok]
+# PID protegido (ID + bits de paridade P0/P1) pré-calculado para os 64 IDs LIN; P0 = paridade dos bits 0,1,2,4 (0x17),
+# P1 = paridade invertida dos bits 1,3,4,5 (0x3A). Contagem com bin().count('1'): int.bit_count só existe a partir do Python 3.10
+PID_TABLE = bytes(i | ((bin(i & 0x17).count('1') & 1) << 6) | ((~bin(i & 0x3A).count('1') & 1) << 7) for i in range(64))
 def convert_signal_value(raw_value: int, factor: float = 1.0, offset: float = 0.0) -> float:
     return (raw_value * factor) + offset
 def parse_ldf(ldf_path: str) -> LDFData:
@@ -272,12 +404,67 @@ def parse_ldf(ldf_path: str) -> LDFData:
         }
     """
     try:
-        with open(ldf_path, 'r', encoding='utf-8', errors='ignore') as f:
-            ldf_content = f.read()
+        with open(ldf_path, 'rb') as f:
+            ldf_raw = f.read()
     except FileNotFoundError:
         raise
     except Exception as e:
         raise IOError(f"Could not read LDF file: {e}") from e
+    ldf_content = ldf_raw.decode('utf-8', 'ignore')
+    if '\r' in ldf_content:
+        ldf_content = ldf_content.replace('\r\n', '\n').replace('\r', '\n')
+    return _parse_ldf_content(ldf_content)
+LDF_DISK_CACHE_VERSION = 4
+DBC_DISK_CACHE_VERSION = 1
+DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'linspector')
+def _file_cache_key(path: str, file_stat: Optional[os.stat_result] = None) -> str:
+    """Identifica a versão de um arquivo no disco: caminho absoluto, mtime e tamanho (usa file_stat se já houver)."""
+    if file_stat is None:
+        file_stat = os.stat(path)
+    return f"{os.path.abspath(path)}|{file_stat.st_mtime_ns}|{file_stat.st_size}"
+def _disk_cache_path(cache_key: str) -> str:
+    return os.path.join(DISK_CACHE_DIR, md5(cache_key.encode('utf-8')).hexdigest() + '.pkl')
+def _read_disk_cache(cache_path: str) -> Any:
+    """Carrega um objeto do cache em disco; devolve None se não existir ou estiver ilegível."""
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        return None
+def _write_disk_cache(cache_path: str, value: Any) -> None:
+    """Grava o objeto no cache em disco de forma atômica; falhas são ignoradas."""
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as cache_file:
+            pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+def parse_ldf_cached(ldf_path: str, ldf_stat: Optional[os.stat_result] = None) -> LDFData:
+    """
+    Igual a parse_ldf, mas reaproveita o resultado de execuções anteriores.
+
+    O LDFData é salvo em pickle no diretório de cache do usuário, com chave
+    derivada do caminho absoluto, mtime e tamanho do arquivo. Qualquer falha
+    de leitura/escrita do cache cai de volta para o parse normal. Parses com
+    avisos não são guardados, para que os avisos reapareçam nas próximas execuções.
+    """
+    cache_path = _disk_cache_path(f"{_file_cache_key(ldf_path, ldf_stat)}|{LDF_DISK_CACHE_VERSION}")
+    cached_ldf = _read_disk_cache(cache_path)
+    if isinstance(cached_ldf, LDFData):
+        return cached_ldf
+    ldf_data = parse_ldf(ldf_path)
+    if not ldf_data.parse_warnings:
+        _write_disk_cache(cache_path, ldf_data)
+    return ldf_data
+def _parse_ldf_content(ldf_content: str) -> LDFData:
+    # Avisos ficam registrados no LDFData: um parse com avisos não vai para o cache em disco
+    parse_warnings: List[str] = []
+    def warn(message):
+        print(message)
+        parse_warnings.append(message)
+    ldf_blocks = _extract_blocks(ldf_content)
     nodes: Dict[str, Union[str, List[str], float]] = {'slaves': []}
     master_jitter_s = 0.0
     nodes_match = NODE_BLOCK_RE.search(ldf_content)
@@ -305,7 +492,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
     else:
         raise ValueError("LDF parsing failed: Nodes section not found.")
     signals_base: Dict[str, LDFSignal] = {}
-    signals_raw = _extract_block(ldf_content, 'Signals')
+    signals_raw = ldf_blocks.get('signals')
     if signals_raw is None:
         signals_raw = ''
     signal_lines = [ln.strip() for ln in signals_raw.splitlines() if ln.strip() and not ln.strip().startswith('//')]
@@ -343,15 +530,14 @@ def parse_ldf(ldf_path: str) -> LDFData:
             details: Dict[str, Any] = {}
             phys_match = PHYSICAL_VALUE_RE.search(body)
             if phys_match:
-                factor_str, offset_str, unit = phys_match.groups()
+                factor_str, offset_str, unit, min_str, max_str = phys_match.groups()
                 try:
                     details['factor'] = float(factor_str.replace(',', '.'))
                     details['offset'] = float(offset_str.replace(',', '.'))
                     details['unit'] = unit
-                    min_max_match = re.search(r'\[([\d\.\-eE]+)\|([\d\.\-eE]+)\]', body)
-                    if min_max_match:
-                        details['min_value'] = float(min_max_match.group(1).replace(',', '.'))
-                        details['max_value'] = float(min_max_match.group(2).replace(',', '.'))
+                    if min_str is not None:
+                        details['min_value'] = float(min_str.replace(',', '.'))
+                        details['max_value'] = float(max_str.replace(',', '.'))
                 except ValueError:
                     pass
             logical_entries = LOGICAL_VALUE_RE.findall(body)
@@ -375,7 +561,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
         pass
     signal_objs = []
     missing = []
-    signal_to_encoding_map: Dict[str, str] = {}
+    signal_encoding_by_signal: Dict[str, Dict] = {}
     deferred_warnings: List[Tuple[str, str]] = []
     representation_match = SIGNAL_REPR_BLOCK_RE.search(ldf_content)
     if representation_match:
@@ -388,7 +574,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
                     for sig_name in signal_names:
                         sig_obj = signals_base.get(sig_name)
                         if sig_name in signals_base:
-                            signal_to_encoding_map[sig_name] = encoding_name
+                            signal_encoding_by_signal[sig_name] = signal_encoding_details[encoding_name]
                         else:
                             deferred_warnings.append((sig_name, encoding_name))
                         if sig_obj:
@@ -406,7 +592,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
         for fname, fid_str, publisher, dlc_str, sigs_text in frame_defs:
             frame_signals: List[LDFSignal] = []
             try:
-                frame_id = int(fid_str, 0)
+                frame_id = _parse_ldf_int(fid_str)
                 frame_dlc = int(dlc_str)
             except ValueError:
                 continue
@@ -417,8 +603,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
                     start_bit_str = sig_match.group(2)
                     if sig_name in signals_base:
                         base_sig_info = signals_base[sig_name]
-                        encoding_name = signal_to_encoding_map.get(sig_name)
-                        encoding_details = signal_encoding_details.get(encoding_name, {}) if encoding_name else {}
+                        encoding_details = signal_encoding_by_signal.get(sig_name, {})
                         try:
                             signal_instance = LDFSignal(
                                 name=sig_name,
@@ -440,7 +625,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
             frames[fname] = LDFFrame(fname, frame_id, publisher, frame_dlc, frame_signals)
     else:
         pass
-    spor_raw = _extract_block(ldf_content, 'Sporadic_frames')
+    spor_raw = ldf_blocks.get('sporadic_frames')
     if spor_raw:
         for ln in spor_raw.splitlines():
             ln = ln.strip()
@@ -456,7 +641,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
                 if frame_name.strip() and frame_name.strip() in frames
             ]
             if not associated_frame_names:
-                print(f"Warning: Sporadic frame '{sporadic_frame_name}' has no valid associated unconditional frames.")
+                warn(f"Warning: Sporadic frame '{sporadic_frame_name}' has no valid associated unconditional frames.")
                 continue
             frames[sporadic_frame_name] = LDFFrame(
                 name=sporadic_frame_name,
@@ -465,7 +650,7 @@ def parse_ldf(ldf_path: str) -> LDFData:
             )
     if missing:
         pass
-    event_triggered_frames_raw = _extract_block(ldf_content, 'Event_triggered_frames')
+    event_triggered_frames_raw = ldf_blocks.get('event_triggered_frames')
     if event_triggered_frames_raw:
         for line in event_triggered_frames_raw.splitlines():
             line = line.strip()
@@ -480,14 +665,14 @@ def parse_ldf(ldf_path: str) -> LDFData:
                 associated_frame_names_et = []
                 if tokens:
                     try:
-                        frame_id_et = int(tokens[0], 0)
+                        frame_id_et = _parse_ldf_int(tokens[0])
                         associated_frame_names_et = [name for name in tokens[1:] if name and name in frames]
                     except ValueError:
                         associated_frame_names_et = [name for name in tokens if name and name in frames]
                         if associated_frame_names_et and frames[associated_frame_names_et[0]].id is not None:
                             pass
                 if not associated_frame_names_et:
-                    print(f"Warning: Event-triggered frame '{event_frame_name}' has no valid associated unconditional frames or ID.")
+                    warn(f"Warning: Event-triggered frame '{event_frame_name}' has no valid associated unconditional frames or ID.")
                     continue
                 frames[event_frame_name] = LDFFrame(
                     name=event_frame_name,
@@ -499,14 +684,14 @@ def parse_ldf(ldf_path: str) -> LDFData:
                     associated_frames=associated_frame_names_et
                 )
             except Exception as e:
-                print(f"Warning: Could not parse event_triggered_frame line: '{line}'. Error: {e}")
+                warn(f"Warning: Could not parse event_triggered_frame line: '{line}'. Error: {e}")
                 pass
     diag_match = DIAG_FRAME_BLOCK_RE.search(ldf_content)
     if diag_match:
         diag_defs = DIAG_FRAME_DEF_RE.findall(diag_match.group(1))
         for frame_name, frame_id_str, signals_text_diag in diag_defs:
             try:
-                frame_id = int(frame_id_str, 0)
+                frame_id = _parse_ldf_int(frame_id_str)
                 publisher_diag = None
                 dlc_diag = 8
                 if frame_id == 0x3C:
@@ -520,14 +705,25 @@ def parse_ldf(ldf_path: str) -> LDFData:
                     frame_type='diagnostic'
                 )
             except ValueError:
-                print(f"Warning: Could not parse diagnostic frame ID for '{frame_name}'.")
+                warn(f"Warning: Could not parse diagnostic frame ID for '{frame_name}'.")
                 pass
     schedules: Dict[str, List[Dict[str, Union[str, int]]]] = {}
     schedule_match = SCHEDULE_TABLE_BLOCK_RE.search(ldf_content)
     if schedule_match:
-        schedule_defs = SCHEDULE_TABLE_DEF_RE.findall(schedule_match.group(1))
-        for sched_name, sched_body in schedule_defs:
-            entries = SCHEDULE_ENTRY_RE.findall(sched_body)
+        sched_name = None
+        entries: List[Tuple[str, str]] = []
+        for token in SCHEDULE_TOKEN_RE.finditer(schedule_match.group(1)):
+            token_kind = token.lastgroup
+            if sched_name is None:
+                if token_kind == 'table':
+                    sched_name = token.group('table')
+                    entries = []
+                continue
+            if token_kind == 'delay':
+                entries.append(token.group('frame', 'delay'))
+                continue
+            if token_kind != 'close':
+                continue
             schedule_entries: List[Dict[str, Union[str, int]]] = []
             valid_schedule = True
             for frame_name, delay_ms_str in entries:
@@ -545,16 +741,14 @@ def parse_ldf(ldf_path: str) -> LDFData:
                     break
             if valid_schedule and schedule_entries:
                 schedules[sched_name] = schedule_entries
+            sched_name = None
     else:
         pass
         
     nodes['slaves_with_error_signal'] = {}
-    node_attributes_content = _extract_block(ldf_content, 'Node_attributes')
+    node_attributes_content = ldf_blocks.get('node_attributes')
     if node_attributes_content:
-        response_error_re = re.compile(r'response_error\s*=\s*(\w+)\s*;', re.IGNORECASE)
-        node_name_re = re.compile(r'^\s*(\w+)\s*{', re.MULTILINE)
-        
-        node_matches = list(node_name_re.finditer(node_attributes_content))
+        node_matches = list(NODE_ATTR_NAME_RE.finditer(node_attributes_content))
         for i, current_match in enumerate(node_matches):
             node_name = current_match.group(1)
             
@@ -564,22 +758,33 @@ def parse_ldf(ldf_path: str) -> LDFData:
             node_body = node_attributes_content[start_pos:end_pos]
 
             if node_name in nodes.get('slaves', []):
-                error_signal_match = response_error_re.search(node_body)
+                error_signal_match = RESPONSE_ERROR_RE.search(node_body)
                 if error_signal_match:
                     error_signal_name = error_signal_match.group(1)
                     nodes['slaves_with_error_signal'][node_name] = error_signal_name
                     if error_signal_name not in signals_base:
-                        print(f"Warning: Response error signal '{error_signal_name}' for node '{node_name}' is defined but not found in the Signals block.")
+                        warn(f"Warning: Response error signal '{error_signal_name}' for node '{node_name}' is defined but not found in the Signals block.")
 
     if not frames:
         raise ValueError("LDF parsing failed: No frames found.")
     if 'master' not in nodes:
          pass
+    signal_to_frame_id: Dict[str, Optional[int]] = {}
+    signals_by_name: Dict[str, LDFSignal] = {}
+    for frame in frames.values():
+        frame.signal_names = frozenset(sig.name for sig in frame.signals)
+        for sig in frame.signals:
+            signal_to_frame_id.setdefault(sig.name, frame.id)
+            signals_by_name[sig.name] = sig
     ldf_data_obj = LDFData(
         nodes=nodes,
         frames=frames,
         schedules=schedules,
-        signal_encoding=signal_encoding_details
+        signal_encoding=signal_encoding_details,
+        frames_by_id={f.id: f for f in frames.values() if f.id is not None},
+        signal_to_frame_id=signal_to_frame_id,
+        signals_by_name=signals_by_name,
+        parse_warnings=parse_warnings
     )
     used_signals = {
         sig.name
@@ -590,23 +795,38 @@ def parse_ldf(ldf_path: str) -> LDFData:
         if sig_name not in used_signals:
             pass
     return ldf_data_obj
-def _extract_block(text: str, keyword: str) -> str | None:
-    start_match = re.search(rf'{keyword}\s*{{', text, re.IGNORECASE)
-    if not start_match:
-        return None
-    idx = start_match.end()
-    depth = 1
-    while idx < len(text) and depth:
-        if text[idx] == '{':
-            depth += 1
-        elif text[idx] == '}':
-            depth -= 1
-        idx += 1
-    return text[start_match.end():idx-1] if depth == 0 else None
+def _parse_ldf_int(text: str) -> int:
+    return int(text, 16) if text[:2] in ('0x', '0X') else int(text)
+def _extract_blocks(text: str) -> Dict[str, Optional[str]]:
+    blocks: Dict[str, Optional[str]] = {}
+    for start_match in LDF_NESTED_BLOCK_RE.finditer(text):
+        keyword = start_match.group(1).lower()
+        if keyword in blocks:
+            continue
+        idx = start_match.end()
+        depth = 1
+        while depth:
+            next_close = text.find('}', idx)
+            if next_close < 0:
+                break
+            next_open = text.find('{', idx, next_close)
+            if next_open < 0:
+                depth -= 1
+                idx = next_close + 1
+            else:
+                depth += 1
+                idx = next_open + 1
+        blocks[keyword] = text[start_match.end():idx-1] if depth == 0 else None
+        if len(blocks) == 4:
+            break
+    return blocks
+def read_json_file(json_path: str) -> Any:
+    """Lê o arquivo inteiro em bytes, numa única leitura, e decodifica o JSON (UTF-8/16/32, com ou sem BOM)."""
+    with open(json_path, 'rb') as f:
+        return json.loads(f.read())
 def load_gateway_map(map_path: str) -> Optional[List[Dict[str, Any]]]:
     try:
-        with open(map_path, 'r', encoding='utf-8') as f:
-            mappings = json.load(f)
+        mappings = read_json_file(map_path)
     except FileNotFoundError:
         print(f"Error: Gateway map file not found: {map_path}")
         return None
@@ -625,6 +845,11 @@ def load_gateway_map(map_path: str) -> Optional[List[Dict[str, Any]]]:
                      'target_network', 'target_message', 'target_signal'}
     valid_networks = {'LIN', 'CAN1', 'CAN2', 'CAN3', 'CANFD1', 'CANFD2', 'CANFD3'}
     for i, m in enumerate(mappings):
+        if (isinstance(m, dict) and m.get('source_network') in valid_networks
+                and m.get('target_network') in valid_networks
+                and all(isinstance(m.get(key), str) for key in required_keys)):
+            validated_mappings.append(m)
+            continue
         current_mapping_valid = True
         if not isinstance(m, dict):
             print(f"Error: Entry {i} in gateway map {map_path} is not a dictionary.")
@@ -648,6 +873,10 @@ def load_gateway_map(map_path: str) -> Optional[List[Dict[str, Any]]]:
             validated_mappings.append(m)
         else:
             valid_overall = False
+    # Redes, mensagens e sinais se repetem entre os mapeamentos: internados, passam a compartilhar a mesma string
+    for m in validated_mappings:
+        for key in required_keys:
+            m[key] = sys.intern(m[key])
     if not valid_overall:
          print(f"Warning: Some entries in gateway map {map_path} were invalid. Check logs.")
     if not validated_mappings and not valid_overall :
@@ -658,7 +887,7 @@ def group_equivalent_schedules(
 ) -> Tuple[Dict[str, List[Dict[str, Union[str, int]]]], Dict[str, str], Dict[str, List[str]]]:
     if not schedules:
         return {}, {}, {}
-    hash_to_representative_name: Dict[str, str] = {}
+    key_to_representative_name: Dict[tuple, str] = {}
     representative_to_all_grouped_names_map: Dict[str, List[str]] = defaultdict(list)
     original_name_to_representative_name_map: Dict[str, str] = {}
     sorted_original_schedule_names = sorted(schedules.keys())
@@ -669,11 +898,8 @@ def group_equivalent_schedules(
             representative_to_all_grouped_names_map[original_name] = [original_name]
             continue
         try:
-            serialized_content = json.dumps(entries, sort_keys=True)
-            content_hash = md5(serialized_content.encode('utf-8')).hexdigest()
-            if content_hash not in hash_to_representative_name:
-                hash_to_representative_name[content_hash] = original_name
-            representative_name = hash_to_representative_name[content_hash]
+            content_key = tuple(tuple(sorted(entry.items())) for entry in entries)
+            representative_name = key_to_representative_name.setdefault(content_key, original_name)
             original_name_to_representative_name_map[original_name] = representative_name
             representative_to_all_grouped_names_map[representative_name].append(original_name)
         except (TypeError, Exception) as e:
@@ -686,6 +912,26 @@ def group_equivalent_schedules(
         unique_schedules[rep_name] = schedules[rep_name]
         representative_to_all_grouped_names_map[rep_name] = sorted(list(set(representative_to_all_grouped_names_map[rep_name])))
     return unique_schedules, original_name_to_representative_name_map, representative_to_all_grouped_names_map
+# Os índices derivados são memorizados por id() do dicionário de origem; cada entrada mantém uma referência ao
+# dicionário (o id não é reaproveitado enquanto ela existir) e o cache guarda no máximo INDEX_CACHE_MAX_ENTRIES
+# entradas, descartando a mais antiga, para não crescer sem limite num processo de longa duração
+INDEX_CACHE_MAX_ENTRIES = 16
+def _remember_index(cache: Dict[int, Tuple[Any, Any]], source: Any, index: Any) -> None:
+    if len(cache) >= INDEX_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[id(source)] = (source, index)
+_DBC_SIGNAL_INDEX: Dict[int, Tuple[Dict[int, DBCMessage], Dict[str, int]]] = {}
+def _dbc_signal_to_msg_id(dbc_messages: Dict[int, DBCMessage]) -> Dict[str, int]:
+    """Índice sinal -> ID de mensagem de um DBC, montado uma única vez por dicionário."""
+    cached = _DBC_SIGNAL_INDEX.get(id(dbc_messages))
+    if cached is not None and cached[0] is dbc_messages:
+        return cached[1]
+    index: Dict[str, int] = {}
+    for msg in dbc_messages.values():
+        for sig in msg.signals:
+            index.setdefault(sig.name, msg.id)
+    _remember_index(_DBC_SIGNAL_INDEX, dbc_messages, index)
+    return index
 def find_frame_id_for_signal(
     signal_name: str,
     network_type: str,
@@ -695,15 +941,14 @@ def find_frame_id_for_signal(
     context: Optional[dict] = None
 ) -> Optional[int]:
     if network_type == 'LIN':
-        for frame in ldf_data.frames.values():
-            if any(s.name == signal_name for s in frame.signals):
-                return frame.id
+        if signal_name in ldf_data.signal_to_frame_id:
+            return ldf_data.signal_to_frame_id[signal_name]
     elif network_type.upper().startswith('CAN'):
         dbc_for_channel = can_dbcs.get(network_type)
         if dbc_for_channel:
-            for msg in dbc_for_channel.values():
-                if any(s.name == signal_name for s in msg.signals):
-                    return msg.id
+            dbc_signal_to_msg_id = _dbc_signal_to_msg_id(dbc_for_channel)
+            if signal_name in dbc_signal_to_msg_id:
+                return dbc_signal_to_msg_id[signal_name]
         else:
             if warnings is not None:
                 warnings.append({
@@ -723,28 +968,42 @@ def find_frame_id_for_signal(
         })
     return None
 def update_frame_timing_stats(entry: LogEntry, frame_def: Optional[Union[LDFFrame, DBCMessage]], log_stats: Dict[str, Any]):
-    if not frame_def or entry.type.lower() != 'rx':
+    if not frame_def or entry.type_lower != 'rx':
         return
-    channel = entry.channel
-    frame_id = entry.frame_id_int
-    ts = entry.timestamp
-    is_active = log_stats.get('network_cycle_state', {}).get('active', False)
-    if not is_active:
+    if not log_stats.get('network_cycle_state', {}).get('active', False):
         return
-    frame_stats = log_stats['frame_timing_stats'][channel][frame_id]
+    frame_stats = log_stats['frame_timing_stats'][entry.channel][entry.frame_id_int]
     if frame_stats['frame_name'] is None:
         frame_stats['frame_name'] = frame_def.name
-    frame_stats['count'] += 1
-    if frame_stats['last_ts'] is not None and frame_stats['last_was_active'] and is_active:
-        delta = ts - frame_stats['last_ts']
-        max_reasonable_interval = 1.0
-        if 0 <= delta <= max_reasonable_interval:
-            frame_stats['min_delta'] = min(frame_stats['min_delta'], delta)
-            frame_stats['max_delta'] = max(frame_stats['max_delta'], delta)
-            frame_stats['sum_delta'] += delta
-            frame_stats['delta_count'] += 1
-    frame_stats['last_ts'] = ts
-    frame_stats['last_was_active'] = is_active
+    frame_stats['timestamps'].append(entry.timestamp)
+def _finalize_frame_timing_stats(frame_stats: Dict[str, Any]) -> None:
+    """Consolida os timestamps acumulados de um frame em contagem e min/max/soma dos intervalos."""
+    timestamps = frame_stats.pop('timestamps', None)
+    if not timestamps:
+        return
+    max_reasonable_interval = 1.0
+    deltas = [delta for delta in map(float.__sub__, timestamps[1:], timestamps) if 0 <= delta <= max_reasonable_interval]
+    frame_stats['count'] += len(timestamps)
+    if deltas:
+        frame_stats['min_delta'] = min(frame_stats['min_delta'], min(deltas))
+        frame_stats['max_delta'] = max(frame_stats['max_delta'], max(deltas))
+        frame_stats['sum_delta'] += sum(deltas)
+        frame_stats['delta_count'] += len(deltas)
+    frame_stats['last_ts'] = timestamps[-1]
+    frame_stats['last_was_active'] = True
+_SCHEDULE_START_INDEX: Dict[int, Tuple[Dict[str, List[Dict[str, Union[str, int]]]], Dict[str, List[str]]]] = {}
+def _schedules_by_first_frame(schedules: Dict[str, List[Dict[str, Union[str, int]]]]) -> Dict[str, List[str]]:
+    """Índice frame inicial -> nomes (ordenados) dos schedules que começam por ele, montado uma vez por dicionário."""
+    cached = _SCHEDULE_START_INDEX.get(id(schedules))
+    if cached is not None and cached[0] is schedules:
+        return cached[1]
+    index: Dict[str, List[str]] = defaultdict(list)
+    for sched_name, schedule in schedules.items():
+        if schedule:
+            index[schedule[0]['frame_name']].append(sched_name)
+    index = {frame_name: sorted(names) for frame_name, names in index.items()}
+    _remember_index(_SCHEDULE_START_INDEX, schedules, index)
+    return index
 def validate_schedule_order_and_presence(
     entry: LogEntry, ldf_data: LDFData, ldf_id_to_frame_map: Dict[int, LDFFrame],
     log_stats: Dict[str, Any], tolerance_factor: float, min_absolute_tolerance_s: float
@@ -782,6 +1041,9 @@ def validate_schedule_order_and_presence(
     slot_timing_stats = log_stats['schedule_slot_timing']
     reliability_stats = log_stats['slave_reliability']
     master_node_name = ldf_data.nodes.get('master')
+    schedules_map = ldf_data.schedules
+    frames_map = ldf_data.frames
+    mismatches_map = log_stats['schedule_timing_mismatches']
 
     def _reset_state():
         state.update({
@@ -807,7 +1069,7 @@ def validate_schedule_order_and_presence(
     def check_and_finalize_if_complete():
         if len(state['active_schedules']) == 1:
             sched_name = state['active_schedules'][0]
-            if state['current_index'] >= len(ldf_data.schedules[sched_name]):
+            if state['current_index'] >= len(schedules_map[sched_name]):
                 _log_cycle_event('Cycle Completed', {})
                 _finalize_cycle("Completed")
                 return True
@@ -815,10 +1077,10 @@ def validate_schedule_order_and_presence(
 
     while True:
         if not state.get('active_schedules'):
-            candidate_schedules = [n for n, s in ldf_data.schedules.items() if s and s[0]['frame_name'] == current_frame_name]
+            candidate_schedules = _schedules_by_first_frame(schedules_map).get(current_frame_name)
             if candidate_schedules:
                 state.update({
-                    'active_schedules': sorted(candidate_schedules), 'current_index': 1,
+                    'active_schedules': list(candidate_schedules), 'current_index': 1,
                     'last_event_timestamp': current_ts, 'cycle_start_timestamp': current_ts,
                     'id': state['cycle_id']
                 })
@@ -831,7 +1093,7 @@ def validate_schedule_order_and_presence(
         current_idx = state['current_index']
         expected_frames_info = {}
         for sched_name in state['active_schedules']:
-            schedule = ldf_data.schedules[sched_name]
+            schedule = schedules_map[sched_name]
             if current_idx < len(schedule):
                 frame_name = schedule[current_idx]['frame_name']
                 if frame_name not in expected_frames_info:
@@ -843,43 +1105,47 @@ def validate_schedule_order_and_presence(
              continue
 
         for frame_name, sched_names in expected_frames_info.items():
-            frame_def = ldf_data.frames.get(frame_name)
+            frame_def = frames_map.get(frame_name)
             if frame_def and frame_def.publisher and frame_def.publisher != master_node_name:
                 reliability_stats[frame_def.publisher][frame_name]['requests'] += 1
 
         if current_frame_name in expected_frames_info:
             potential_matches = expected_frames_info[current_frame_name]
-            frame_def = ldf_data.frames.get(current_frame_name)
+            frame_def = frames_map.get(current_frame_name)
             if frame_def and frame_def.publisher and frame_def.publisher != master_node_name:
                 reliability_stats[frame_def.publisher][current_frame_name]['responses'] += 1
             
             jitter_s = ldf_data.nodes.get('master_jitter_s', 0.0)
+            observed_delay_s = current_ts - state['last_event_timestamp']
+            observed_delay_ms = observed_delay_s * 1000
             for sched_name in potential_matches:
-                expected_delay_ms = ldf_data.schedules[sched_name][current_idx]['delay_ms']
-                observed_delay_s = current_ts - state['last_event_timestamp']
-                observed_delay_ms = observed_delay_s * 1000
+                expected_delay_ms = schedules_map[sched_name][current_idx]['delay_ms']
                 
                 slot_key = (sched_name, current_idx)
                 stats = slot_timing_stats[slot_key]
-                stats['sum_ms'] += observed_delay_ms
-                stats['sum_sq_ms'] += observed_delay_ms ** 2
-                stats['count'] += 1
-                stats['min_ms'] = min(stats['min_ms'], observed_delay_ms)
-                stats['max_ms'] = max(stats['max_ms'], observed_delay_ms)
+                stats.count += 1
+                delta_ms = observed_delay_ms - stats.mean_ms
+                stats.mean_ms += delta_ms / stats.count
+                stats.m2_ms += delta_ms * (observed_delay_ms - stats.mean_ms)
+                if observed_delay_ms < stats.min_ms:
+                    stats.min_ms = observed_delay_ms
+                if observed_delay_ms > stats.max_ms:
+                    stats.max_ms = observed_delay_ms
                 
                 tolerance_abs = max((expected_delay_ms / 1000.0) * tolerance_factor, min_absolute_tolerance_s) + jitter_s
                 if not (abs(observed_delay_s - (expected_delay_ms / 1000.0)) <= tolerance_abs):
                     state['has_timing_errors'] = True
-                    mismatch_key = (sched_name, current_idx)
-                    mismatch_stats = log_stats['schedule_timing_mismatches'][mismatch_key]    
+                    mismatch_stats = mismatches_map[slot_key]
                     mismatch_stats['count'] += 1
                     mismatch_stats['sum_observed_ms'] += observed_delay_ms
-                    mismatch_stats['min_observed_ms'] = min(mismatch_stats['min_observed_ms'], observed_delay_ms)
-                    mismatch_stats['max_observed_ms'] = max(mismatch_stats['max_observed_ms'], observed_delay_ms)
+                    if observed_delay_ms < mismatch_stats['min_observed_ms']:
+                        mismatch_stats['min_observed_ms'] = observed_delay_ms
+                    if observed_delay_ms > mismatch_stats['max_observed_ms']:
+                        mismatch_stats['max_observed_ms'] = observed_delay_ms
                     if mismatch_stats['first_ts'] is None:
                         mismatch_stats['first_ts'] = current_ts
                         mismatch_stats['expected_ms'] = expected_delay_ms
-                        frame_def = ldf_data.frames.get(current_frame_name)
+                        frame_def = frames_map.get(current_frame_name)
                         mismatch_stats['frame_name'] = current_frame_name
                         mismatch_stats['publisher'] = frame_def.publisher if frame_def else 'N/A'
                     mismatch_stats['last_ts'] = current_ts
@@ -894,16 +1160,24 @@ def validate_schedule_order_and_presence(
             _finalize_cycle("Aborted")
             continue
     return
+# escape() memoizado para nomes de nós/frames/schedules que se repetem em muitas linhas das tabelas
+escape_name = lru_cache(maxsize=4096)(escape)
+STATUS_CSS_CLASSES = {'OK': 'status-ok', 'KO': 'status-ko', 'WARN': 'status-warn', 'NA': 'status-na', 'INFO': 'status-info'}
+# Fragmentos prontos para os status sem texto próprio (o caso de quase todas as células de status)
+STATUS_TAGS = {status: f'<span class="{css_class}">{status}</span>' for status, css_class in STATUS_CSS_CLASSES.items()}
 def tag(status, text=None):
+    if text is None:
+        status_tag = STATUS_TAGS.get(status)
+        if status_tag is not None:
+            return status_tag
     s_upper = str(status).upper()
     txt = text if text is not None else s_upper
-    css_class = {'OK':'status-ok','KO':'status-ko','WARN':'status-warn','NA':'status-na','INFO':'status-info'}.get(s_upper, 'status-info')
+    css_class = STATUS_CSS_CLASSES.get(s_upper, 'status-info')
     return f'<span class="{css_class}">{escape(str(txt))}</span>'
 def _log_event(log_stats, sched_name, status, reason, current_ts, details=None):
     if details is None:
         details = {}
-    summary_log = log_stats.setdefault('schedule_summary', defaultdict(lambda: defaultdict(lambda: {'count': 0, 'first_ts_event': None, 'last_ts_event': None, 'example_details': None})))
-    record = summary_log[sched_name][(status, reason)]
+    record = log_stats['schedule_summary'][sched_name][(status, reason)]
     record['count'] += 1
     if record['first_ts_event'] is None:
         record['first_ts_event'] = current_ts
@@ -920,11 +1194,7 @@ def detect_inactivity(
     if last_activity_timestamp is not None:
         duration = current_timestamp - last_activity_timestamp
         if duration > LIN_INACTIVITY_THRESHOLD_S:
-            log_stats.setdefault('error_summary', {})
-            summary = log_stats['error_summary'].setdefault('inactivity', {
-                'periods': 0, 'total_duration': 0.0, 'max_duration': 0.0,
-                'first_start': None, 'last_end': None
-            })
+            summary = log_stats['error_summary']['inactivity']
             summary['periods'] += 1
             summary['total_duration'] += duration
             summary['max_duration'] = max(summary['max_duration'], duration)
@@ -954,7 +1224,14 @@ def _get_comparison_details(
         'encoding_type': getattr(signal_info, 'encoding_type', 'physical'),
         'unit': getattr(signal_info, 'unit', '')
     }
+    details['sign_terms'] = _sign_extension_terms(details)
     return details
+def _sign_extension_terms(details: Dict[str, Any]) -> Tuple[int, int]:
+    """Retorna (máscara do bit de sinal, 2**length) para sinais com sinal, ou (0, 0) caso contrário."""
+    length = details['length']
+    if details['is_signed'] and isinstance(length, int) and length > 0:
+        return 1 << (length - 1), 1 << length
+    return 0, 0
 def compare_gateway_values(
     source_val_raw: int,
     target_val_raw: int,
@@ -972,20 +1249,10 @@ def compare_gateway_values(
         match = (source_val_raw == target_val_raw)
     elif not src_has_logic and not tgt_has_logic:
         comparison_type = "physical"
-        processed_src_raw = source_val_raw
-        if source_details['is_signed'] and isinstance(source_details['length'], int) and source_details['length'] > 0:
-            len_bits = source_details['length']
-            sign_bit_mask = 1 << (len_bits - 1)
-            if (processed_src_raw & sign_bit_mask):
-                processed_src_raw -= (1 << len_bits)
-        src_val_phys = (processed_src_raw * source_details['factor']) + source_details['offset']
-        processed_tgt_raw = target_val_raw
-        if target_details['is_signed'] and isinstance(target_details['length'], int) and target_details['length'] > 0:
-            len_bits = target_details['length']
-            sign_bit_mask = 1 << (len_bits - 1)
-            if (processed_tgt_raw & sign_bit_mask):
-                processed_tgt_raw -= (1 << len_bits)
-        tgt_val_phys = (processed_tgt_raw * target_details['factor']) + target_details['offset']
+        src_sign_bit, src_sign_span = source_details.get('sign_terms') or _sign_extension_terms(source_details)
+        tgt_sign_bit, tgt_sign_span = target_details.get('sign_terms') or _sign_extension_terms(target_details)
+        src_val_phys = ((source_val_raw - (src_sign_span if source_val_raw & src_sign_bit else 0)) * source_details['factor']) + source_details['offset']
+        tgt_val_phys = ((target_val_raw - (tgt_sign_span if target_val_raw & tgt_sign_bit else 0)) * target_details['factor']) + target_details['offset']
         match = abs(src_val_phys - tgt_val_phys) < PHYSICAL_COMPARISON_EPSILON
     else:
         comparison_type = "hybrid_mismatch"
@@ -994,6 +1261,13 @@ def compare_gateway_values(
 def finalize_network_cycle_stats(log_stats: Dict[str, Any]) -> None:
     state = log_stats.get('network_cycle_state')
     summary = log_stats.get('network_cycle_summary')
+    delay_samples = log_stats.pop('master_response_delay_samples', None)
+    if summary and delay_samples:
+        delay_stats = summary['master_response_delays_ms_stats']
+        delay_stats['min'] = min(delay_stats['min'], min(delay_samples))
+        delay_stats['max'] = max(delay_stats['max'], max(delay_samples))
+        delay_stats['sum'] += sum(delay_samples)
+        delay_stats['count'] += len(delay_samples)
     if state and summary and state['active']:
         cycle_details = state['current_cycle_details']
         summary['cycles_incomplete'] += 1
@@ -1013,7 +1287,7 @@ def finalize_network_cycle_stats(log_stats: Dict[str, Any]) -> None:
         state['first_master_time'] = None
         state['first_master_found'] = False
         state['slaves_responded_in_cycle'] = set()
-        state['current_cycle_details'] = {}
+        state['current_cycle_details'] = {'problem_flags': set()}
         state['just_slept'] = False
         state['current_cycle_end_line'] = None
 def _write_physical_metrics_table(write_html, log_stats):
@@ -1042,6 +1316,53 @@ def _write_physical_metrics_table(write_html, log_stats):
     write_html(_generate_metric_row("Header Sync Duration (HSO)", 'hso_values_s', "µs", 1_000_000, 1))
     write_html(_generate_metric_row("Response Sync Duration (RSO)", 'rso_values_s', "µs", 1_000_000, 1))
     write_html("</tbody></table></details>")
+def _parse_optional_float(text: Optional[str]) -> Optional[float]:
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+def build_physical_limits(config: Dict[str, Any], ldf_data: LDFData) -> PhysicalLimits:
+    """Deriva da configuração e do LDF todos os limites usados por validate_physical_layer."""
+    nominal_baudrate = config.get('lin_baudrate', DEFAULT_LIN_BAUDRATE)
+    baudrate_tol_perc = config.get('physical_baudrate_tolerance_perc', DEFAULT_PHYSICAL_BAUDRATE_TOLERANCE_PERC)
+    break_min_bits = config.get('physical_break_min_bits', DEFAULT_PHYSICAL_BREAK_MIN_BITS)
+    break_max_bits = config.get('physical_break_max_bits', DEFAULT_PHYSICAL_BREAK_MAX_BITS)
+    break_abs_tol_us = config.get('physical_break_abs_tolerance_us', DEFAULT_PHYSICAL_BREAK_ABS_TOLERANCE_US)
+    timing_rel_tol_factor = config.get('physical_timing_relative_tolerance_factor', DEFAULT_PHYSICAL_TIMING_RELATIVE_TOLERANCE_FACTOR)
+    min_abs_tol_s = config.get('physical_min_absolute_tolerance_s', DEFAULT_PHYSICAL_MIN_ABSOLUTE_TOLERANCE_S)
+    ifs_min_bits = config.get('physical_ifs_min_bits', DEFAULT_PHYSICAL_IFS_MIN_BITS)
+    master_jitter_s = ldf_data.nodes.get('master_jitter_s', 0.0)
+    jitter_effective_s = max(master_jitter_s, min_abs_tol_s)
+    bit_duration_s = (1.0 / nominal_baudrate) if nominal_baudrate > 0 else 0.0
+    bit_duration_us = bit_duration_s * 1e6
+    nominal_min_break_us = break_min_bits * bit_duration_us
+    nominal_max_break_us = break_max_bits * bit_duration_us
+    expected_byte_duration_s = 10 * bit_duration_s
+    frame_duration_by_dlc_s = []
+    for dlc in range(LIN_MAX_DLC + 1):
+        expected_frame_duration_s = (43 + (dlc * 10)) * bit_duration_s
+        frame_duration_by_dlc_s.append((expected_frame_duration_s, max(expected_frame_duration_s * timing_rel_tol_factor, jitter_effective_s)))
+    return PhysicalLimits(
+        nominal_baudrate=nominal_baudrate,
+        baudrate_tol_bps=nominal_baudrate * baudrate_tol_perc / 100.0,
+        bit_duration_s=bit_duration_s,
+        bit_duration_us=bit_duration_us,
+        break_min_bits=break_min_bits,
+        break_max_bits=break_max_bits,
+        break_abs_tol_us=break_abs_tol_us,
+        nominal_min_break_us=nominal_min_break_us,
+        nominal_max_break_us=nominal_max_break_us,
+        break_lower_limit_us=nominal_min_break_us - break_abs_tol_us,
+        break_upper_limit_us=nominal_max_break_us + break_abs_tol_us,
+        timing_rel_tol_factor=timing_rel_tol_factor,
+        jitter_effective_s=jitter_effective_s,
+        expected_byte_duration_s=expected_byte_duration_s,
+        byte_tolerance_s=max(expected_byte_duration_s * timing_rel_tol_factor, jitter_effective_s),
+        min_ifs_s=ifs_min_bits * bit_duration_s,
+        frame_duration_by_dlc_s=tuple(frame_duration_by_dlc_s)
+    )
 def validate_physical_layer(
     entry: LogEntry,
     match_dict: Dict[str, str],
@@ -1074,166 +1395,113 @@ def validate_physical_layer(
     """
     if entry.channel != 'LIN' or not match_dict:
         return
-    nominal_baudrate = config.get('lin_baudrate', DEFAULT_LIN_BAUDRATE)
-    baudrate_tol_perc = config.get('physical_baudrate_tolerance_perc', DEFAULT_PHYSICAL_BAUDRATE_TOLERANCE_PERC)
-    break_min_bits = config.get('physical_break_min_bits', DEFAULT_PHYSICAL_BREAK_MIN_BITS)
-    break_max_bits = config.get('physical_break_max_bits', DEFAULT_PHYSICAL_BREAK_MAX_BITS)
-    break_abs_tol_us = config.get('physical_break_abs_tolerance_us', DEFAULT_PHYSICAL_BREAK_ABS_TOLERANCE_US)
-    timing_rel_tol_factor = config.get('physical_timing_relative_tolerance_factor', DEFAULT_PHYSICAL_TIMING_RELATIVE_TOLERANCE_FACTOR)
-    min_abs_tol_s = config.get('physical_min_absolute_tolerance_s', DEFAULT_PHYSICAL_MIN_ABSOLUTE_TOLERANCE_S)
-    ifs_min_bits = config.get('physical_ifs_min_bits', DEFAULT_PHYSICAL_IFS_MIN_BITS)
+    limits = log_stats.get('physical_limits')
+    if limits is None:
+        limits = log_stats['physical_limits'] = build_physical_limits(config, ldf_data)
+    nominal_baudrate = limits.nominal_baudrate
+    baudrate_tol_bps = limits.baudrate_tol_bps
+    bit_duration_s = limits.bit_duration_s
     
-    physical_errors = log_stats['physical_errors']
-    physical_metrics = log_stats['physical_metrics']
-    
-    master_jitter_s = ldf_data.nodes.get('master_jitter_s', 0.0)
-    jitter_effective_s = max(master_jitter_s, min_abs_tol_s)
-    bit_duration_s = (1.0 / nominal_baudrate) if nominal_baudrate > 0 else 0.0
-    bit_duration_us = bit_duration_s * 1e6
-    baudrate_tol_bps = nominal_baudrate * baudrate_tol_perc / 100.0
+    physical_error_events = log_stats['physical_error_events']
+    metric_samples = log_stats['physical_metric_samples']
     frame_id_key = entry.frame_id_int
-    
-    def log_physical_error(error_type, value_key, details):
-        summary = physical_errors[error_type][(frame_id_key, value_key)]
-        summary['count'] += 1
-        if summary['first_ts'] is None:
-            summary['first_ts'] = entry.timestamp
-            summary['example_details'] = details
-        summary['last_ts'] = entry.timestamp
+    timestamp = entry.timestamp
 
-    for br_key in ['br', 'rbr', 'hbr']:
-        if match_dict.get(br_key):
-            try:
-                actual_br = float(match_dict[br_key])
-                physical_metrics['baudrate_values']['min'] = min(physical_metrics['baudrate_values']['min'], actual_br)
-                physical_metrics['baudrate_values']['max'] = max(physical_metrics['baudrate_values']['max'], actual_br)
-                physical_metrics['baudrate_values']['sum'] += actual_br
-                physical_metrics['baudrate_values']['count'] += 1
-                if abs(actual_br - nominal_baudrate) > baudrate_tol_bps:
-                    log_physical_error('baudrate_deviation', actual_br, {'value': actual_br, 'type': br_key.upper()})
-            except ValueError:
-                pass
+    baudrate_samples = metric_samples['baudrate_values']
+    for br_key in ('br', 'rbr', 'hbr'):
+        br_text = match_dict.get(br_key)
+        if br_text:
+            actual_br = float(br_text)
+            baudrate_samples.append(actual_br)
+            if abs(actual_br - nominal_baudrate) > baudrate_tol_bps:
+                physical_error_events['baudrate_deviation'].append((frame_id_key, actual_br, timestamp, {'value': actual_br, 'type': br_key.upper()}))
 
-    if match_dict.get('break_info') and bit_duration_us > 0:
-        try:
-            break_delimiter_values_ns = [float(v) for v in match_dict['break_info'].split()]
-            if len(break_delimiter_values_ns) >= 1:
-                break_val_ns = break_delimiter_values_ns[0]
-                break_val_us = break_val_ns / 1000.0
-                nominal_min_break_us = break_min_bits * bit_duration_us
-                nominal_max_break_us = break_max_bits * bit_duration_us
+    if match_dict.get('break_info') and limits.bit_duration_us > 0:
+        break_delimiter_values_ns = [float(v) for v in match_dict['break_info'].split()]
+        if len(break_delimiter_values_ns) >= 1:
+            break_val_ns = break_delimiter_values_ns[0]
+            break_val_us = break_val_ns / 1000.0
+            if not (limits.break_lower_limit_us <= break_val_us <= limits.break_upper_limit_us):
                 details = {
                     'raw_value_ns': break_val_ns, 'measured_us': break_val_us,
-                    'expected_min_us': nominal_min_break_us, 'expected_max_us': nominal_max_break_us,
-                    'tolerance_us': break_abs_tol_us, 'bits_min': break_min_bits, 'bits_max': break_max_bits
+                    'expected_min_us': limits.nominal_min_break_us, 'expected_max_us': limits.nominal_max_break_us,
+                    'tolerance_us': limits.break_abs_tol_us, 'bits_min': limits.break_min_bits, 'bits_max': limits.break_max_bits
                 }
-                if break_val_us < nominal_min_break_us - break_abs_tol_us:
-                    log_physical_error('break_field_error_too_short', break_val_us, details)
-                elif break_val_us > nominal_max_break_us + break_abs_tol_us:
-                    log_physical_error('break_field_error_too_long', break_val_us, details)
-            if len(break_delimiter_values_ns) >= 2:
-                delimiter_val_ns = break_delimiter_values_ns[1]
-                delimiter_val_us = delimiter_val_ns / 1000.0
-                expected_delimiter_us = 1 * bit_duration_us
-                delimiter_tolerance_us = break_abs_tol_us
-                if abs(delimiter_val_us - expected_delimiter_us) > delimiter_tolerance_us:
-                    details = {
-                        'raw_value_ns': delimiter_val_ns, 'measured_us': delimiter_val_us,
-                        'expected_us': expected_delimiter_us, 'tolerance_us': delimiter_tolerance_us,
-                        'reason': 'Too long' if delimiter_val_us > expected_delimiter_us else 'Too short', 'bits_expected': 1
-                    }
-                    log_physical_error('delimiter_duration_error', delimiter_val_us, details)
-        except (ValueError, IndexError):
-            pass
-
-    if match_dict.get('sof') and match_dict.get('eof'):
-        try:
-            sof = float(match_dict['sof'])
-            eof = float(match_dict['eof'])
-            frame_duration_s = eof - sof
-            physical_metrics['frame_duration_values']['min'] = min(physical_metrics['frame_duration_values']['min'], frame_duration_s)
-            physical_metrics['frame_duration_values']['max'] = max(physical_metrics['frame_duration_values']['max'], frame_duration_s)
-            physical_metrics['frame_duration_values']['sum'] += frame_duration_s
-            physical_metrics['frame_duration_values']['count'] += 1
-            dlc = len(entry.data) if entry.data is not None else 0
-            expected_frame_bits = 43 + (dlc * 10)
-            expected_frame_duration_s = expected_frame_bits * bit_duration_s
-            frame_tolerance_s = max(expected_frame_duration_s * timing_rel_tol_factor, jitter_effective_s)
-            if abs(frame_duration_s - expected_frame_duration_s) > frame_tolerance_s:
+                if break_val_us < limits.break_lower_limit_us:
+                    physical_error_events['break_field_error_too_short'].append((frame_id_key, break_val_us, timestamp, details))
+                else:
+                    physical_error_events['break_field_error_too_long'].append((frame_id_key, break_val_us, timestamp, details))
+        if len(break_delimiter_values_ns) >= 2:
+            delimiter_val_ns = break_delimiter_values_ns[1]
+            delimiter_val_us = delimiter_val_ns / 1000.0
+            expected_delimiter_us = limits.bit_duration_us
+            delimiter_tolerance_us = limits.break_abs_tol_us
+            if abs(delimiter_val_us - expected_delimiter_us) > delimiter_tolerance_us:
                 details = {
-                    'measured_s': frame_duration_s, 'expected_s': expected_frame_duration_s,
-                    'tolerance_s': frame_tolerance_s,
-                    'reason': 'Too long' if frame_duration_s > expected_frame_duration_s else 'Too short', 'dlc': dlc
+                    'raw_value_ns': delimiter_val_ns, 'measured_us': delimiter_val_us,
+                    'expected_us': expected_delimiter_us, 'tolerance_us': delimiter_tolerance_us,
+                    'reason': 'Too long' if delimiter_val_us > expected_delimiter_us else 'Too short', 'bits_expected': 1
                 }
-                log_physical_error('frame_duration_error', frame_duration_s, details)
-        except ValueError:
-            pass
+                physical_error_events['delimiter_duration_error'].append((frame_id_key, delimiter_val_us, timestamp, details))
 
-    if match_dict.get('sof') and match_dict.get('eoh'):
-        try:
-            sof = float(match_dict['sof'])
-            eoh = float(match_dict['eoh'])
-            header_duration_s = eoh - sof
-            if 0 < header_duration_s < 0.1:
-                metrics = physical_metrics['header_duration_values']
-                metrics['min'] = min(metrics['min'], header_duration_s)
-                metrics['max'] = max(metrics['max'], header_duration_s)
-                metrics['sum'] += header_duration_s
-                metrics['count'] += 1
-        except (ValueError, TypeError):
-            pass
+    sof = _parse_optional_float(match_dict.get('sof'))
+    eof = _parse_optional_float(match_dict.get('eof'))
+    if sof is not None and eof is not None:
+        frame_duration_s = eof - sof
+        metric_samples['frame_duration_values'].append(frame_duration_s)
+        dlc = len(entry.data) if entry.data is not None else 0
+        if dlc <= LIN_MAX_DLC:
+            expected_frame_duration_s, frame_tolerance_s = limits.frame_duration_by_dlc_s[dlc]
+        else:
+            expected_frame_duration_s = (43 + (dlc * 10)) * bit_duration_s
+            frame_tolerance_s = max(expected_frame_duration_s * limits.timing_rel_tol_factor, limits.jitter_effective_s)
+        if abs(frame_duration_s - expected_frame_duration_s) > frame_tolerance_s:
+            details = {
+                'measured_s': frame_duration_s, 'expected_s': expected_frame_duration_s,
+                'tolerance_s': frame_tolerance_s,
+                'reason': 'Too long' if frame_duration_s > expected_frame_duration_s else 'Too short', 'dlc': dlc
+            }
+            physical_error_events['frame_duration_error'].append((frame_id_key, frame_duration_s, timestamp, details))
+
+    eoh = _parse_optional_float(match_dict.get('eoh'))
+    if sof is not None and eoh is not None:
+        header_duration_s = eoh - sof
+        if 0 < header_duration_s < 0.1:
+            metric_samples['header_duration_values'].append(header_duration_s)
 
     if match_dict.get('eob'):
-        try:
-            eob_times = [float(t) for t in match_dict['eob'].split() if t.strip()]
-            if len(eob_times) > 1:
-                expected_byte_duration_s = 10 * bit_duration_s
-                byte_tolerance_s = max(expected_byte_duration_s * timing_rel_tol_factor, jitter_effective_s)
-                byte_intervals = [eob_times[i+1] - eob_times[i] for i in range(len(eob_times)-1)]
-                for interval in byte_intervals:
-                    if abs(interval - expected_byte_duration_s) > byte_tolerance_s:
-                        details = {
-                            'measured_interval_s': interval, 'expected_interval_s': expected_byte_duration_s,
-                            'tolerance_s': byte_tolerance_s,
-                            'reason': 'Too long' if interval > expected_byte_duration_s else 'Too short'
-                        }
-                        log_physical_error('byte_timing_error', interval, details)
-        except ValueError:
-            pass
+        eob_times = list(map(float, match_dict['eob'].split()))
+        if len(eob_times) > 1:
+            expected_byte_duration_s = limits.expected_byte_duration_s
+            byte_tolerance_s = limits.byte_tolerance_s
+            previous_eob = eob_times[0]
+            for current_eob in eob_times[1:]:
+                interval = current_eob - previous_eob
+                previous_eob = current_eob
+                if abs(interval - expected_byte_duration_s) > byte_tolerance_s:
+                    details = {
+                        'measured_interval_s': interval, 'expected_interval_s': expected_byte_duration_s,
+                        'tolerance_s': byte_tolerance_s,
+                        'reason': 'Too long' if interval > expected_byte_duration_s else 'Too short'
+                    }
+                    physical_error_events['byte_timing_error'].append((frame_id_key, interval, timestamp, details))
             
-    last_frame_info = log_stats.setdefault('last_frame_info', {'last_eof': None})
-    if match_dict.get('sof') and last_frame_info['last_eof'] is not None:
-        try:
-            sof = float(match_dict['sof'])
-            last_eof = last_frame_info['last_eof']
-            ifs_s = sof - last_eof
-            min_ifs_s = ifs_min_bits * bit_duration_s
-            if ifs_s < min_ifs_s:
-                details = {'measured_s': ifs_s, 'expected_min_s': min_ifs_s}
-                log_physical_error('ifs_error_too_short', ifs_s, details)
-        except ValueError:
-            pass
-    if match_dict.get('eof'):
-        try:
-            last_frame_info['last_eof'] = float(match_dict['eof'])
-        except ValueError:
-            pass
+    last_frame_info = log_stats['last_frame_info']
+    last_eof = last_frame_info['last_eof']
+    if sof is not None and last_eof is not None:
+        ifs_s = sof - last_eof
+        if ifs_s < limits.min_ifs_s:
+            details = {'measured_s': ifs_s, 'expected_min_s': limits.min_ifs_s}
+            physical_error_events['ifs_error_too_short'].append((frame_id_key, ifs_s, timestamp, details))
+    if eof is not None:
+        last_frame_info['last_eof'] = eof
 
-    for sync_key_raw in ['hso', 'rso']:
-        sync_value_ns_str = match_dict.get(sync_key_raw)
-        if sync_value_ns_str:
-            try:
-                sync_value_ns = float(sync_value_ns_str)
-                sync_value_s = sync_value_ns / 1_000_000_000.0
-                metric_key_for_values = f'{sync_key_raw}_values_s'
-                physical_metrics.setdefault(metric_key_for_values, {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0})
-                current_metric_stats = physical_metrics[metric_key_for_values]
-                current_metric_stats['min'] = min(current_metric_stats['min'], sync_value_s)
-                current_metric_stats['max'] = max(current_metric_stats['max'], sync_value_s)
-                current_metric_stats['sum'] += sync_value_s
-                current_metric_stats['count'] += 1
-            except ValueError:
-                pass
+    hso_ns_str = match_dict.get('hso')
+    if hso_ns_str:
+        metric_samples['hso_values_s'].append(float(hso_ns_str) / 1_000_000_000.0)
+    rso_ns_str = match_dict.get('rso')
+    if rso_ns_str:
+        metric_samples['rso_values_s'].append(float(rso_ns_str) / 1_000_000_000.0)
 def _write_slave_reliability_section(write_html, log_stats):
     reliability_stats = log_stats.get('slave_reliability')
     if not reliability_stats:
@@ -1241,7 +1509,9 @@ def _write_slave_reliability_section(write_html, log_stats):
     write_html("<details close><summary>Reliability of Slave Responses to Master Headers</summary>")
     write_html("<table><thead><tr><th>Slave Node</th><th>Frame Name</th><th>Requests (Headers Sent)</th><th>Responses (Frames Rx)</th><th>Success Rate</th></tr></thead><tbody>")
     
+    rows = []
     for slave_node, frames in sorted(reliability_stats.items()):
+        slave_node_html = escape_name(slave_node)
         for frame_name, stats in sorted(frames.items()):
             requests = stats.get('requests', 0)
             responses = stats.get('responses', 0)
@@ -1249,19 +1519,19 @@ def _write_slave_reliability_section(write_html, log_stats):
                 continue
             
             rate = (responses / requests) * 100
-            rate_status = "OK"
-            if rate < 100: rate_status = "WARN"
-            if rate < 95: rate_status = "KO"
+            rate_status = RELIABILITY_RATE_STATUS[bisect_right(RELIABILITY_RATE_THRESHOLDS, rate)]
             
             rate_tag = tag(rate_status, f"{rate:.2f}%")
             
-            write_html(f"<tr>"
-                       f"<td><code>{escape(slave_node)}</code></td>"
-                       f"<td><code>{escape(frame_name)}</code></td>"
-                       f"<td>{requests}</td>"
-                       f"<td>{responses}</td>"
-                       f"<td>{rate_tag}</td>"
-                       f"</tr>")
+            rows.append(f"<tr>"
+                        f"<td><code>{slave_node_html}</code></td>"
+                        f"<td><code>{escape_name(frame_name)}</code></td>"
+                        f"<td>{requests}</td>"
+                        f"<td>{responses}</td>"
+                        f"<td>{rate_tag}</td>"
+                        f"</tr>")
+    if rows:
+        write_html("\n".join(rows))
     write_html("</tbody></table></details>")
 
 def _write_schedule_jitter_section(write_html, log_stats, ldf_data):
@@ -1276,90 +1546,93 @@ def _write_schedule_jitter_section(write_html, log_stats, ldf_data):
     for sched_name, slots in sorted(grouped_by_sched.items()):
         write_html(f"<details close><summary>Table: {escape(sched_name)}</summary>")
         write_html("<table><thead><tr><th>Slot Index</th><th>Frame Name</th><th>Expected Delay (ms)</th><th>Avg. Delay (ms)</th><th>Min (ms)</th><th>Max (ms)</th><th>Jitter (StdDev)</th></tr></thead><tbody>")
-        for slot_idx, stats in sorted(slots, key=lambda x: x[0]):
-            count = stats['count']
+        schedule_entries = ldf_data.schedules[sched_name]
+        rows = []
+        for slot_idx, stats in sorted(slots, key=itemgetter(0)):
+            count = stats.count
             if count == 0: continue
-            frame_name = ldf_data.schedules[sched_name][slot_idx]['frame_name']
-            expected_ms = ldf_data.schedules[sched_name][slot_idx]['delay_ms']
-            avg_ms = stats['sum_ms'] / count
-            min_ms = stats['min_ms']
-            max_ms = stats['max_ms']
-            var_ms = (stats['sum_sq_ms'] / count) - (avg_ms ** 2)
-            stddev_ms = math.sqrt(var_ms) if var_ms > 0 else 0.0
+            frame_name = schedule_entries[slot_idx]['frame_name']
+            expected_ms = schedule_entries[slot_idx]['delay_ms']
+            avg_ms = stats.mean_ms
+            min_ms = stats.min_ms
+            max_ms = stats.max_ms
+            stddev_ms = math.sqrt(stats.m2_ms / count)
             jitter_threshold_ms = expected_ms * 0.1 
-            status = "OK"
-            if stddev_ms > jitter_threshold_ms: status = "WARN"
-            if stddev_ms > jitter_threshold_ms * 2: status = "KO"
+            status = "KO" if stddev_ms > jitter_threshold_ms * 2 else ("WARN" if stddev_ms > jitter_threshold_ms else "OK")
             jitter_tag = tag(status, f"{stddev_ms:.3f}")
-            write_html(f"<tr>"
-                       f"<td>{slot_idx}</td>"
-                       f"<td><code>{escape(frame_name)}</code></td>"
-                       f"<td>{expected_ms:.3f}</td>"
-                       f"<td>{avg_ms:.3f}</td>"
-                       f"<td>{min_ms:.3f}</td>"
-                       f"<td>{max_ms:.3f}</td>"
-                       f"<td>{jitter_tag}</td>"
-                       f"</tr>")
+            rows.append(f"<tr>"
+                        f"<td>{slot_idx}</td>"
+                        f"<td><code>{escape_name(frame_name)}</code></td>"
+                        f"<td>{expected_ms:.3f}</td>"
+                        f"<td>{avg_ms:.3f}</td>"
+                        f"<td>{min_ms:.3f}</td>"
+                        f"<td>{max_ms:.3f}</td>"
+                        f"<td>{jitter_tag}</td>"
+                        f"</tr>")
+        if rows:
+            write_html("\n".join(rows))
         write_html("</tbody></table>")
         write_html("</details>")
     write_html("</details>")
-def _write_physical_errors(write_html, log_stats):
+def _render_physical_error_na(example_details, config_used):
+    return "N/A", "N/A"
+def _render_baudrate_error(example_details, config_used):
+    return (f"{example_details.get('value', 0):.2f} bps",
+            f"{config_used.get('lin_baudrate', 0):.0f} bps ± {config_used.get('physical_baudrate_tolerance_perc', 0):.1f}%")
+def _render_break_field_error(example_details, config_used):
+    measured_us = example_details.get('measured_us')
+    expected_min_us = example_details.get('expected_min_us')
+    expected_max_us = example_details.get('expected_max_us')
+    if measured_us is None or expected_min_us is None or expected_max_us is None:
+        return "N/A", "N/A"
+    return f"{measured_us:.3f} μs", f"{expected_min_us:.3f} - {expected_max_us:.3f} μs"
+def _render_ifs_error(example_details, config_used):
+    measured_s = example_details.get('measured_s')
+    expected_s = example_details.get('expected_min_s')
+    if measured_s is None or expected_s is None:
+        return "N/A", "N/A"
+    return f"{measured_s * 1e6:.1f} μs", f"≥ {expected_s * 1e6:.1f} μs"
+# Formatação (medido, esperado) da linha de cada tipo de erro físico; tipos ausentes exibem N/A
+PHYSICAL_ERROR_RENDERERS = {
+    'baudrate_deviation': _render_baudrate_error,
+    'break_field_error_too_short': _render_break_field_error,
+    'break_field_error_too_long': _render_break_field_error,
+    'ifs_error_too_short': _render_ifs_error
+}
+def _write_physical_errors(write_html, log_stats, ldf_data=None):
     phys_err = log_stats.get('physical_errors', {})
-    ldf_data = log_stats.get('ldf_data_for_report') 
-    if not any(details['count'] > 0 for error_type in phys_err.values() for details in error_type.values()):
+    if ldf_data is None:
+        ldf_data = log_stats.get('ldf_data_for_report')
+    nonempty_error_types = log_stats.get('physical_errors_nonempty')
+    if not nonempty_error_types:
         return
+    frames_by_id = ldf_data.frames_by_id if ldf_data else None
+    config_used = log_stats['config_used']
 
     write_html("<details close><summary>LIN Physical Layer Errors</summary>")
     
-    sorted_error_types = sorted(phys_err.keys(), key=lambda x: PHYSICAL_ERROR_LABELS.get(x, x))
+    sorted_error_types = sorted(nonempty_error_types, key=lambda x: PHYSICAL_ERROR_LABELS.get(x, x))
     for err_type in sorted_error_types:
-        errors_of_type = phys_err.get(err_type, {})
-        if not any(d['count'] > 0 for d in errors_of_type.values()):
-            continue
-            
+        errors_of_type = phys_err[err_type]
+        render_values = PHYSICAL_ERROR_RENDERERS.get(err_type, _render_physical_error_na)
         label = PHYSICAL_ERROR_LABELS.get(err_type, err_type)
         write_html(f"<h4>{escape(label)}</h4>")
         write_html("<table><thead><tr><th>Frame ID</th><th>Frame Name</th><th>Occurrences</th><th>Measured</th><th>Expected / Tolerance</th><th>First Timestamp (s)</th></tr></thead><tbody>")
         
         sorted_errors = sorted(errors_of_type.items(), key=lambda item: item[1]['count'], reverse=True)
-        
+        rows = []
         for (frame_id, value_key), details in sorted_errors:
             if details['count'] == 0: continue
             
             frame_name = "N/A"
-            if frame_id != -1 and ldf_data:
-                frame_name = next((f.name for f in ldf_data.frames.values() if f.id == frame_id), f"Unknown ID 0x{frame_id:X}")
+            if frame_id != -1 and frames_by_id is not None:
+                frame_def = frames_by_id.get(frame_id)
+                frame_name = frame_def.name if frame_def else f"Unknown ID 0x{frame_id:X}"
 
-            example_details = details.get('example_details', {})
-            observed_str = "N/A"
-            expected_str = "N/A"
-            if err_type == 'baudrate_deviation':
-                observed_str = f"{example_details.get('value', 0):.2f} bps"
-                expected_str = f"{log_stats['config_used'].get('lin_baudrate', 0):.0f} bps ± {log_stats['config_used'].get('physical_baudrate_tolerance_perc', 0):.1f}%"
-            elif err_type in ('break_field_error_too_short', 'break_field_error_too_long'):
-                measured_us = example_details.get('measured_us')
-                expected_min_us = example_details.get('expected_min_us')
-                expected_max_us = example_details.get('expected_max_us')
-                if all(v is not None for v in [measured_us, expected_min_us, expected_max_us]):
-                    observed_str = f"{measured_us:.3f} μs"
-                    expected_str = f"{expected_min_us:.3f} - {expected_max_us:.3f} μs"
-            elif err_type == 'ifs_error_too_short':
-                measured_s = example_details.get('measured_s')
-                expected_s = example_details.get('expected_min_s')
-                if all(v is not None for v in [measured_s, expected_s]):
-                    observed_str = f"{measured_s * 1e6:.1f} μs"
-                    expected_str = f"≥ {expected_s * 1e6:.1f} μs"
-            
-            write_html(
-                f"<tr>"
-                f"<td><code>0x{frame_id:X}</code></td>"
-                f"<td><code>{escape(frame_name)}</code></td>"
-                f"<td>{details['count']}</td>"
-                f"<td><code>{observed_str}</code></td>"
-                f"<td><code>{expected_str}</code></td>"
-                f"<td>{details.get('first_ts', 0):.6f}</td>"
-                f"</tr>"
-            )
+            observed_str, expected_str = render_values(details.get('example_details', {}), config_used)
+            rows.append(PHYSICAL_ERROR_ROW_HTML % (frame_id, escape_name(frame_name), details['count'], observed_str, expected_str, details.get('first_ts', 0)))
+        if rows:
+            write_html("\n".join(rows))
         write_html("</tbody></table>")
     write_html("</details>")
 def update_slave_response_stats(
@@ -1372,30 +1645,37 @@ def update_slave_response_stats(
     master_node = ldf_data.nodes.get('master')
     if not frame_def or not frame_def.publisher or not master_node or frame_def.publisher == master_node:
         return
-    log_stats['node_response_stats'][frame_def.publisher]['frames_published'] += 1
+    node_stats = log_stats['node_response_stats'][frame_def.publisher]
+    node_stats.frames_published += 1
     eoh_str = entry.physical_metadata.get('eoh')
     eob_str = entry.physical_metadata.get('eob')
     if not eoh_str or not eob_str:
         return
-    try:
-        eoh_ts = float(eoh_str)
-        first_eob_ts = float(eob_str.strip().split()[0])
-        response_time_s = first_eob_ts - eoh_ts
-        if 0 < response_time_s < 0.01:
-            stats = log_stats['node_response_stats'][frame_def.publisher]
-            stats['min_s'] = min(stats['min_s'], response_time_s)
-            stats['max_s'] = max(stats['max_s'], response_time_s)
-            stats['sum_s'] += response_time_s
-            stats['count'] += 1
-    except (ValueError, TypeError, IndexError):
-        pass
+    response_time_s = float(eob_str.split(None, 1)[0]) - float(eoh_str)
+    if 0 < response_time_s < 0.01:
+        if response_time_s < node_stats.min_s:
+            node_stats.min_s = response_time_s
+        if response_time_s > node_stats.max_s:
+            node_stats.max_s = response_time_s
+        node_stats.sum_s += response_time_s
+        node_stats.count += 1
 def initialize_log_stats(config: Dict[str, Any]) -> Dict[str, Any]:
     baudrate = config.get('lin_baudrate', DEFAULT_LIN_BAUDRATE)
+    def frame_error_summary_factory():
+        return {'count': 0, 'first_ts': None, 'last_ts': None, 'example_line': None, 'frame_name': None}
     def frame_stats_factory():
-        return {'count': 0, 'delta_count': 0, 'sum_delta': 0.0, 'min_delta': float('inf'), 'max_delta': 0.0, 'last_ts': None, 'frame_name': None, 'last_was_active': False}
+        return {'count': 0, 'delta_count': 0, 'sum_delta': 0.0, 'min_delta': float('inf'), 'max_delta': 0.0, 'last_ts': None, 'frame_name': None, 'last_was_active': False, 'timestamps': array('d')}
     
     def slot_timing_factory():
-        return {'sum_ms': 0.0, 'sum_sq_ms': 0.0, 'count': 0, 'min_ms': float('inf'), 'max_ms': float('-inf')}
+        return SlotTimingStats(0.0, 0.0, 0, float('inf'), float('-inf'))
+    def node_response_factory():
+        return NodeResponseStats(float('inf'), 0.0, 0.0, 0, 0)
+    def signal_stats_factory():
+        return SignalStats(float('inf'), float('-inf'), None, None, '', 'physical', None, None, 0)
+    def slave_fault_factory():
+        return SlaveFaultStats(0, None, None, None)
+    def schedule_event_factory():
+        return {'count': 0, 'first_ts_event': None, 'last_ts_event': None, 'example_details': None}
     def timing_mismatch_factory():
         return {
             'count': 0, 'sum_observed_ms': 0.0, 'min_observed_ms': float('inf'), 'max_observed_ms': float('-inf'),
@@ -1403,8 +1683,8 @@ def initialize_log_stats(config: Dict[str, Any]) -> Dict[str, Any]:
         }
     stats = {
         'error_summary': {
-            'dlc': defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'example_line': None, 'frame_name': None}),
-            'checksum': defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'example_line': None, 'frame_name': None}),
+            'dlc': defaultdict(frame_error_summary_factory),
+            'checksum': defaultdict(frame_error_summary_factory),
             'transmission': defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'example_line': None, 'affected_id_str': None}),
             'sync': defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'example_details': None}),
             'inactivity': {'periods': 0, 'total_duration': 0.0, 'max_duration': 0.0, 'first_start': None, 'last_end': None},
@@ -1417,19 +1697,21 @@ def initialize_log_stats(config: Dict[str, Any]) -> Dict[str, Any]:
         'logger_cycle_state': {'active': False, 'start_ts': None},
         'logger_activity_periods': [],
         'schedule_timing_mismatches': defaultdict(timing_mismatch_factory),
+        'schedule_summary': defaultdict(lambda: defaultdict(schedule_event_factory)),
         'schedule_runtime_state': {'active_schedules': [], 'current_index': 0, 'last_event_timestamp': None, 'cycle_start_timestamp': None, 'cycle_log': [], 'cycle_id': 0, 'has_timing_errors': False},
         'schedule_slot_timing': defaultdict(slot_timing_factory),
         'slave_reliability': defaultdict(lambda: defaultdict(lambda: {'requests': 0, 'responses': 0})),
-        'node_response_stats': defaultdict(lambda: {'min_s': float('inf'), 'max_s': 0.0, 'sum_s': 0.0, 'count': 0, 'frames_published': 0}),
-        'signal_stats': defaultdict(lambda: {'min_phys': float('inf'), 'max_phys': float('-inf'), 'min_display': None, 'max_display': None, 'unit': '', 'encoding_type': 'physical', 'first_ts': None, 'last_ts': None, 'count': 0, 'network_type':None}),
+        'node_response_stats': defaultdict(node_response_factory),
+        'signal_stats': defaultdict(signal_stats_factory),
         'frame_timing_stats': defaultdict(lambda: defaultdict(frame_stats_factory)),
         'physical_errors': {pe_key: defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'example_details': None}) for pe_key in PHYSICAL_ERROR_LABELS.keys()},
+        'physical_error_events': defaultdict(list),
+        'physical_errors_nonempty': set(),
+        'last_frame_info': {'last_eof': None},
+        'physical_metric_samples': {metric_key: array('d') for metric_key in PHYSICAL_METRIC_KEYS},
+        'master_response_delay_samples': array('d'),
         'physical_metrics': {
-            'baudrate_values': {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0},
-            'header_duration_values': {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0},
-            'frame_duration_values': {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0},
-            'hso_values_s': {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0},
-            'rso_values_s': {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0},
+            metric_key: {'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0} for metric_key in PHYSICAL_METRIC_KEYS
         },
         'gateway_results': defaultdict(lambda: {
             'comparisons': 0, 'matches': 0, 'mismatches_value': 0, 'mismatches_type': 0, 'mismatches_timing': 0,
@@ -1439,22 +1721,23 @@ def initialize_log_stats(config: Dict[str, Any]) -> Dict[str, Any]:
             'latency_stats': {'sum': 0.0, 'min': float('inf'), 'max': float('-inf'), 'count': 0, 'average': None},
             'latency_examples': []
         }),
-        'slave_faults': defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None, 'node_name': None}),
-        'network_cycle_state': {'active': False, 'start_time': None, 'first_master_time': None, 'first_master_found': False, 'slaves_responded_in_cycle': set(), 'current_cycle_start_line': None, 'current_cycle_end_line': None, 'current_cycle_details': {}, 'just_slept': False, 'saw_first_event': False, 'last_wake_event_ts': None},
+        'slave_faults': defaultdict(slave_fault_factory),
+        'network_cycle_state': {'active': False, 'start_time': None, 'first_master_time': None, 'first_master_found': False, 'slaves_responded_in_cycle': set(), 'current_cycle_start_line': None, 'current_cycle_end_line': None, 'current_cycle_details': {'problem_flags': set()}, 'just_slept': False, 'saw_first_event': False, 'last_wake_event_ts': None},
         'node_timing_stats': defaultdict(lambda: {'wake_up_time': {'count': 0, 'sum': 0.0, 'min': float('inf'), 'max': 0.0, 'first_ts': None, 'last_ts': None}, 'response_time': {'count': 0, 'sum': 0.0, 'min': float('inf'), 'max': 0.0, 'first_ts': None, 'last_ts': None}, 'bus_load_s': 0.0, 'seen_since_wake': False, 'first_frame_ts_in_cycle': None}),
-        'gateway_pending_sources': defaultdict(lambda: defaultdict(collections.deque)),
         'last_lin_activity_ts': None, 'last_global_ts': None,
         'log_info': {'start_time': None, 'end_time': None, 'duration': 0.0, 'total_entries_processed': 0, 'lin_entries': 0, 'can_entries': 0, 'rx_count': 0, 'tx_count': 0},
         'lin_bus_load': {
             'total_busy_time_s': 0.0,
             'baudrate': baudrate,
             'percentage': 0.0,
-            'bus_load_by_window': [],
+            'bus_load_by_window': array('d'),
             'duration_analyzed_s': 0.0,
             'average_percentage': 0.0,
             'max_percentage': 0.0,
         },
         'signal_to_frame_map': {}, '_internal_parse_stats': {'processed': 0, 'skipped': 0},
+        'signal_range_errors': defaultdict(lambda: {'out_of_range_count': 0, 'first_ts': None, 'last_ts': None, 'example_value': None}),
+        'signal_decoders': {},
         'config_used': config.copy()
     }
     stats['can_activity_stats'] = defaultdict(lambda: {'first_ts': None, 'last_ts': None, 'frame_count': 0})
@@ -1493,20 +1776,15 @@ def _write_schedule_adherence_section(write_html, log_stats, ldf_data):
     if timing_mismatches:
         write_html("<details close><summary>Timing Mismatch</summary>")
         write_html("<table><thead><tr><th>Schedule</th><th>Slot</th><th>Frame</th><th>Publisher</th><th>Occurrences</th><th>Expected (ms)</th><th>Observed (Min/Avg/Max ms)</th></tr></thead><tbody>")
-        sorted_mismatches = sorted(timing_mismatches.items(), key=lambda item: (item[0][0], item[0][1]))
+        sorted_mismatches = sorted(timing_mismatches.items(), key=itemgetter(0))
+        rows = []
         for (sched_name, slot_idx), stats in sorted_mismatches:
             if stats['count'] == 0: continue
             avg_ms = stats['sum_observed_ms'] / stats['count']
             observed_str = f"{stats['min_observed_ms']:.2f} / <b>{avg_ms:.2f}</b> / {stats['max_observed_ms']:.2f}"
-            write_html(f"<tr>"
-                       f"<td><code>{escape(sched_name)}</code></td>"
-                       f"<td>{slot_idx}</td>"
-                       f"<td><code>{escape(stats['frame_name'])}</code></td>"
-                       f"<td><code>{escape(stats['publisher'])}</code></td>"
-                       f"<td>{stats['count']}</td>"
-                       f"<td>{stats['expected_ms']:.2f}</td>"
-                       f"<td>{observed_str}</td>"
-                       f"</tr>")
+            rows.append(TIMING_MISMATCH_ROW_HTML % (escape_name(sched_name), slot_idx, escape_name(stats['frame_name']), escape_name(stats['publisher']), stats['count'], stats['expected_ms'], observed_str))
+        if rows:
+            write_html("\n".join(rows))
         write_html("</tbody></table></details>")
     failures_by_type = defaultdict(list)
     for cycle in cycles:
@@ -1523,20 +1801,23 @@ def _write_schedule_adherence_section(write_html, log_stats, ldf_data):
     for f_type in failure_order:
         if f_type not in failures_by_type: continue
         events = failures_by_type[f_type]
+        rows = []
         write_html(f"<details close><summary>{f_type.replace('_', ' ')}</summary>")
         if f_type == 'Sequence Mismatch':
             write_html("<table><thead><tr><th>Cycle #</th><th>Timestamp (s)</th><th>Observed Frame</th><th>Publisher Node</th><th>Expected Frame(s)</th></tr></thead><tbody>")
-            for event in sorted(events, key=lambda x: x['ts']):
+            for event in sorted(events, key=itemgetter('ts')):
                 frame_name = event.get('observed', '-')
                 node_name = all_frames_by_name.get(str(frame_name), LDFFrame(name='-', publisher='-')).publisher
-                expected_str = ", ".join(f"<code>{escape(f)}</code>" for f in event.get('expected', []))
-                write_html(f"<tr><td>#{event['cycle_id']}</td><td>{event['ts']:.6f}</td><td><code>{escape(str(frame_name))}</code></td><td><code>{escape(str(node_name))}</code></td><td>{expected_str}</td></tr>")
+                expected_str = ", ".join(f"<code>{escape_name(f)}</code>" for f in event.get('expected', []))
+                rows.append(SEQUENCE_MISMATCH_ROW_HTML % (event['cycle_id'], event['ts'], escape_name(str(frame_name)), escape_name(str(node_name)), expected_str))
         elif f_type == 'Intrusion Frame':
             write_html("<table><thead><tr><th>Timestamp (s)</th><th>Frame</th><th>Publisher Node</th></tr></thead><tbody>")
-            for event in sorted(events, key=lambda x: x['ts']):
+            for event in sorted(events, key=itemgetter('ts')):
                 frame_name = event.get('frame_name', '-')
                 node_name = all_frames_by_name.get(str(frame_name), LDFFrame(name='-', publisher='-')).publisher
-                write_html(f"<tr><td>{event['ts']:.6f}</td><td><code>{escape(str(frame_name))}</code></td><td><code>{escape(str(node_name))}</code></td></tr>")
+                rows.append(INTRUSION_FRAME_ROW_HTML % (event['ts'], escape_name(str(frame_name)), escape_name(str(node_name))))
+        if rows:
+            write_html("\n".join(rows))
         write_html("</tbody></table></details>")
 def validate_transmission_errors(
     entry: LogEntry,
@@ -1565,23 +1846,27 @@ def _write_logger_activity_section(write_html, log_stats):
         return
     write_html("<details close><summary>Logger Activity Periods</summary>")
     write_html("<table><thead><tr><th>#</th><th>Start Timestamp (s)</th><th>End Timestamp (s)</th><th>Duration (s)</th></tr></thead><tbody>")
-    for i, period in enumerate(logger_periods, 1):
-        write_html(f"<tr>"
-                   f"<td>{i}</td>"
-                   f"<td>{period['start_ts']:.6f}</td>"
-                   f"<td>{period['end_ts']:.6f}</td>"
-                   f"<td>{period['duration_s']:.3f}</td>"
-                   f"</tr>")
+    write_html("\n".join(
+        f"<tr>"
+        f"<td>{i}</td>"
+        f"<td>{period['start_ts']:.6f}</td>"
+        f"<td>{period['end_ts']:.6f}</td>"
+        f"<td>{period['duration_s']:.3f}</td>"
+        f"</tr>"
+        for i, period in enumerate(logger_periods, 1)
+    ))
     write_html("</tbody></table></details>")
 def update_network_cycle_state(entry: LogEntry, ldf_data: LDFData, ldf_id_to_frame_map: Dict[int, LDFFrame], log_stats: Dict[str, Any]):
-    summary = log_stats['network_cycle_summary']
     state = log_stats['network_cycle_state']
-    event_channel = getattr(entry, 'event_channel', -1)
     is_sleep_mode_event = entry.type == 'SleepModeEvent'
-    raw_line_lower = entry.raw_line.lower()
-    is_bus_wake_event = is_sleep_mode_event and event_channel == 1 and ('waking up' in raw_line_lower or 'wake up' in raw_line_lower)
     is_bus_sleep_command = entry.frame_id_int == 0x3C and entry.data and entry.data[0] == 0x00
-    is_any_sleep_event = (is_sleep_mode_event and 'entering sleep mode' in raw_line_lower) or is_bus_sleep_command
+    # Caminho rápido: com o ciclo ativo e o master já visto, só eventos de sleep alteram algum estado
+    if state['active'] and state['first_master_found'] and not is_sleep_mode_event and not is_bus_sleep_command:
+        return
+    summary = log_stats['network_cycle_summary']
+    event_channel = getattr(entry, 'event_channel', -1)
+    is_bus_wake_event = is_sleep_mode_event and event_channel == 1 and SLEEP_EVENT_WAKE_RE.search(entry.raw_line) is not None
+    is_any_sleep_event = (is_sleep_mode_event and SLEEP_EVENT_ENTER_RE.search(entry.raw_line) is not None) or is_bus_sleep_command
     if not state['active']:
         if is_bus_wake_event:
             state['active'] = True
@@ -1592,7 +1877,7 @@ def update_network_cycle_state(entry: LogEntry, ldf_data: LDFData, ldf_id_to_fra
                 summary['first_cycle_start_ts'] = entry.timestamp
             state['current_cycle_details'] = {'start': entry.timestamp, 'start_line': entry.raw_line, 'end': None, 'end_line': None, 'problem_flags': set()}
             log_stats.setdefault('active_schedules', set()).update(ldf_data.schedules.keys())
-        elif not is_any_sleep_event and entry.channel == 'LIN' and entry.type in ('Rx', 'Tx', 'TransmErr', 'RcvError'):
+        elif not is_any_sleep_event and entry.channel == 'LIN' and entry.type in LIN_CYCLE_FRAME_TYPES:
             state['active'] = True
             state['last_wake_event_ts'] = None
             state['first_master_found'] = False
@@ -1606,39 +1891,33 @@ def update_network_cycle_state(entry: LogEntry, ldf_data: LDFData, ldf_id_to_fra
         if is_any_sleep_event:
             state['active'] = False
             summary['last_cycle_end_ts'] = entry.timestamp
-            cycle_details = state.get('current_cycle_details', {})
+            cycle_details = state['current_cycle_details']
             cycle_details['end'] = entry.timestamp
             cycle_details['end_line'] = entry.raw_line
             if not state.get('first_master_found', False):
                 summary['cycles_no_master_response'] += 1
-                cycle_details.setdefault('problem_flags', set()).add('No Master Response')
+                cycle_details['problem_flags'].add('No Master Response')
             summary['cycles_completed'] += 1
-            if bool(cycle_details.get('problem_flags')) and summary['example_problem_cycle'] is None:
+            if cycle_details['problem_flags'] and summary['example_problem_cycle'] is None:
                 summary['example_problem_cycle'] = cycle_details.copy()
-            state['current_cycle_details'] = {}
+            state['current_cycle_details'] = {'problem_flags': set()}
             state['last_wake_event_ts'] = None
             state['first_master_found'] = False
         elif not state.get('first_master_found', False):
-            if entry.channel == 'LIN' and entry.type.lower() == 'rx':
+            if entry.channel == 'LIN' and entry.type_lower == 'rx':
                 frame = ldf_id_to_frame_map.get(entry.frame_id_int)
                 master_node_name = ldf_data.nodes.get('master')
                 if frame and master_node_name and frame.publisher and frame.publisher.strip() == master_node_name:
                     state['first_master_found'] = True
                     if state.get('last_wake_event_ts') is not None:
                         delay = entry.timestamp - state['last_wake_event_ts']
-                        if 'current_cycle_details' in state:
-                            state['current_cycle_details']['first_master_delay_ms'] = delay * 1000
-                        delay_stats = summary.setdefault('master_response_delays_ms_stats',{'min': float('inf'), 'max': float('-inf'), 'sum': 0.0, 'count': 0})
-                        delay_ms_val = delay * 1000
-                        delay_stats['min'] = min(delay_stats['min'], delay_ms_val)
-                        delay_stats['max'] = max(delay_stats['max'], delay_ms_val)
-                        delay_stats['sum'] += delay_ms_val
-                        delay_stats['count'] += 1
+                        state['current_cycle_details']['first_master_delay_ms'] = delay * 1000
+                        log_stats['master_response_delay_samples'].append(delay * 1000)
                         state['last_wake_event_ts'] = None
     if is_sleep_mode_event and event_channel == 0:
         logger_state = log_stats['logger_cycle_state']
-        is_logger_start = 'starting up' in raw_line_lower or 'waking up' in raw_line_lower
-        is_logger_sleep = 'entering sleep mode' in raw_line_lower
+        is_logger_start = LOGGER_START_RE.search(entry.raw_line) is not None
+        is_logger_sleep = SLEEP_EVENT_ENTER_RE.search(entry.raw_line) is not None
         if not logger_state['active'] and is_logger_start:
             logger_state['active'] = True
             logger_state['start_ts'] = entry.timestamp
@@ -1652,7 +1931,7 @@ def update_network_cycle_state(entry: LogEntry, ldf_data: LDFData, ldf_id_to_fra
                 })
             logger_state['active'] = False
             logger_state['start_ts'] = None
-def calculate_checksum(data_bytes: List[int], pid_for_enhanced: Optional[int] = None) -> int:
+def calculate_checksum(data_bytes: bytes, pid: int = 0) -> int:
     """
     Calcula o checksum LIN de acordo com a especificação LIN 2.x.
     
@@ -1670,9 +1949,8 @@ def calculate_checksum(data_bytes: List[int], pid_for_enhanced: Optional[int] =
        - Proporciona maior integridade de dados
     
     Args:
-        frame_id (int): ID do frame (0-63)
-        data (List[int]): Bytes de dados (sem o checksum)
-        checksum_type (str): 'classic' ou 'enhanced'
+        data_bytes (bytes): Bytes de dados (sem o checksum)
+        pid (int): Protected ID para o checksum enhanced; 0 para o classic
     
     Returns:
         int: Valor do checksum (0-255)
@@ -1681,19 +1959,14 @@ def calculate_checksum(data_bytes: List[int], pid_for_enhanced: Optional[int] =
         O Protected ID (PID) é calculado com bits de paridade P0 e P1:
         PID = ID5 ID4 ID3 ID2 ID1 ID0 P1 P0
     """
-    valid_data = [d for d in data_bytes if isinstance(d, int)]
-    if pid_for_enhanced is not None:
-        if not (0 <= pid_for_enhanced <= 0xFF):
-             raise ValueError(f"Invalid PID {pid_for_enhanced} for enhanced checksum calculation.")
-        sum_val = pid_for_enhanced + sum(valid_data)
-    else:
-        if not valid_data:
-            return 0xFF
-        sum_val = sum(valid_data)
-    while sum_val > 0xFF:
-        sum_val = (sum_val & 0xFF) + (sum_val >> 8)
+    sum_val = pid + sum(data_bytes)
+    if sum_val > 0xFF:
+        sum_val = (sum_val - 1) % 0xFF + 1
     checksum = (~sum_val) & 0xFF
     return checksum
+def _normalize_dbc_id(dbc_raw_id: int) -> Tuple[int, bool]:
+    """Converte o ID bruto do DBC (bit 31 = estendido) em (ID CAN de 29 bits, is_extended); IDs acima de 0x7FF também são estendidos."""
+    return dbc_raw_id & 0x1FFFFFFF, bool(dbc_raw_id & 0x80000000 or dbc_raw_id > 0x7FF)
 def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[str, Any]]:
     """
     Faz parsing de um arquivo DBC (CAN Database).
@@ -1716,16 +1989,21 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
     messages: Dict[int, DBCMessage] = {}
     global_attributes_this_file: Dict[str, Any] = {}
     current_msg_obj: Optional[DBCMessage] = None
-    EXTENDED_ID_FLAG_BIT31 = 0x80000000
-    STANDARD_ID_MAX = 0x7FF
-    EXTENDED_ID_MASK_29BIT = 0x1FFFFFFF
+    val_lines: List[str] = []
     try:
-        with open(dbc_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line_content in enumerate(f, 1):
-                line = line_content.strip()
-                if not line or line.startswith(('VERSION', 'BU_', 'CM_', 'BS_')):
+        with open(dbc_path, 'rb') as dbc_file, (mmap.mmap(dbc_file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(dbc_file.fileno()).st_size else io.BytesIO()) as dbc_buffer:
+            for line_bytes in iter(dbc_buffer.readline, b''):
+                line_bytes = line_bytes.strip()
+                if not line_bytes:
+                    continue
+                keyword = DBC_LINE_KEYWORDS.get(line_bytes.split(None, 1)[0])
+                if keyword is None:
                     continue
-                ba_def_def_match = DBC_BA_DEF_DEF_RE.match(line)
+                line = line_bytes.decode('utf-8', 'ignore')
+                if keyword == 'VAL_':
+                    val_lines.append(line)
+                    continue
+                ba_def_def_match = DBC_BA_DEF_DEF_RE.match(line) if keyword == 'BA_DEF_DEF_' else None
                 if ba_def_def_match:
                     attr_name_raw, attr_value_str = ba_def_def_match.groups()
                     attr_name = attr_name_raw.strip('"')
@@ -1739,7 +2017,7 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
                             except ValueError:
                                 pass
                     continue
-                ba_global_match = DBC_BA_NON_OBJECT_SPECIFIC_RE.match(line)
+                ba_global_match = DBC_BA_NON_OBJECT_SPECIFIC_RE.match(line) if keyword == 'BA_' else None
                 if ba_global_match:
                     attr_name_raw, attr_value_str = ba_global_match.groups()
                     attr_name = attr_name_raw.strip('"')
@@ -1751,27 +2029,13 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
                         except ValueError:
                             pass
                     continue
-                msg_match = MSG_DEF_RE.match(line)
+                msg_match = MSG_DEF_RE.match(line) if keyword == 'BO_' else None
                 if msg_match:
                     msg_id_str, msg_name, dlc_str, node_name_sender = msg_match.groups()
                     try:
                         dbc_raw_id = int(msg_id_str)
+                        actual_can_id, is_extended_frame_dbc = _normalize_dbc_id(dbc_raw_id)
                         parsed_dlc = int(dlc_str)
-                        is_extended_frame_dbc = False
-                        actual_can_id = dbc_raw_id
-                        if dbc_raw_id & EXTENDED_ID_FLAG_BIT31:
-                            is_extended_frame_dbc = True
-                            actual_can_id = dbc_raw_id & EXTENDED_ID_MASK_29BIT
-                        elif dbc_raw_id > STANDARD_ID_MAX:
-                            is_extended_frame_dbc = True
-                            actual_can_id = dbc_raw_id & EXTENDED_ID_MASK_29BIT
-                        else:
-                            if dbc_raw_id > STANDARD_ID_MAX:
-                                is_extended_frame_dbc = True
-                                actual_can_id = dbc_raw_id & EXTENDED_ID_MASK_29BIT
-                            else:
-                                is_extended_frame_dbc = False
-                                actual_can_id = dbc_raw_id
                         new_message = DBCMessage(
                             name=msg_name,
                             id=actual_can_id,
@@ -1786,27 +2050,14 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
                     except ValueError:
                         current_msg_obj = None
                     continue
-                if line.startswith('SG_') and current_msg_obj:
+                if keyword == 'SG_' and current_msg_obj:
                     sig_match = DBC_SIG_RE.match(line)
-                    if not sig_match:
-                        sig_match = DBC_SIG_RE_SIMPLE.match(line)
                     if sig_match:
-                        groups = list(sig_match.groups())
-                        expected_groups_full = 12
-                        expected_groups_simple = 9
-                        if len(groups) < expected_groups_full and len(groups) == expected_groups_simple:
-                            if len(groups) == expected_groups_simple:
-                                temp_groups = groups[:8]
-                                temp_groups.extend([None, None])
-                                temp_groups.append(groups[8])
-                                temp_groups.append(None)
-                                groups = temp_groups
-                        elif len(groups) < expected_groups_full:
-                             while len(groups) < expected_groups_full:
-                                 groups.append(None)
                         (sig_name, multiplexer_indicator, start_bit_str, length_str, byte_order_char,
                          sign_char, factor_str, offset_str,
-                         min_val_str, max_val_str, unit, receivers_str) = groups[:expected_groups_full]
+                         min_val_str, max_val_str, unit, receivers_str, simple_unit) = sig_match.groups()
+                        if unit is None:
+                            unit = simple_unit
                         try:
                             start_bit = int(start_bit_str)
                             length = int(length_str)
@@ -1840,17 +2091,11 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
                         except (ValueError, TypeError) as e:
                             pass
                     continue
-                ba_bo_match = re.match(r'BA_\s+"([^"]+)"\s+BO_\s+(\d+)\s+([^;]+);', line)
+                ba_bo_match = DBC_BA_BO_RE.match(line) if keyword == 'BA_' else None
                 if ba_bo_match:
                     attr_name, msg_id_str_ba, attr_val_str = ba_bo_match.groups()
                     try:
-                        target_msg_dbc_raw_id = int(msg_id_str_ba)
-                        ba_actual_can_id = target_msg_dbc_raw_id
-                        if target_msg_dbc_raw_id & EXTENDED_ID_FLAG_BIT31:
-                            ba_actual_can_id = target_msg_dbc_raw_id & EXTENDED_ID_MASK_29BIT
-                        else:
-                            if target_msg_dbc_raw_id > STANDARD_ID_MAX:
-                                ba_actual_can_id = target_msg_dbc_raw_id & EXTENDED_ID_MASK_29BIT
+                        ba_actual_can_id = _normalize_dbc_id(int(msg_id_str_ba))[0]
                         target_message_for_attr: Optional[DBCMessage] = None
                         if current_msg_obj and current_msg_obj.id == ba_actual_can_id:
                             target_message_for_attr = current_msg_obj
@@ -1870,37 +2115,47 @@ def parse_dbc_single_file(dbc_path: str) -> Tuple[Dict[int, DBCMessage], Dict[st
                     continue
             if current_msg_obj:
                 messages[current_msg_obj.id] = current_msg_obj
-            f.seek(0)
-            for line_num_val, line_content_val in enumerate(f, 1):
-                line_val = line_content_val.strip()
-                if not line_val.startswith('VAL_ '):
-                    continue
+            for line_val in val_lines:
                 val_match = DBC_VAL_RE.match(line_val)
                 if val_match:
                     msg_id_str_val, sig_name_val, val_defs_str = val_match.groups()
                     try:
-                        val_dbc_raw_id = int(msg_id_str_val)
-                        val_actual_can_id = val_dbc_raw_id
-                        if val_dbc_raw_id & EXTENDED_ID_FLAG_BIT31:
-                            val_actual_can_id = val_dbc_raw_id & EXTENDED_ID_MASK_29BIT
-                        else:
-                            if val_dbc_raw_id > STANDARD_ID_MAX:
-                                val_actual_can_id = val_dbc_raw_id & EXTENDED_ID_MASK_29BIT
+                        val_actual_can_id = _normalize_dbc_id(int(msg_id_str_val))[0]
                         target_msg = messages.get(val_actual_can_id)
                         if target_msg:
                             target_sig = next((s for s in target_msg.signals if s.name == sig_name_val), None)
                             if target_sig:
-                                val_pairs = VAL_PAIR_RE.findall(val_defs_str)
-                                for raw_val_str, label in val_pairs:
-                                    try:
-                                        target_sig.logical_map[int(raw_val_str)] = label.strip().strip('"')
-                                    except ValueError: pass
+                                target_sig.logical_map.update((int(raw_val_str), sys.intern(label.strip().strip('"'))) for raw_val_str, label in VAL_PAIR_RE.findall(val_defs_str))
                     except ValueError: pass
     except FileNotFoundError:
         raise
     except Exception as e:
         raise IOError(f"Could not read or parse DBC file: {e}") from e
+    for msg in messages.values():
+        index_dbc_message_signals(msg)
     return messages, global_attributes_this_file
+def index_dbc_message_signals(msg: DBCMessage) -> None:
+    """Preenche os campos derivados dos sinais: nomes e o sinal multiplexador (com os bytes mínimos para extraí-lo)."""
+    msg.signal_names = frozenset(sig.name for sig in msg.signals)
+    mux_switch_signal = next((s for s in msg.signals if s.is_multiplexer_switch), None)
+    if mux_switch_signal and mux_switch_signal.start_bit is not None and mux_switch_signal.length is not None:
+        msg.mux_switch_signal = mux_switch_signal
+        msg.mux_switch_required_bytes = (mux_switch_signal.start_bit + mux_switch_signal.length + 7) // 8
+    else:
+        msg.mux_switch_signal = None
+        msg.mux_switch_required_bytes = 0
+def build_gateway_name_lookups(ldf_data: Optional[LDFData], can_dbcs: Dict[str, Dict[int, DBCMessage]]) -> Dict[str, Dict[str, Tuple[Optional[int], Union[LDFFrame, DBCMessage]]]]:
+    """Indexa frames LDF e mensagens DBC por nome (sem espaços) para find_message_details_for_gateway; em nomes repetidos vale o primeiro, como na busca linear."""
+    name_lookups: Dict[str, Dict[str, Tuple[Optional[int], Union[LDFFrame, DBCMessage]]]] = {}
+    if ldf_data:
+        lin_lookup = name_lookups['LIN'] = {}
+        for fname, fobj in ldf_data.frames.items():
+            lin_lookup.setdefault(fname.strip(), (fobj.id, fobj))
+    for channel_name, dbc_for_channel in can_dbcs.items():
+        channel_lookup = name_lookups[channel_name.upper()] = {}
+        for msg_id, msg_obj in dbc_for_channel.items():
+            channel_lookup.setdefault(msg_obj.name.strip(), (msg_id, msg_obj))
+    return name_lookups
 def find_message_details_for_gateway(
     network_type: str,
     message_name: str,
@@ -1909,9 +2164,12 @@ def find_message_details_for_gateway(
     can_dbcs: Dict[str, Dict[int, DBCMessage]],
     warnings_list: List[Dict[str, Any]],
     map_index_for_context: int,
-    role_for_context: str
+    role_for_context: str,
+    name_lookups: Optional[Dict[str, Dict[str, Tuple[Optional[int], Union[LDFFrame, DBCMessage]]]]] = None
 ) -> Optional[Tuple[int, Union[LDFFrame, DBCMessage]]]:
     context = {'map_idx': map_index_for_context, 'role': role_for_context}
+    if name_lookups is None:
+        name_lookups = build_gateway_name_lookups(ldf_data, can_dbcs)
     message_name_clean = message_name.strip()
     signal_name_clean = signal_name.strip()
     if network_type == 'LIN':
@@ -1922,13 +2180,9 @@ def find_message_details_for_gateway(
                 'message': f"LDF data is not available for LIN network."
             })
             return None
-        frame_obj = None
-        for fname, fobj in ldf_data.frames.items():
-            if fname.strip() == message_name_clean:
-                frame_obj = fobj
-                break
+        frame_obj = name_lookups['LIN'].get(message_name_clean, (None, None))[1]
         if frame_obj:
-            if any(s.name.strip() == signal_name_clean for s in frame_obj.signals):
+            if signal_name_clean in frame_obj.signal_names:
                 if frame_obj.id is not None:
                     return frame_obj.id, frame_obj
                 else:
@@ -1955,17 +2209,18 @@ def find_message_details_for_gateway(
     elif network_type.upper().startswith('CAN'):
         dbc_for_channel = can_dbcs.get(network_type.upper())
         if dbc_for_channel:
-            for msg_id_candidate, msg_obj_candidate in dbc_for_channel.items():
-                if msg_obj_candidate.name.strip() == message_name_clean:
-                    if any(s.name.strip() == signal_name_clean for s in msg_obj_candidate.signals):
-                        return msg_id_candidate, msg_obj_candidate
-                    else:
-                        warnings_list.append({
-                            'signal': signal_name_clean, 'message_name': message_name_clean, 'network': network_type,
-                            'type': 'signal_not_in_can_message', 'context': context,
-                            'message': f"Signal '{signal_name_clean}' not found in CAN message '{message_name_clean}' (ID: 0x{msg_id_candidate:X}) on {network_type}."
-                        })
-                        return None
+            match = name_lookups.get(network_type.upper(), {}).get(message_name_clean)
+            if match:
+                msg_id_candidate, msg_obj_candidate = match
+                if signal_name_clean in msg_obj_candidate.signal_names:
+                    return msg_id_candidate, msg_obj_candidate
+                else:
+                    warnings_list.append({
+                        'signal': signal_name_clean, 'message_name': message_name_clean, 'network': network_type,
+                        'type': 'signal_not_in_can_message', 'context': context,
+                        'message': f"Signal '{signal_name_clean}' not found in CAN message '{message_name_clean}' (ID: 0x{msg_id_candidate:X}) on {network_type}."
+                    })
+                    return None
             warnings_list.append({
                 'signal': signal_name_clean, 'message_name': message_name_clean, 'network': network_type,
                 'type': 'can_message_not_found', 'context': context,
@@ -1987,9 +2242,27 @@ def find_message_details_for_gateway(
         })
         return None
 def parse_dbcs_for_channel(dbc_paths: List[str]) -> Tuple[Dict[int, DBCMessage], Dict[str, Any]]:
+    messages, attributes, _ = _parse_dbcs_for_channel(dbc_paths)
+    return messages, attributes
+def _parse_dbcs_for_channel(dbc_paths: List[str]) -> Tuple[Dict[int, DBCMessage], Dict[str, Any], bool]:
+    """Como parse_dbcs_for_channel, indicando também se todos os arquivos foram lidos sem erro (só então o resultado pode ir para o cache)."""
+    if len(dbc_paths) == 1:
+        # Um único DBC no canal (caso comum): não há o que agregar, usa as mensagens do arquivo diretamente
+        dbc_path = dbc_paths[0]
+        try:
+            messages, file_attributes = parse_dbc_single_file(dbc_path)
+        except Exception as e:
+            print(f"Error parsing DBC file {dbc_path}: {e}")
+            return {}, {}, False
+        for msg in messages.values():
+            if len(msg.signal_names) != len(msg.signals):
+                msg.signals = list({s.name: s for s in msg.signals}.values())
+                index_dbc_message_signals(msg)
+        return messages, ({"Baudrate": file_attributes["Baudrate"]} if messages and "Baudrate" in file_attributes else {}), True
     channel_messages_aggregated: Dict[int, AggregatedMessageData] = {}
     global_attributes_aggregated: Dict[str, Any] = {}
     first_baudrate_found = None
+    all_files_parsed = True
     for dbc_path in dbc_paths:
         try:
             current_file_messages, current_file_attributes = parse_dbc_single_file(dbc_path)
@@ -2022,18 +2295,16 @@ def parse_dbcs_for_channel(dbc_paths: List[str]) -> Tuple[Dict[int, DBCMessage],
                         raise ValueError(f"Baudrate mismatch in DBCs for the same channel. Found {first_baudrate_found} and {file_baudrate} in {dbc_path}.")
                 else:
                     existing_aggregation = channel_messages_aggregated[msg_id]
-                    existing_signals = existing_aggregation['signals_dict']
-                    for sig in msg_obj.signals:
-                        existing_signals[sig.name] = sig
                     existing_aggregation['name'] = msg_obj.name
-                    existing_aggregation['dlc'] = getattr(msg_obj, 'dlc', existing_aggregation['dlc'])
-                    existing_aggregation['node_name'] = getattr(msg_obj, 'node_name', existing_aggregation['node_name'])
+                    existing_aggregation['dlc'] = msg_obj.dlc
+                    existing_aggregation['node_name'] = msg_obj.node_name
         except Exception as e:
             print(f"Error parsing DBC file {dbc_path}: {e}")
+            all_files_parsed = False
             continue
     final_channel_messages: Dict[int, DBCMessage] = {}
     for msg_id, agg_data in channel_messages_aggregated.items():
-        final_channel_messages[msg_id] = DBCMessage(
+        final_channel_messages[msg_id] = msg = DBCMessage(
             name=agg_data['name'],
             id=agg_data['id'],
             signals=list(agg_data['signals_dict'].values()),
@@ -2041,16 +2312,36 @@ def parse_dbcs_for_channel(dbc_paths: List[str]) -> Tuple[Dict[int, DBCMessage],
             node_name=agg_data.get('node_name'),
             attributes=agg_data.get('attributes', {})
         )
-    return final_channel_messages, global_attributes_aggregated
+        index_dbc_message_signals(msg)
+    return final_channel_messages, global_attributes_aggregated, all_files_parsed
+def parse_dbcs_for_channel_cached(dbc_paths: List[str], dbc_stats: Optional[List[os.stat_result]] = None) -> Tuple[Dict[int, DBCMessage], Dict[str, Any]]:
+    """
+    Igual a parse_dbcs_for_channel, mas reaproveita o resultado de execuções anteriores.
+
+    A chave cobre todos os DBCs do canal, na ordem dada (a agregação depende
+    dela). Só são guardados canais em que todos os arquivos foram lidos sem
+    erro, para que erros de parsing continuem sendo reportados nas próximas
+    execuções.
+    """
+    try:
+        cache_path = _disk_cache_path("||".join(map(_file_cache_key, dbc_paths, dbc_stats or [None] * len(dbc_paths))) + f"|{DBC_DISK_CACHE_VERSION}")
+    except OSError:
+        return parse_dbcs_for_channel(dbc_paths)
+    cached_channel = _read_disk_cache(cache_path)
+    if isinstance(cached_channel, tuple) and len(cached_channel) == 2:
+        return cached_channel
+    messages, attributes, all_files_parsed = _parse_dbcs_for_channel(dbc_paths)
+    if messages and all_files_parsed:
+        _write_disk_cache(cache_path, (messages, attributes))
+    return messages, attributes
 def validate_lin_ids_and_dlcs(
     entry: LogEntry,
     ldf_id_to_frame_map: Dict[int, LDFFrame],
     log_stats: Dict[str, Any]
 ) -> None:
-    if entry.channel != 'LIN' or entry.type.lower() != 'rx':
+    if entry.channel != 'LIN' or entry.type_lower != 'rx':
         return
     frame_definition = ldf_id_to_frame_map.get(entry.frame_id_int)
-    critical_frames = {0x3C, 0x3D}
     if not frame_definition:
         foreign_id_key = entry.frame_id
         summary = log_stats['foreign_ids_summary']['lin'][foreign_id_key]
@@ -2071,24 +2362,19 @@ def validate_lin_ids_and_dlcs(
                 summary['frame_name'] = frame_definition.name
             summary['last_ts'] = entry.timestamp
 def validate_lin_checksum(entry: LogEntry, ldf_id_to_frame_map: Dict[int, LDFFrame], log_stats: Dict[str, Any]) -> None:
-    if entry.channel != 'LIN' or entry.type.lower() != 'rx' or entry.declared_checksum is None or entry.data is None:
+    if entry.channel != 'LIN' or entry.type_lower != 'rx' or entry.declared_checksum is None or entry.data is None:
         return
     if not entry.data and entry.csm.lower() != 'enhanced':
         return
     frame_definition = ldf_id_to_frame_map.get(entry.frame_id_int)
     frame_name_for_log = frame_definition.name if frame_definition else entry.frame_id
-    data_for_checksum = list(entry.data)
     checksum_type = (entry.csm or '').lower()
+    pid = 0
     if checksum_type == 'enhanced':
-        try:
-            pid = calculate_pid(entry.frame_id_int)
-            data_for_checksum.insert(0, pid)
-        except Exception:
+        if not 0 <= entry.frame_id_int <= 0x3F:
             return
-    try:
-        expected_checksum = calculate_checksum(data_for_checksum)
-    except Exception:
-        return
+        pid = PID_TABLE[entry.frame_id_int]
+    expected_checksum = calculate_checksum(entry.data, pid)
     if expected_checksum != entry.declared_checksum:
         error_key = (entry.frame_id_int, expected_checksum, entry.declared_checksum)
         summary = log_stats['error_summary']['checksum'][error_key]
@@ -2109,23 +2395,108 @@ def extract_signal_value(
 ):
     extracted_value = 0
     if is_big_endian:
-        for i in range(length):
-            bit_index = 8 * (start_bit // 8) + (7 - (start_bit % 8)) + i
-            byte_index = bit_index // 8
-            bit_in_byte = bit_index % 8
-            bit_value = (data_bytes[byte_index] >> (7 - bit_in_byte)) & 1
-            extracted_value = (extracted_value << 1) | bit_value
+        if length > 0:
+            # Motorola: o sinal ocupa os bits [msb_pos, msb_pos + length) do payload lido como um inteiro big-endian
+            msb_pos = (start_bit & ~7) + (7 - (start_bit & 7))
+            shift = 8 * len(data_bytes) - msb_pos - length
+            if shift < 0:
+                raise IndexError(f"Signal {signal_name_for_log} exceeds payload of {frame_id_for_log}")
+            extracted_value = (int.from_bytes(data_bytes, 'big') >> shift) & ((1 << length) - 1)
     else:
-        raw_value_combined = 0
-        for idx, byte in enumerate(data_bytes):
-            raw_value_combined |= (byte & 0xFF) << (8 * idx)
-        mask = (1 << length) - 1
-        extracted_value = (raw_value_combined >> start_bit) & mask
+        bit_offset = start_bit & 7
+        byte_index = start_bit >> 3
+        if bit_offset + length <= 8 and byte_index < len(data_bytes):
+            # Caso mais comum: o sinal cabe em um único byte
+            extracted_value = (data_bytes[byte_index] >> bit_offset) & ((1 << length) - 1)
+        else:
+            extracted_value = (int.from_bytes(data_bytes, 'little') >> start_bit) & ((1 << length) - 1)
     if is_signed and length > 0:
         sign_bit_mask = 1 << (length - 1)
         if (extracted_value & sign_bit_mask):
             extracted_value -= (1 << length)
     return extracted_value
+def signal_bit_layout(start_bit: int, length: int, is_big_endian: bool, is_signed: bool) -> Tuple[int, int, int]:
+    """
+    Posição de bit, máscara e bit de sinal (0 se sem sinal) de um sinal sobre o payload inteiro.
+
+    Em little-endian a posição é o deslocamento start_bit; em big-endian é o fim do sinal contado a
+    partir do MSB do payload, de modo que raw = (payload_be >> (8 * len(data) - posição)) & máscara.
+    """
+    bit_position = (start_bit & ~7) + (7 - (start_bit & 7)) + length if is_big_endian else start_bit
+    return bit_position, (1 << length) - 1, (1 << (length - 1)) if is_signed else 0
+def build_gateway_signal_readers(lookup: Dict[Tuple[str, int], List[Dict[str, Any]]], signal_obj_key: str) -> Dict[Tuple[str, int], tuple]:
+    """
+    Resolve uma única vez, por (rede, ID), a leitura dos sinais de gateway ('_source_signal_obj' ou '_target_signal_obj').
+
+    Cada item é (índice do mapeamento, posição de bit, máscara, bit de sinal, big_endian, mapeamento), no
+    formato de signal_bit_layout. Mapeamentos sem sinal resolvido ou sem posição/tamanho ficam de fora.
+    """
+    readers: Dict[Tuple[str, int], tuple] = {}
+    for network_frame_key, maps in lookup.items():
+        frame_readers = []
+        for m in maps:
+            sig_info = m.get(signal_obj_key)
+            if not sig_info or sig_info.start_bit is None or sig_info.length is None:
+                continue
+            is_big_endian = getattr(sig_info, 'is_big_endian', False)
+            frame_readers.append((m['map_index'],) + signal_bit_layout(sig_info.start_bit, sig_info.length, is_big_endian, getattr(sig_info, 'is_signed', False)) + (is_big_endian, m))
+        if frame_readers:
+            readers[network_frame_key] = tuple(frame_readers)
+    return readers
+def build_signal_decoders(
+    frame_definition: Union[LDFFrame, DBCMessage],
+    is_lin_frame: bool,
+    network_type: str,
+    ldf_signals_by_name: Dict[str, LDFSignal],
+    dbc_signals_by_name: Dict[str, DBCSignal],
+    signals_of_interest: Optional[FrozenSet[str]] = None,
+    check_range: bool = True
+) -> Tuple[tuple, ...]:
+    """
+    Resolve uma única vez por frame os parâmetros de decodificação dos sinais usados em update_signal_stats.
+    
+    Cada item é (posição de bit, máscara, bit de sinal ou 0, bytes mínimos, big_endian, factor, offset, unit,
+    logical_map, encoding_type, usa logical_map, (min, max) ou None, valor do multiplexador ou None, chave de estatística).
+    A posição de bit é o deslocamento sobre o payload little-endian (start_bit) ou, em big-endian, o fim do sinal
+    contado a partir do MSB do payload (ver signal_bit_layout). Sinais sem posição/tamanho ou sem definição (CAN) ficam de fora,
+    assim como os que não estão em signals_of_interest, quando informado; com check_range=False não há verificação de faixa.
+    """
+    decoders = []
+    for sig_spec in frame_definition.signals:
+        if sig_spec.start_bit is None or sig_spec.length is None or sig_spec.length == 0:
+            continue
+        if signals_of_interest and sig_spec.name not in signals_of_interest:
+            continue
+        if is_lin_frame:
+            signal_info = ldf_signals_by_name.get(sig_spec.name, sig_spec)
+            multiplexer_value = None
+        else: # CAN/CAN-FD
+            signal_info = dbc_signals_by_name.get(sig_spec.name)
+            if not signal_info:
+                continue
+            multiplexer_value = signal_info.multiplexer_value
+        encoding_type = getattr(signal_info, 'encoding_type', 'physical')
+        min_val = getattr(signal_info, 'min_value', None)
+        max_val = getattr(signal_info, 'max_value', None)
+        range_limits = (min_val, max_val) if check_range and encoding_type in ('physical', 'hybrid') and min_val is not None and max_val is not None else None
+        start_bit, length = sig_spec.start_bit, sig_spec.length
+        use_big_endian = getattr(signal_info, 'is_big_endian', False) if isinstance(signal_info, DBCSignal) else False
+        decoders.append(signal_bit_layout(start_bit, length, use_big_endian, getattr(signal_info, 'is_signed', False)) + (
+            (start_bit + length + 7) // 8, use_big_endian,
+            getattr(signal_info, 'factor', 1.0), getattr(signal_info, 'offset', 0.0),
+            getattr(signal_info, 'unit', '') or '', getattr(signal_info, 'logical_map', {}),
+            encoding_type, encoding_type in ('logical', 'hybrid'), range_limits, multiplexer_value,
+            (network_type, sig_spec.name)
+        ))
+    return tuple(decoders)
+def signal_display_value(physical_value: float, raw_value: int, logical_map: Optional[Dict[int, str]]) -> Union[str, float]:
+    """Valor exibido no relatório: o rótulo lógico do valor bruto, se houver, senão o valor físico com 6 algarismos significativos."""
+    if logical_map and raw_value in logical_map:
+        return logical_map[raw_value]
+    try:
+        return float(f"{physical_value:.6g}")
+    except (ValueError, TypeError):
+        return physical_value
 def update_signal_stats(
     entry: LogEntry,
     frame_definition: Union[LDFFrame, DBCMessage],
@@ -2142,26 +2513,21 @@ def update_signal_stats(
     actual_mux_value: Optional[int] = None
     mux_switch_signal: Optional[DBCSignal] = None
     if not is_lin_frame and isinstance(frame_definition, DBCMessage):
-        mux_switch_signal = next((s for s in frame_definition.signals if s.is_multiplexer_switch), None)
+        mux_switch_signal = frame_definition.mux_switch_signal
         if mux_switch_signal:
-            if mux_switch_signal.start_bit is not None and mux_switch_signal.length is not None:
-                max_bit_mux = mux_switch_signal.start_bit + mux_switch_signal.length
-                required_bytes_mux = (max_bit_mux + 7) // 8
-                if len(entry.data) >= required_bytes_mux:
-                    try:
-                        actual_mux_value = extract_signal_value(
-                            entry.data,
-                            mux_switch_signal.start_bit,
-                            mux_switch_signal.length,
-                            mux_switch_signal.is_big_endian,
-                            mux_switch_signal.is_signed,
-                            signal_name_for_log=f"{mux_switch_signal.name} (MuxSwitch)",
-                            frame_id_for_log=frame_id_for_log
-                        )
-                    except Exception:
-                        pass
-                else:
-                    mux_switch_signal = None 
+            if len(entry.data) >= frame_definition.mux_switch_required_bytes:
+                try:
+                    actual_mux_value = extract_signal_value(
+                        entry.data,
+                        mux_switch_signal.start_bit,
+                        mux_switch_signal.length,
+                        mux_switch_signal.is_big_endian,
+                        mux_switch_signal.is_signed,
+                        signal_name_for_log=f"{mux_switch_signal.name} (MuxSwitch)",
+                        frame_id_for_log=frame_id_for_log
+                    )
+                except Exception:
+                    pass
             else:
                 mux_switch_signal = None
     
@@ -2192,120 +2558,186 @@ def update_signal_stats(
                     if error_raw_value != 0:
                         fault_key = (publisher_node, error_signal_name)
                         fault_stats = log_stats['slave_faults'][fault_key]
-                        fault_stats['count'] += 1
-                        fault_stats['node_name'] = publisher_node
-                        if fault_stats['first_ts'] is None:
-                            fault_stats['first_ts'] = entry.timestamp
-                        fault_stats['last_ts'] = entry.timestamp
+                        fault_stats.count += 1
+                        fault_stats.node_name = publisher_node
+                        if fault_stats.first_ts is None:
+                            fault_stats.first_ts = entry.timestamp
+                        fault_stats.last_ts = entry.timestamp
                 except (IndexError, TypeError):
                     pass # Ignora se os dados do frame não forem suficientes
 
     # Lógica de estatísticas de todos os sinais (continua normalmente)
-    log_stats.setdefault('signal_stats', defaultdict(lambda: {
-        'min_phys': float('inf'), 'max_phys': float('-inf'), 'min_display': None, 'max_display': None,
-        'unit': '', 'encoding_type': 'physical', 'first_ts': None, 'last_ts': None, 'count': 0
-    }))
-    log_stats.setdefault("signal_to_frame_map", {})
-    log_stats.setdefault('signal_range_errors', defaultdict(lambda: {
-        'out_of_range_count': 0, 'first_ts': None, 'last_ts': None, 'example_value': None
-    }))
-
-    for sig_spec in frame_definition.signals:
-        if sig_spec.start_bit is None or sig_spec.length is None or sig_spec.length == 0:
-            continue
-        
-        max_bit_pos = sig_spec.start_bit + sig_spec.length
-        required_bytes = (max_bit_pos + 7) // 8
-        if len(entry.data) < required_bytes:
+    decoders_key = (network_type, id(frame_definition))
+    signal_decoders = log_stats['signal_decoders'].get(decoders_key)
+    if signal_decoders is None:
+        config_used = log_stats['config_used']
+        signal_decoders = log_stats['signal_decoders'][decoders_key] = build_signal_decoders(
+            frame_definition, is_lin_frame, network_type, ldf_signals_by_name, dbc_signals_by_name,
+            config_used.get('signals_of_interest'), config_used.get('enable_range_validation', True)
+        )
+    data_len = len(entry.data)
+    # O payload é convertido em inteiro uma vez por mensagem; cada sinal é então só deslocamento e máscara
+    payload_bits = 8 * data_len
+    payload_le = int.from_bytes(entry.data, 'little')
+    payload_be = None
+    timestamp = entry.timestamp
+    signal_stats = log_stats['signal_stats']
+    for (bit_position, mask, sign_bit, required_bytes, use_big_endian, factor, offset,
+         unit, logical_map, encoding_type, use_logical_map, range_limits, multiplexer_value, stats_key) in signal_decoders:
+        if data_len < required_bytes:
             continue
-
-        signal_info: Optional[Union[LDFSignal, DBCSignal]] = None
-        if is_lin_frame:
-            signal_info = ldf_signals_by_name.get(sig_spec.name, sig_spec)
-        else: # CAN/CAN-FD
-            signal_info = dbc_signals_by_name.get(sig_spec.name)
-            if signal_info and signal_info.multiplexer_value is not None:
-                if mux_switch_signal is None or actual_mux_value != signal_info.multiplexer_value:
-                    continue
-        if not signal_info:
+        if multiplexer_value is not None and (mux_switch_signal is None or actual_mux_value != multiplexer_value):
             continue
-            
-        use_big_endian = getattr(signal_info, 'is_big_endian', False) if isinstance(signal_info, DBCSignal) else False
-        use_signed = getattr(signal_info, 'is_signed', False)
         
-        try:
-            raw_value = extract_signal_value(
-                entry.data, sig_spec.start_bit, sig_spec.length,
-                is_big_endian=use_big_endian, is_signed=use_signed,
-                signal_name_for_log=sig_spec.name, frame_id_for_log=frame_id_for_log
-            )
-        except (IndexError, TypeError):
-            continue
+        if use_big_endian:
+            if bit_position > payload_bits:
+                continue
+            if payload_be is None:
+                payload_be = int.from_bytes(entry.data, 'big')
+            raw_value = (payload_be >> (payload_bits - bit_position)) & mask
+        else:
+            raw_value = (payload_le >> bit_position) & mask
+        if raw_value & sign_bit:
+            raw_value -= mask + 1
 
-        factor = getattr(signal_info, 'factor', 1.0)
-        offset = getattr(signal_info, 'offset', 0.0)
-        unit = getattr(signal_info, 'unit', '') or ''
-        logical_map = getattr(signal_info, 'logical_map', {})
-        encoding_type = getattr(signal_info, 'encoding_type', 'physical')
         physical_value = convert_signal_value(raw_value, factor, offset)
-        display_value: Union[str, float]
-        if encoding_type in ("logical", "hybrid") and raw_value in logical_map:
-            display_value = logical_map[raw_value]
-        else:
-            try:
-                display_value = float(f"{physical_value:.6g}")
-            except (ValueError, TypeError):
-                display_value = physical_value
 
-        if encoding_type == 'physical' or encoding_type == 'hybrid':
-            min_val = getattr(signal_info, 'min_value', None)
-            max_val = getattr(signal_info, 'max_value', None)
-            if min_val is not None and max_val is not None:
-                if physical_value < min_val or physical_value > max_val:
-                    range_error_key = (network_type, sig_spec.name)
-                    range_error = log_stats['signal_range_errors'][range_error_key]
-                    range_error['out_of_range_count'] += 1
-                    if range_error['first_ts'] is None:
-                        range_error['first_ts'] = entry.timestamp
-                        range_error['example_value'] = physical_value
-                    range_error['last_ts'] = entry.timestamp
+        if range_limits is not None:
+            if physical_value < range_limits[0] or physical_value > range_limits[1]:
+                range_error = log_stats['signal_range_errors'][stats_key]
+                range_error['out_of_range_count'] += 1
+                if range_error['first_ts'] is None:
+                    range_error['first_ts'] = timestamp
+                    range_error['example_value'] = physical_value
+                range_error['last_ts'] = timestamp
                     
-        stats_key = (network_type, sig_spec.name)
-        stats = log_stats['signal_stats'][stats_key]
-        if stats['count'] == 0:
-            stats['min_phys'] = physical_value
-            stats['max_phys'] = physical_value
-            stats['min_display'] = display_value
-            stats['max_display'] = display_value
-            stats['unit'] = unit
-            stats['encoding_type'] = encoding_type
-            stats['first_ts'] = entry.timestamp
+        stats = signal_stats[stats_key]
+        count = stats.count
+        stats.count = count + 1
+        stats.last_ts = timestamp
+        # O valor de exibição só é montado quando a amostra vira novo mínimo/máximo
+        if count == 0:
+            display_value = signal_display_value(physical_value, raw_value, logical_map if use_logical_map else None)
+            stats.min_phys = physical_value
+            stats.max_phys = physical_value
+            stats.min_display = display_value
+            stats.max_display = display_value
+            stats.unit = unit
+            stats.encoding_type = encoding_type
+            stats.first_ts = timestamp
             log_stats["signal_to_frame_map"][stats_key] = frame_definition.name
-        if physical_value < stats['min_phys']:
-            stats['min_phys'] = physical_value
-            stats['min_display'] = display_value
-        if physical_value > stats['max_phys']:
-            stats['max_phys'] = physical_value
-            stats['max_display'] = display_value
-        stats['last_ts'] = entry.timestamp
-        stats['count'] += 1
+        elif physical_value < stats.min_phys:
+            stats.min_phys = physical_value
+            stats.min_display = signal_display_value(physical_value, raw_value, logical_map if use_logical_map else None)
+        elif physical_value > stats.max_phys:
+            stats.max_phys = physical_value
+            stats.max_display = signal_display_value(physical_value, raw_value, logical_map if use_logical_map else None)
 def validate_id_parity(entry: LogEntry, log_stats: Dict[str, Any]) -> None:
     pid = entry.frame_id_int
     if entry.channel != 'LIN' or pid < 0x40:
         return
-    raw_id = pid & 0x3F
-    p0 = ((raw_id >> 0) ^ (raw_id >> 1) ^ (raw_id >> 2) ^ (raw_id >> 4)) & 1
-    p1 = (~((raw_id >> 1) ^ (raw_id >> 3) ^ (raw_id >> 4) ^ (raw_id >> 5))) & 1
-    expected_pid = raw_id | (p0 << 6) | (p1 << 7)
-    if expected_pid != pid:
-        summary = log_stats.setdefault('error_summary', {}) \
-                           .setdefault('parity', defaultdict(lambda: {'count': 0, 'first_ts': None, 'last_ts': None}))
-        rec = summary[pid]
+    if PID_TABLE[pid & 0x3F] != pid:
+        rec = log_stats['error_summary']['parity'][pid]
         rec['count'] += 1
         if rec['first_ts'] is None:
             rec['first_ts'] = entry.timestamp
             rec['example_line'] = entry.raw_line
         rec['last_ts'] = entry.timestamp
+# IDs já vistos no log: texto -> (texto internado, valor inteiro); um log tem só dezenas/centenas de IDs distintos
+LOG_FRAME_IDS: Dict[str, Tuple[str, int]] = {}
+CAN_LOG_FRAME_IDS: Dict[str, Tuple[str, int]] = {}
+def _log_frame_id(frame_id_str: str) -> Tuple[str, int]:
+    frame_id = LOG_FRAME_IDS.get(frame_id_str)
+    if frame_id is None:
+        frame_id = LOG_FRAME_IDS[frame_id_str] = (sys.intern(frame_id_str), int(frame_id_str, 16))
+    return frame_id
+def _can_log_frame_id(frame_id_str: str) -> Tuple[str, int]:
+    """Como _log_frame_id, aceitando o sufixo 'x' dos IDs estendidos CAN."""
+    frame_id = CAN_LOG_FRAME_IDS.get(frame_id_str)
+    if frame_id is None:
+        frame_id = CAN_LOG_FRAME_IDS[frame_id_str] = (sys.intern(frame_id_str), int(frame_id_str.lower().rstrip('x'), 16))
+    return frame_id
+def _build_spike_entry(m_line: re.Match, raw_line: str) -> LogEntry:
+    return LogEntry(
+        timestamp=float(m_line['ts']),
+        channel='LIN', frame_id='Spike', frame_id_int=-1,
+        type='Spike', data=b'', raw_line=raw_line
+    )
+def _build_lin_error_entry(err_type: str, m_line: re.Match, raw_line: str) -> LogEntry:
+    match_dict = m_line.groupdict()
+    frame_id_str = match_dict.get('id') or err_type
+    frame_id_int = -1
+    if frame_id_str and frame_id_str != err_type:
+         try: frame_id_int = int(frame_id_str, 16)
+         except ValueError: pass
+
+    full_time_val = None
+    header_time_val = None
+    if match_dict.get('full_time'):
+        try: full_time_val = float(match_dict['full_time'])
+        except ValueError: pass
+    if match_dict.get('header_time'):
+        try: header_time_val = float(match_dict['header_time'])
+        except ValueError: pass
+
+    return LogEntry(
+        timestamp=float(match_dict['ts']),
+        channel='LIN', frame_id=frame_id_str, frame_id_int=frame_id_int,
+        type=err_type, data=b'', raw_line=raw_line,
+        full_time_tbit=full_time_val, header_time_tbit=header_time_val
+    )
+def _build_lin_entry(m_line: re.Match, raw_line: str) -> LogEntry:
+    frame_id_str, frame_id_int = _log_frame_id(m_line['id'])
+    if '=' in raw_line:
+        fields = LIN_FIELDS_PATTERN.match(raw_line, m_line.end()).groupdict()
+        checksum_val = int(fields['checksum'], 16) if fields['checksum'] else None
+        csm_val = sys.intern(fields['csm']) if fields['csm'] else None
+        physical_metadata = {k: fields[k] for k in LIN_PHYSICAL_FIELDS if fields[k]}
+        full_time_val = float(fields['full_time']) if fields['full_time'] else None
+        header_time_val = float(fields['header_time']) if fields['header_time'] else None
+    else:
+        checksum_val = csm_val = physical_metadata = full_time_val = header_time_val = None
+
+    return LogEntry(
+        timestamp=float(m_line['ts']),
+        channel='LIN', frame_id=frame_id_str, frame_id_int=frame_id_int,
+        type=sys.intern(m_line['type']), data=bytes.fromhex(m_line['data']), raw_line=raw_line,
+        declared_checksum=checksum_val, csm=csm_val,
+        physical_metadata=physical_metadata if physical_metadata else None,
+        full_time_tbit=full_time_val, header_time_tbit=header_time_val
+    )
+def _build_canfd_entry(m_line: re.Match, raw_line: str) -> LogEntry:
+    frame_id_str, frame_id_int = _log_frame_id(m_line['id'])
+    return LogEntry(
+        timestamp=float(m_line['ts']), channel=sys.intern(f"CANFD{m_line['channel']}"),
+        frame_id=frame_id_str, frame_id_int=frame_id_int,
+        type=sys.intern(m_line['type']), data=bytes.fromhex(m_line['data']),
+        raw_line=raw_line
+    )
+def _build_can_entry(m_line: re.Match, raw_line: str) -> LogEntry:
+    frame_id_str, frame_id_int = _can_log_frame_id(m_line['id'])
+    return LogEntry(
+        timestamp=float(m_line['ts']), channel=sys.intern(f"CAN{m_line['channel']}"),
+        frame_id=frame_id_str, frame_id_int=frame_id_int,
+        type=sys.intern(m_line['type']), data=bytes.fromhex(m_line['data']),
+        raw_line=raw_line
+    )
+def _build_sleep_event_entry(m_line: re.Match, raw_line: str) -> LogEntry:
+    return LogEntry(
+        timestamp=float(m_line['ts']), channel='LIN', frame_id='SleepModeEvent',
+        frame_id_int=-1, type='SleepModeEvent', data=b'', raw_line=raw_line,
+        event_channel=int(m_line['event_channel']) if m_line['event_channel'] else None
+    )
+# Construtor de LogEntry para cada tipo de linha de LOG_LINE_PATTERNS
+LOG_ENTRY_BUILDERS = {
+    'spike': _build_spike_entry,
+    'transerr': partial(_build_lin_error_entry, 'TransmErr'),
+    'rcverr': partial(_build_lin_error_entry, 'RcvError'),
+    'lin': _build_lin_entry,
+    'canfd': _build_canfd_entry,
+    'can': _build_can_entry,
+    'event': _build_sleep_event_entry,
+}
 def parse_log(log_path: str) -> Iterator[LogEntry]:
     """
     Faz parsing de arquivo de log de comunicação CAN/LIN.
@@ -2320,119 +2752,44 @@ def parse_log(log_path: str) -> Iterator[LogEntry]:
         log_path (str): Caminho para o arquivo de log
     
     Returns:
-        List[LogEntry]: Lista ordenada de entradas de log por timestamp
+        Iterator[LogEntry]: Entradas do log, na ordem em que aparecem no arquivo
     
     Exemplo de formato suportado:
         0.123456 Rx 1 0x12 8 01 02 03 04 05 06 07 08
     """
-    if not os.path.isfile(log_path):
-        raise FileNotFoundError(f"Log file not found: {log_path}")
     try:
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as log_file:
-            while True:
-                try:
-                    line = log_file.readline()
-                except Exception:
-                    continue
-                if not line:
-                    break
-                raw_line_stripped = line.strip()
-                if not raw_line_stripped:
-                    continue
-                log_entry: Optional[LogEntry] = None
-                m_spike = SPIKE_PATTERN.match(raw_line_stripped)
-                m_transerr = TRANSERR_PATTERN.match(raw_line_stripped)
-                m_rcverr = RCVERR_PATTERN.match(raw_line_stripped)
-                m_lin = LIN_PATTERN.match(raw_line_stripped)
-                m_event = EVENT_PATTERN.match(raw_line_stripped)
-                m_canfd = CANFD_PATTERN.match(raw_line_stripped)
-                m_can = CAN_PATTERN.match(raw_line_stripped)
-                try:
-                    if m_spike:
-                        match_dict = m_spike.groupdict()
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']),
-                            channel='LIN', frame_id='Spike', frame_id_int=-1,
-                            type='Spike', data=[], raw_line=raw_line_stripped
-                        )
-                    elif m_transerr or m_rcverr:
-                        match_dict = (m_transerr or m_rcverr).groupdict()
-                        err_type = 'TransmErr' if m_transerr else 'RcvError'
-                        frame_id_str = match_dict.get('id') or err_type
-                        frame_id_int = -1
-                        if frame_id_str and frame_id_str != err_type:
-                             try: frame_id_int = int(frame_id_str, 16)
-                             except ValueError: pass
-
-                        full_time_val = None
-                        header_time_val = None
-                        if match_dict.get('full_time'):
-                            try: full_time_val = float(match_dict['full_time'])
-                            except ValueError: pass
-                        if match_dict.get('header_time'):
-                            try: header_time_val = float(match_dict['header_time'])
-                            except ValueError: pass
-
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']),
-                            channel='LIN', frame_id=frame_id_str, frame_id_int=frame_id_int,
-                            type=err_type, data=[], raw_line=raw_line_stripped,
-                            full_time_tbit=full_time_val, header_time_tbit=header_time_val
-                        )
-                    elif m_lin:
-                        match_dict = m_lin.groupdict()
-                        frame_id_str = match_dict['id']
-                        frame_id_int = int(frame_id_str, 16)
-                        data_bytes = [int(b, 16) for b in match_dict['data'].strip().split()] if match_dict['data'] else []
-                        checksum_val = int(match_dict['checksum'], 16) if match_dict.get('checksum') else None
-                        
-                        physical_metadata = {k: match_dict[k] for k in ['sof', 'br', 'break_info', 'eoh', 'eob', 'eof', 'rbr', 'hbr', 'hso', 'rso'] if match_dict.get(k)}
-                        
-                        full_time_val = float(match_dict['full_time']) if match_dict.get('full_time') else None
-                        header_time_val = float(match_dict['header_time']) if match_dict.get('header_time') else None
-
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']),
-                            channel='LIN', frame_id=frame_id_str, frame_id_int=frame_id_int,
-                            type=match_dict['type'], data=data_bytes, raw_line=raw_line_stripped,
-                            declared_checksum=checksum_val, csm=match_dict.get('csm'),
-                            physical_metadata=physical_metadata if physical_metadata else None,
-                            full_time_tbit=full_time_val, header_time_tbit=header_time_val
-                        )
-                    elif m_canfd:
-                        match_dict = m_canfd.groupdict()
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']), channel=f"CANFD{match_dict['channel']}",
-                            frame_id=match_dict['id'], frame_id_int=int(match_dict['id'], 16),
-                            type=match_dict['type'], data=[int(b, 16) for b in match_dict['data'].strip().split()] if match_dict.get('data') else [],
-                            raw_line=raw_line_stripped
-                        )
-                    elif m_can:
-                        match_dict = m_can.groupdict()
-                        frame_id_str_numeric = match_dict['id'].lower().rstrip('x')
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']), channel=f"CAN{match_dict['channel']}",
-                            frame_id=match_dict['id'], frame_id_int=int(frame_id_str_numeric, 16),
-                            type=match_dict['type'], data=[int(b, 16) for b in match_dict['data'].strip().split()] if match_dict.get('data') else [],
-                            raw_line=raw_line_stripped
-                        )
-                    elif m_event:
-                        match_dict = m_event.groupdict()
-                        log_entry = LogEntry(
-                            timestamp=float(match_dict['ts']), channel='LIN', frame_id='SleepModeEvent',
-                            frame_id_int=-1, type='SleepModeEvent', data=[], raw_line=raw_line_stripped,
-                            event_channel=int(match_dict['event_channel']) if match_dict.get('event_channel') else None
-                        )
-                except (ValueError, TypeError, KeyError):
-                    log_entry = None
-                if log_entry:
-                    yield log_entry
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        log_file = open(log_path, 'rb')
     except FileNotFoundError:
-        raise
-    except Exception as e:
-        raise
+        raise FileNotFoundError(f"Log file not found: {log_path}") from None
+    with log_file:
+        log_size = os.fstat(log_file.fileno()).st_size
+        with (mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) if log_size else io.BytesIO()) as log_buffer:
+            chunk_start = 0
+            while chunk_start < log_size:
+                # Decodifica blocos de ~LOG_READ_CHUNK_BYTES terminados em '\n' de uma vez, em vez de linha a linha
+                chunk_end = log_buffer.find(b'\n', chunk_start + LOG_READ_CHUNK_BYTES)
+                chunk_end = log_size if chunk_end < 0 else chunk_end + 1
+                chunk_text = log_buffer[chunk_start:chunk_end].decode('utf-8', 'ignore')
+                chunk_start = chunk_end
+                for raw_line in chunk_text.split('\n'):
+                    raw_line_stripped = raw_line.strip()
+                    if not raw_line_stripped:
+                        continue
+                    m_bus = LOG_LINE_BUS_RE.match(raw_line_stripped)
+                    if not m_bus:
+                        continue
+                    for line_kind, line_pattern in LOG_LINE_PATTERNS[m_bus.lastgroup]:
+                        m_line = line_pattern.match(raw_line_stripped)
+                        if m_line:
+                            break
+                    else:
+                        continue
+                    try:
+                        log_entry = LOG_ENTRY_BUILDERS[line_kind](m_line, raw_line_stripped)
+                    except (ValueError, TypeError, KeyError):
+                        log_entry = None
+                    if log_entry:
+                        yield log_entry
 def validate_timestamp_sync(
     current_timestamp: float,
     last_valid_timestamp: Optional[float],
@@ -2447,25 +2804,19 @@ def validate_timestamp_sync(
         error_type = 'negative_jump'
         details = {'prev': last_valid_timestamp, 'current': current_timestamp, 'delta': delta}
     if error_type:
-        log_stats.setdefault('error_summary', {}).setdefault('sync', {})
-        summary = log_stats['error_summary']['sync'].setdefault(
-            error_type,
-            {'count': 0, 'first_ts': None, 'last_ts': None, 'example_details': None}
-        )
+        summary = log_stats['error_summary']['sync'][error_type]
         summary['count'] += 1
         if summary['first_ts'] is None:
             summary['first_ts'] = current_timestamp
             summary['example_details'] = details
         summary['last_ts'] = current_timestamp
     return current_timestamp
-def _post_process_gateway_correlation(log_stats, source_events, target_events, config, ldf_data, can_dbcs):
+def _post_process_gateway_correlation(log_stats, source_events, target_events, config, ldf_sigs, dbc_sigs):
     gateway_tolerance_s = config.get('gateway_tolerance', DEFAULT_GATEWAY_TOLERANCE_S)
-    ldf_sigs = {s.name: s for f in ldf_data.frames.values() for s in f.signals}
-    dbc_sigs = {sig.name: sig for dbc in can_dbcs.values() for msg in dbc.values() for sig in msg.signals}
 
-    for map_idx, targets in target_events.items():
-        sources = source_events.get(map_idx, [])
-        if not sources or not targets:
+    for map_idx, (target_ts, target_raw) in target_events.items():
+        source_ts, source_raw = source_events.get(map_idx, ((), ()))
+        if not source_ts or not target_ts:
             continue
         
         res = log_stats['gateway_results'][map_idx]
@@ -2477,37 +2828,40 @@ def _post_process_gateway_correlation(log_stats, source_events, target_events, c
         if not src_details or not tgt_details:
             continue
 
-        source_pointer = 0
-        num_source_events = len(sources)
+        # Logs reais podem ter saltos negativos de timestamp: a origem é ordenada (de forma estável) antes da busca binária
+        if any(later < earlier for earlier, later in zip(source_ts, source_ts[1:])):
+            source_order = sorted(range(len(source_ts)), key=source_ts.__getitem__)
+            source_ts = [source_ts[i] for i in source_order]
+            source_raw = [source_raw[i] for i in source_order]
+        latencies = array('d')
+        comparison_cache: Dict[Tuple[int, int], Tuple[bool, str]] = {}
 
-        for ts_target, raw_target in targets:
-            while source_pointer < num_source_events and sources[source_pointer][0] < (ts_target - gateway_tolerance_s):
-                source_pointer += 1
-
-            best_source_candidate = None
-            for i in range(source_pointer, num_source_events):
-                ts_source, _ = sources[i]
-                if ts_source >= ts_target:
-                    break
-                best_source_candidate = sources[i]
+        # Candidato: o último evento de origem na janela [ts_target - tolerância, ts_target); os alvos podem vir fora de ordem
+        for ts_target, raw_target in zip(target_ts, target_raw):
+            window_start = bisect_left(source_ts, ts_target - gateway_tolerance_s)
+            best_source_idx = bisect_left(source_ts, ts_target, window_start) - 1
+            if best_source_idx < window_start:
+                best_source_idx = -1
 
             res['comparisons'] += 1
-            if best_source_candidate:
-                ts_source, raw_source = best_source_candidate
+            if best_source_idx >= 0:
+                ts_source, raw_source = source_ts[best_source_idx], source_raw[best_source_idx]
                 latency_s = ts_target - ts_source
                 if latency_s >= 0:
-                    lat_stats = res['latency_stats']
-                    lat_stats['count'] += 1
-                    lat_stats['sum'] += latency_s
-                    lat_stats['min'] = min(lat_stats['min'], latency_s)
-                    lat_stats['max'] = max(lat_stats['max'], latency_s)
+                    latencies.append(latency_s)
 
-                match, c_type = compare_gateway_values(raw_source, raw_target, src_details, tgt_details)
+                raw_pair = (raw_source, raw_target)
+                comparison = comparison_cache.get(raw_pair)
+                if comparison is None:
+                    comparison = comparison_cache[raw_pair] = compare_gateway_values(raw_source, raw_target, src_details, tgt_details)
+                match, c_type = comparison
                 if match:
                     res['matches'] += 1
                 else:
                     key = 'mismatches_type' if c_type == 'hybrid_mismatch' else 'mismatches_value'
                     res[key] += 1
+                    if len(res['mismatch_examples']) >= GATEWAY_MISMATCH_EXAMPLES_LIMIT:
+                        continue
                     res['mismatch_examples'].append({
                         'ts_source': ts_source,
                         'raw_source': raw_source,
@@ -2522,12 +2876,44 @@ def _post_process_gateway_correlation(log_stats, source_events, target_events, c
                     })
             else:
                 res['mismatches_timing'] += 1
+        if latencies:
+            lat_stats = res['latency_stats']
+            lat_stats['count'] += len(latencies)
+            lat_stats['sum'] += sum(latencies)
+            lat_stats['min'] = min(lat_stats['min'], min(latencies))
+            lat_stats['max'] = max(lat_stats['max'], max(latencies))
 
+def _finalize_physical_layer_stats(log_stats: Dict[str, Any]) -> None:
+    """Reduz as amostras das métricas físicas e agrupa os eventos de erro físico por (frame, valor)."""
+    physical_metrics = log_stats['physical_metrics']
+    for metric_key, samples in log_stats.pop('physical_metric_samples', {}).items():
+        if samples:
+            metrics = physical_metrics[metric_key]
+            metrics['min'] = min(metrics['min'], min(samples))
+            metrics['max'] = max(metrics['max'], max(samples))
+            metrics['sum'] += sum(samples)
+            metrics['count'] += len(samples)
+    physical_errors = log_stats['physical_errors']
+    nonempty_error_types = log_stats['physical_errors_nonempty']
+    for error_type, events in log_stats.pop('physical_error_events', {}).items():
+        if events:
+            nonempty_error_types.add(error_type)
+        summaries = physical_errors[error_type]
+        for frame_id_key, value_key, ts, details in events:
+            summary = summaries[(frame_id_key, value_key)]
+            summary['count'] += 1
+            if summary['first_ts'] is None:
+                summary['first_ts'] = ts
+                summary['example_details'] = details
+            summary['last_ts'] = ts
 def _finalize_statistics(log_stats: Dict[str, Any]):
+    log_stats.pop('signal_decoders', None)
     finalize_network_cycle_stats(log_stats)
+    _finalize_physical_layer_stats(log_stats)
     frame_timing_summary = defaultdict(dict)
     for channel, frames in log_stats.get('frame_timing_stats', {}).items():
         for frame_id, stats in frames.items():
+            _finalize_frame_timing_stats(stats)
             if stats.get('delta_count', 0) > 0:
                 avg_ms = (stats['sum_delta'] / stats['delta_count']) * 1000
                 min_ms = stats['min_delta'] * 1000
@@ -2613,40 +2999,54 @@ def process_log_file(log_path: str, ldf_data: LDFData, can_dbcs: Dict[str, Dict[
             print(f"Análise falhou: {results['error_count']} erros")
     """
     log_stats = initialize_log_stats(config)
-    gateway_source_events = defaultdict(list)
-    gateway_target_events = defaultdict(list)
-    ldf_id_to_frame = {f.id: f for f in ldf_data.frames.values() if f.id is not None}
-    ldf_sigs = {s.name: s for f in ldf_data.frames.values() for s in f.signals} if ldf_data else {}
+    gateway_source_events = defaultdict(lambda: (array('d'), []))
+    gateway_target_events = defaultdict(lambda: (array('d'), []))
+    ldf_id_to_frame = ldf_data.frames_by_id
+    ldf_sigs = ldf_data.signals_by_name if ldf_data else {}
     dbc_sigs = {sig.name: sig for dbc in can_dbcs.values() for msg in dbc.values() for sig in msg.signals}
     valid_can_channels = set(can_dbcs.keys())
     
     bus_load_window_s = config.get('bus_load_window_s', DEFAULT_BUS_LOAD_WINDOW_S)
     lin_baudrate = config.get('lin_baudrate', DEFAULT_LIN_BAUDRATE)
-    time_in_window_us = defaultdict(float)
+    check_checksum = config.get('enable_checksum_validation', True)
+    check_physical = config.get('enable_physical_validation', True)
+    check_schedule = config.get('enable_schedule_validation', True)
+    check_gateway = config.get('enable_gateway_validation')
+    schedule_tolerance_factor = config.get('schedule_tolerance_factor', 0.1)
+    schedule_min_tolerance_s = config.get('schedule_min_tolerance_s', DEFAULT_SCHEDULE_MIN_ABSOLUTE_TOLERANCE_S)
+    gateway_source_readers = build_gateway_signal_readers(gateway_lookup.get('source', {}), '_source_signal_obj')
+    gateway_target_readers = build_gateway_signal_readers(gateway_lookup.get('target', {}), '_target_signal_obj')
+    parse_stats = log_stats['_internal_parse_stats']
+    log_info = log_stats['log_info']
+    network_cycle_state = log_stats['network_cycle_state']
+    bus_load_by_window = log_stats['lin_bus_load']['bus_load_by_window']
+    window_capacity_us = bus_load_window_s * 1e6
+    window_busy_us = 0.0
+    lin_busy_time_s = 0.0
     current_window_index = -1
     start_ts = None
 
     for entry in parse_log(log_path):
         ts = entry.timestamp
-        log_stats['_internal_parse_stats']['processed'] += 1
+        parse_stats['processed'] += 1
         
         if start_ts is None:
             start_ts = ts
-            log_stats['log_info']['start_time'] = ts
+            log_info['start_time'] = ts
         
-        log_stats['log_info']['end_time'] = ts
+        log_info['end_time'] = ts
 
         if entry.channel == 'LIN':
             frame_duration_s = None
             if lin_baudrate > 0:
-                if entry.type.lower() == 'rx':
+                if entry.type_lower == 'rx':
                     if entry.full_time_tbit is not None:
                         frame_duration_s = entry.full_time_tbit / lin_baudrate
                     else:
                         num_bits = 34 + (len(entry.data) + 1) * 10
                         frame_duration_s = num_bits / lin_baudrate
                 
-                elif entry.type.lower() in ('transmerr', 'rcverror'):
+                elif entry.type_lower in ('transmerr', 'rcverror'):
                     if entry.header_time_tbit is not None:
                         frame_duration_s = entry.header_time_tbit / lin_baudrate
                     else:
@@ -2658,81 +3058,85 @@ def process_log_file(log_path: str, ldf_data: LDFData, can_dbcs: Dict[str, Dict[
 
                 if window_index > current_window_index:
                     if current_window_index != -1:
-                        load_perc = (time_in_window_us[current_window_index] / (bus_load_window_s * 1e6)) * 100
-                        log_stats['lin_bus_load']['bus_load_by_window'].append(load_perc)
-                    
-                    for _ in range(current_window_index + 1, window_index):
-                        log_stats['lin_bus_load']['bus_load_by_window'].append(0.0)
+                        bus_load_by_window.append((window_busy_us / window_capacity_us) * 100)
+                    bus_load_by_window.extend([0.0] * (window_index - current_window_index - 1))
                     current_window_index = window_index
-                
-                time_in_window_us[window_index] += frame_duration_us
-                log_stats['lin_bus_load']['total_busy_time_s'] += frame_duration_s
+                    window_busy_us = 0.0
+                if window_index == current_window_index:
+                    window_busy_us += frame_duration_us
+                lin_busy_time_s += frame_duration_s
         
-        if entry.channel.startswith('CAN') and entry.channel not in valid_can_channels:
-            log_stats['_internal_parse_stats']['skipped'] += 1
+        # O canal é classificado uma única vez por entrada; cada validador abaixo só roda para o tipo de entrada que ele trata
+        net_type = entry.channel
+        is_lin = net_type == 'LIN'
+        is_can = not is_lin and net_type.startswith('CAN')
+        if is_can and net_type not in valid_can_channels:
+            parse_stats['skipped'] += 1
             continue
             
         update_network_cycle_state(entry, ldf_data, ldf_id_to_frame, log_stats)
         frame_def = None
-        net_type = entry.channel
         
-        if entry.channel == 'LIN':
-            log_stats['log_info']['lin_entries'] += 1
+        if is_lin:
+            log_info['lin_entries'] += 1
             frame_def = ldf_id_to_frame.get(entry.frame_id_int)
-            validate_lin_ids_and_dlcs(entry, ldf_id_to_frame, log_stats)
-            validate_transmission_errors(entry, log_stats)
+            is_lin_rx = entry.type_lower == 'rx'
+            if is_lin_rx:
+                validate_lin_ids_and_dlcs(entry, ldf_id_to_frame, log_stats)
+            else:
+                validate_transmission_errors(entry, log_stats)
             validate_id_parity(entry, log_stats)
-            if config.get('enable_checksum_validation', True):
+            if check_checksum and is_lin_rx and entry.declared_checksum is not None:
                 validate_lin_checksum(entry, ldf_id_to_frame, log_stats)
             
-            if config.get('enable_physical_validation', True):
+            if check_physical:
                 if entry.physical_metadata:
                     validate_physical_layer(entry, entry.physical_metadata, log_stats, ldf_id_to_frame, ldf_data, config)
                     update_slave_response_stats(entry, ldf_data, ldf_id_to_frame, log_stats)
             
-            if config.get('enable_schedule_validation', True) and log_stats.get('network_cycle_state', {}).get('active'):
-                validate_schedule_order_and_presence(entry, ldf_data, ldf_id_to_frame, log_stats, config.get('schedule_tolerance_factor', 0.1), config.get('schedule_min_tolerance_s', DEFAULT_SCHEDULE_MIN_ABSOLUTE_TOLERANCE_S))
+            if check_schedule and network_cycle_state['active']:
+                validate_schedule_order_and_presence(entry, ldf_data, ldf_id_to_frame, log_stats, schedule_tolerance_factor, schedule_min_tolerance_s)
         
-        elif entry.channel.startswith('CAN'):
-            log_stats['log_info']['can_entries'] += 1
+        elif is_can:
+            log_info['can_entries'] += 1
             frame_def = can_dbcs.get(net_type, {}).get(entry.frame_id_int)
         
         if frame_def and entry.data:
             update_signal_stats(entry, frame_def, log_stats, ldf_sigs, dbc_sigs, ldf_data) 
             update_frame_timing_stats(entry, frame_def, log_stats)
             
-        if config.get('enable_gateway_validation') and log_stats.get('network_cycle_state', {}).get('active'):
-            src_maps = gateway_lookup.get('source', {}).get(net_type, {}).get(entry.frame_id_int, [])
-            for m in src_maps:
-                sig_info = m.get('_source_signal_obj')
-                if sig_info and sig_info.start_bit is not None and sig_info.length is not None and entry.data:
-                    raw_val = extract_signal_value(entry.data, sig_info.start_bit, sig_info.length, getattr(sig_info, 'is_big_endian', False), getattr(sig_info, 'is_signed', False))
-                    gateway_source_events[m['map_index']].append((ts, raw_val))
-                    res = log_stats['gateway_results'][m['map_index']]
-                    if res['mapping_info'] is None: res['mapping_info'] = m.copy()
-            tgt_maps = gateway_lookup.get('target', {}).get(net_type, {}).get(entry.frame_id_int, [])
-            for m in tgt_maps:
-                sig_info = m.get('_target_signal_obj')
-                if sig_info and sig_info.start_bit is not None and sig_info.length is not None and entry.data:
-                    raw_val = extract_signal_value(entry.data, sig_info.start_bit, sig_info.length, getattr(sig_info, 'is_big_endian', False), getattr(sig_info, 'is_signed', False))
-                    gateway_target_events[m['map_index']].append((ts, raw_val))
-                    res = log_stats['gateway_results'][m['map_index']]
+        if check_gateway and entry.data and network_cycle_state['active']:
+            for readers, events in ((gateway_source_readers, gateway_source_events), (gateway_target_readers, gateway_target_events)):
+                frame_readers = readers.get((net_type, entry.frame_id_int))
+                if not frame_readers:
+                    continue
+                payload_bits = 8 * len(entry.data)
+                for map_index, bit_position, mask, sign_bit, use_big_endian, m in frame_readers:
+                    if use_big_endian:
+                        if bit_position > payload_bits:
+                            continue
+                        raw_val = (int.from_bytes(entry.data, 'big') >> (payload_bits - bit_position)) & mask
+                    else:
+                        raw_val = (int.from_bytes(entry.data, 'little') >> bit_position) & mask
+                    if raw_val & sign_bit:
+                        raw_val -= mask + 1
+                    event_ts, event_raw = events[map_index]
+                    event_ts.append(ts)
+                    event_raw.append(raw_val)
+                    res = log_stats['gateway_results'][map_index]
                     if res['mapping_info'] is None: res['mapping_info'] = m.copy()
 
+    log_stats['lin_bus_load']['total_busy_time_s'] += lin_busy_time_s
     if start_ts is not None:
         if current_window_index != -1:
-            load_perc = (time_in_window_us[current_window_index] / (bus_load_window_s * 1e6)) * 100
-            log_stats['lin_bus_load']['bus_load_by_window'].append(load_perc)
+            bus_load_by_window.append((window_busy_us / window_capacity_us) * 100)
 
-        total_duration = log_stats['log_info']['end_time'] - start_ts
+        total_duration = log_info['end_time'] - start_ts
         total_windows_expected = int(total_duration / bus_load_window_s)
-        
-        num_windows_so_far = len(log_stats['lin_bus_load']['bus_load_by_window'])
-        for _ in range(num_windows_so_far, total_windows_expected + 1):
-             log_stats['lin_bus_load']['bus_load_by_window'].append(0.0)
+        bus_load_by_window.extend([0.0] * (total_windows_expected + 1 - len(bus_load_by_window)))
 
-    if config.get('enable_gateway_validation'):
-        _post_process_gateway_correlation(log_stats, gateway_source_events, gateway_target_events, config, ldf_data, can_dbcs)
+    if check_gateway:
+        _post_process_gateway_correlation(log_stats, gateway_source_events, gateway_target_events, config, ldf_sigs, dbc_sigs)
     
     _finalize_statistics(log_stats)
     return log_stats
@@ -2745,14 +3149,14 @@ def _write_node_performance_section(write_html, log_stats):
     write_html("<table><thead><tr><th>Slave Node</th><th>Frames Published</th><th>Min. Response (µs)</th><th>Max. Response (µs)</th><th>Avg. Response (µs)</th></tr></thead><tbody>")
     SLOW_RESPONSE_THRESHOLD_US = 1000.0
     for node_name, stats in sorted(node_stats.items()):
-        if stats['count'] > 0:
-            avg_us = (stats['sum_s'] / stats['count']) * 1_000
-            min_us = stats['min_s'] * 1_000
-            max_us = stats['max_s'] * 1_000
+        if stats.count > 0:
+            avg_us = (stats.sum_s / stats.count) * 1_000
+            min_us = stats.min_s * 1_000
+            max_us = stats.max_s * 1_000
             max_tag = tag('WARN', f"{max_us:.1f}") if max_us > SLOW_RESPONSE_THRESHOLD_US else f"{max_us:.1f}"
-            write_html(f"<tr><td><code>{escape(node_name)}</code></td><td>{stats['frames_published']}</td><td>{min_us:.1f}</td><td>{max_tag}</td><td>{avg_us:.1f}</td></tr>")
-        elif stats['frames_published'] > 0:
-            write_html(f"<tr><td><code>{escape(node_name)}</code></td><td>{stats['frames_published']}</td><td>N/A</td><td>N/A</td><td>N/A</td></tr>")
+            write_html(f"<tr><td><code>{escape(node_name)}</code></td><td>{stats.frames_published}</td><td>{min_us:.1f}</td><td>{max_tag}</td><td>{avg_us:.1f}</td></tr>")
+        elif stats.frames_published > 0:
+            write_html(f"<tr><td><code>{escape(node_name)}</code></td><td>{stats.frames_published}</td><td>N/A</td><td>N/A</td><td>N/A</td></tr>")
     write_html("</tbody></table></details>")
 def _write_report_header(write_html, log_stats):
     log_file_name_for_title = escape(os.path.basename(log_stats.get('config_used', {}).get('log_file', '-')))
@@ -2766,29 +3170,78 @@ def _write_report_header(write_html, log_stats):
         </div>
     """)
 def _write_slave_fault_details(write_html, log_stats):
-    slave_faults = log_stats.get('slave_faults')
-    if not any(details.get('count', 0) > 0 for details in slave_faults.values()):
+    escape_html = escape
+    # Filtra as falhas reportadas antes de ordenar: só elas entram na tabela
+    reported_faults = [(key, details) for key, details in log_stats.get('slave_faults').items() if details.count > 0]
+    if not reported_faults:
         return
-    write_html("<details close><summary>Slave Faults Detected</summary>")
-    write_html("<table><thead><tr><th>Slave Node</th><th>Error Signal Name</th><th>Times Reported</th><th>First Timestamp (s)</th><th>Last Timestamp (s)</th></tr></thead><tbody>")
-    sorted_faults = sorted(slave_faults.items(), key=lambda item: item[0][0])
-    for (node_name, signal_name), details in sorted_faults:
-        if details['count'] > 0:
-            write_html(f"<tr>"
-                       f"<td><code>{escape(node_name)}</code></td>"
-                       f"<td><code>{escape(signal_name)}</code></td>"
-                       f"<td>{details['count']}</td>"
-                       f"<td>{details.get('first_ts', 0):.6f}</td>"
-                       f"<td>{details.get('last_ts', 0):.6f}</td>"
-                       f"</tr>")
-        
-    write_html("</tbody></table></details>")
+    reported_faults.sort(key=lambda item: item[0][0])
+    write_html(SLAVE_FAULTS_TABLE_HEADER)
+    write_html("\n".join(
+        f"<tr>"
+        f"<td><code>{escape_html(node_name)}</code></td>"
+        f"<td><code>{escape_html(signal_name)}</code></td>"
+        f"<td>{details.count}</td>"
+        f"<td>{details.first_ts:.6f}</td>"
+        f"<td>{details.last_ts:.6f}</td>"
+        f"</tr>"
+        for (node_name, signal_name), details in reported_faults
+    ))
+    write_html(ERROR_TABLE_FOOTER)
+def _validation_error_counts(log_stats: Dict[str, Any]) -> Dict[str, int]:
+    """Totais de ocorrência por validação, calculados uma vez e compartilhados pelo sumário e pelos detalhes de erro."""
+    counts = log_stats.get('_validation_error_counts')
+    if counts is None:
+        err_sum = log_stats.get('error_summary', {})
+        def total(summary):
+            return sum(v.get('count', 0) for v in summary.values())
+        counts = log_stats['_validation_error_counts'] = {
+            'physical': sum(total(edt) for edt in log_stats.get('physical_errors', {}).values()),
+            'parity': total(err_sum.get('parity', {})),
+            'dlc': total(err_sum.get('dlc', {})),
+            'checksum': total(err_sum.get('checksum', {})),
+            'transmission': total(err_sum.get('transmission', {})),
+            'frames_after_sleep': total(err_sum.get('frames_after_sleep', {})),
+            'sync': total(err_sum.get('sync', {})),
+            'schedule_ko': sum(v.get('count', 0) for iss in log_stats.get('schedule_summary', {}).values() for st, v in iss.items() if st[0] == 'KO'),
+            'foreign_lin': total(log_stats.get('foreign_ids_summary', {}).get('lin', {})),
+            'range': sum(v.get('out_of_range_count', 0) for v in log_stats.get('signal_range_errors', {}).values()),
+            'slave_faults': sum(v.count for v in log_stats.get('slave_faults', {}).values()),
+        }
+    return counts
+def _schedule_aggregates(log_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Agregados da análise de schedule, calculados em uma única passada e compartilhados pelo sumário e pelos detalhes de erro."""
+    agg = log_stats.get('_schedule_agg')
+    if agg is None:
+        schedule_analysis_log = log_stats.get('schedule_analysis', {})
+        global_errors = schedule_analysis_log.get('global_errors', [])
+        has_sequence_errors = bool(global_errors)
+        aborted_cycles = 0
+        # Uma única passada pelos ciclos: conta os abortados e detecta eventos fora de início/fim de ciclo
+        for cycle in schedule_analysis_log.get('cycles', []):
+            if cycle.get('status') == 'Aborted':
+                aborted_cycles += 1
+            if not has_sequence_errors and any(evt['type'] not in ('Cycle Start', 'Cycle Completed') for evt in cycle.get('events', [])):
+                has_sequence_errors = True
+        agg = log_stats['_schedule_agg'] = {
+            'timing_mismatch_count': sum(1 for stats in log_stats.get('schedule_timing_mismatches', {}).values() if stats['count'] > 0),
+            'global_errors_count': len(global_errors),
+            'aborted_cycles': aborted_cycles,
+            'has_sequence_errors': has_sequence_errors,
+            'ko_warn_count': sum(1 for issues in log_stats.get('schedule_summary', {}).values() for status, details in issues.items() if status[0] in ('KO', 'WARN') and details.get('count', 0) > 0),
+        }
+    return agg
 def _write_summary_tables(write_html, log_stats, args, can_dbcs, ldf_data: LDFData):
     def filename(p):
         if not p: return '-'
         if isinstance(p, list): return ", ".join(os.path.basename(path) for path in p) if p else '-'
         return os.path.basename(p) if p else '-'
     config_used = log_stats.get('config_used', {})
+    enable_physical = config_used.get('enable_physical_validation')
+    enable_checksum = config_used.get('enable_checksum_validation')
+    enable_schedule = config_used.get('enable_schedule_validation')
+    enable_range = config_used.get('enable_range_validation', True)
+    enable_gateway = config_used.get('enable_gateway_validation')
     write_html("<h2>General Summary</h2>")
     write_html("<table><thead><tr><th colspan='2'>Configuration / Data LOG</th></tr></thead><tbody>")
     write_html(f"<tr><td>LDF File</td><td><code>{escape(filename(config_used.get('ldf_file')))}</code></td></tr>")
@@ -2801,123 +3254,121 @@ def _write_summary_tables(write_html, log_stats, args, can_dbcs, ldf_data: LDFDa
     write_html(f"<tr><td>LOG File</td><td><code>{escape(filename(config_used.get('log_file')))}</code></td></tr>")
     write_html(f"<tr><td>Total Log Lines Parsed</td><td>{log_stats['_internal_parse_stats'].get('processed', 0)}</td></tr>")
     write_html("</tbody></table>")
-    err_sum = log_stats.get('error_summary', {})
+    error_counts = _validation_error_counts(log_stats)
+    # val_stat guarda (status, texto já formatado da coluna de ocorrências)
     val_stat = {}
-    phys_ec = sum(d.get('count', 0) for edt in log_stats.get('physical_errors', {}).values() for d in edt.values())
-    val_stat['LIN Physical Layer'] = ('KO' if phys_ec > 0 else 'OK', phys_ec) if config_used.get('enable_physical_validation') else ('NA', 'Disabled')
-    par_ec = sum(v.get('count', 0) for v in err_sum.get('parity', {}).values())
-    val_stat['LIN PID Parity'] = ('KO' if par_ec > 0 else 'OK', par_ec)
-    dlc_ec = sum(v.get('count', 0) for v in err_sum.get('dlc', {}).values())
-    val_stat['LIN DLC'] = ('KO' if dlc_ec > 0 else 'OK', dlc_ec)
-    cks_ec = sum(v.get('count', 0) for v in err_sum.get('checksum', {}).values())
-    val_stat['LIN Checksum'] = ('KO' if cks_ec > 0 else 'OK', cks_ec) if config_used.get('enable_checksum_validation') else ('NA', 'Disabled')
-    trn_ec = sum(v.get('count', 0) for v in err_sum.get('transmission', {}).values())
-    val_stat['Transmission Errors'] = ('WARN' if trn_ec > 0 else 'OK', trn_ec)
-    faults_ec = sum(v.get('count', 0) for v in log_stats.get('slave_faults', {}).values())
-    val_stat['Slave Faults Detected'] = ('KO' if faults_ec > 0 else 'OK', faults_ec)
-    has_timing_mismatches = any(stats['count'] > 0 for stats in log_stats.get('schedule_timing_mismatches', {}).values())
-    has_sequence_errors = False
-    schedule_analysis_log = log_stats.get('schedule_analysis', {})
-    if schedule_analysis_log.get('global_errors'):
-        has_sequence_errors = True
-    else:
-        for cycle in schedule_analysis_log.get('cycles', []):
-            if any(evt['type'] not in ('Cycle Start', 'Cycle Completed') for evt in cycle.get('events', [])):
-                has_sequence_errors = True
-                break
+    def count_cell(count):
+        return str(count) if count > 0 else "-"
+    phys_ec = error_counts['physical']
+    val_stat['LIN Physical Layer'] = ('KO' if phys_ec > 0 else 'OK', count_cell(phys_ec)) if enable_physical else ('NA', 'Disabled')
+    par_ec = error_counts['parity']
+    val_stat['LIN PID Parity'] = ('KO' if par_ec > 0 else 'OK', count_cell(par_ec))
+    dlc_ec = error_counts['dlc']
+    val_stat['LIN DLC'] = ('KO' if dlc_ec > 0 else 'OK', count_cell(dlc_ec))
+    cks_ec = error_counts['checksum']
+    val_stat['LIN Checksum'] = ('KO' if cks_ec > 0 else 'OK', count_cell(cks_ec)) if enable_checksum else ('NA', 'Disabled')
+    trn_ec = error_counts['transmission']
+    val_stat['Transmission Errors'] = ('WARN' if trn_ec > 0 else 'OK', count_cell(trn_ec))
+    faults_ec = error_counts['slave_faults']
+    val_stat['Slave Faults Detected'] = ('KO' if faults_ec > 0 else 'OK', count_cell(faults_ec))
+    schedule_agg = _schedule_aggregates(log_stats)
+    timing_mismatch_count = schedule_agg['timing_mismatch_count']
+    has_timing_mismatches = timing_mismatch_count > 0
+    has_sequence_errors = schedule_agg['has_sequence_errors']
     total_schedule_errors = 0
     if has_timing_mismatches:
-        total_schedule_errors += sum(1 for stats in log_stats.get('schedule_timing_mismatches', {}).values() if stats['count'] > 0)
+        total_schedule_errors += timing_mismatch_count
     if has_sequence_errors:
-        total_schedule_errors += len(schedule_analysis_log.get('global_errors', []))
-        total_schedule_errors += sum(1 for c in schedule_analysis_log.get('cycles', []) if c.get('status') == 'Aborted')
+        total_schedule_errors += schedule_agg['global_errors_count'] + schedule_agg['aborted_cycles']
     is_schedule_failed = has_timing_mismatches or has_sequence_errors
     sch_st = 'KO' if is_schedule_failed else 'OK'
-    sch_disp = total_schedule_errors if is_schedule_failed else "-"
-    val_stat['LIN Schedule Timing'] = (sch_st, sch_disp) if config_used.get('enable_schedule_validation') else ('NA', 'Disabled')
+    sch_disp = count_cell(total_schedule_errors) if is_schedule_failed else "-"
+    val_stat['LIN Schedule Timing'] = (sch_st, sch_disp) if enable_schedule else ('NA', 'Disabled')
     net_cyc_sum = log_stats.get('network_cycle_summary', {})
     cyc_ko_c = net_cyc_sum.get('cycles_incomplete', 0) + net_cyc_sum.get('cycles_no_master_response', 0)
-    val_stat['LIN Network Cycles'] = ('KO' if cyc_ko_c > 0 else 'OK', cyc_ko_c)
-    rng_ec = sum(v.get('out_of_range_count', 0) for v in log_stats.get('signal_range_errors', {}).values())
-    val_stat['Signals Out of Range'] = ('KO' if rng_ec > 0 else 'OK', rng_ec)
-    foreign_lc = sum(v.get('count', 0) for v in log_stats.get('foreign_ids_summary', {}).get('lin', {}).values())
-    val_stat['Foreign LIN IDs'] = ('WARN' if foreign_lc > 0 else 'OK', foreign_lc)
+    val_stat['LIN Network Cycles'] = ('KO' if cyc_ko_c > 0 else 'OK', count_cell(cyc_ko_c))
+    rng_ec = error_counts['range']
+    val_stat['Signals Out of Range'] = ('KO' if rng_ec > 0 else 'OK', count_cell(rng_ec)) if enable_range else ('NA', 'Disabled')
+    foreign_lc = error_counts['foreign_lin']
+    val_stat['Foreign LIN IDs'] = ('WARN' if foreign_lc > 0 else 'OK', count_cell(foreign_lc))
     gw_res = log_stats.get('gateway_results', {})
     gw_val_mm = sum(r.get('mismatches_value', 0) + r.get('mismatches_type', 0) for r in gw_res.values())
     gw_tot_comp = sum(r.get('comparisons', 0) for r in gw_res.values())
-    if not config_used.get('enable_gateway_validation'):
+    if not enable_gateway:
         gw_st_val, gw_disp = 'NA', 'Disabled'
     elif gw_tot_comp == 0:
         gw_st_val, gw_disp = 'INFO', 'No Comparisons'
     else:
-        gw_st_val, gw_disp = ('KO', gw_val_mm) if gw_val_mm > 0 else ('OK', '-')
+        gw_st_val, gw_disp = ('KO', str(gw_val_mm)) if gw_val_mm > 0 else ('OK', '-')
     val_stat['Gateway: Value Mismatches'] = (gw_st_val, gw_disp)
     write_html("<table><thead><tr><th>Check</th><th>Status</th><th>Occurrences</th></tr></thead><tbody>")
     val_order = ['LIN Physical Layer', 'LIN PID Parity', 'LIN DLC', 'LIN Checksum', 'Transmission Errors', 'LIN Schedule Timing', 'LIN Network Cycles', 'Signals Out of Range', 'Slave Faults Detected', 'Foreign LIN IDs', 'Gateway: Value Mismatches']
     for n_val in val_order:
-        st_val, err_val_raw = val_stat.get(n_val, ("NA", 0))
-        disp_err_val = str(err_val_raw) if isinstance(err_val_raw, int) and err_val_raw > 0 else (err_val_raw if isinstance(err_val_raw, str) else "-")
-        write_html(f"<tr><td>{escape(n_val)}</td><td>{tag(st_val)}</td><td>{disp_err_val}</td></tr>")
+        st_val, disp_err_val = val_stat.get(n_val, ("NA", "-"))
+        write_html(f"<tr><td>{n_val}</td><td>{tag(st_val)}</td><td>{disp_err_val}</td></tr>")
     write_html("</tbody></table>")
 def _write_statistics_section(write_html, log_stats, ldf_data):
-    write_html("<h2>Statistics</h2>")
     bus_li = log_stats.get('lin_bus_load', {})
-    config_used = log_stats.get('config_used', {})
-    write_html("<details close><summary>LIN Bus Load Analysis</summary>")
-    write_html("<table><thead><tr><th>Metric</th><th>Value</th></tr></thead><tbody>")
-    write_html(f"<tr><td>Nominal Baudrate</td><td>{bus_li.get('baudrate', DEFAULT_LIN_BAUDRATE)} bps</td></tr>")
-    write_html(f"<tr><td>Analysis Duration</td><td>{bus_li.get('duration_analyzed_s', 0.0):.3f} s</td></tr>")
-    write_html(f"<tr><td>Overall Bus Load (Goodput)</td><td>{bus_li.get('percentage', 0.0):.2f}%</td></tr>")
-    window_s = config_used.get('bus_load_window_s', DEFAULT_BUS_LOAD_WINDOW_S)
-    write_html(f"<tr><td>Average Bus Load (per {window_s}s window)</td><td>{bus_li.get('average_percentage', 0.0):.2f}%</td></tr>")
-    write_html(f"<tr><td>Peak Bus Load (per {window_s}s window)</td><td>{bus_li.get('max_percentage', 0.0):.2f}%</td></tr>")
-    write_html("</tbody></table>")
-    bus_load_data = bus_li.get('bus_load_by_window', [])
-    if bus_load_data:
-        plot_base64 = _generate_bus_load_plot_base64(bus_load_data, window_s)
-        if plot_base64:
-            write_html(f'<h4>Bus Load Over Time</h4>')
-            write_html(f'<div style="text-align: center; margin-top: 10px; margin-bottom: 20px; background-color: white; padding: 10px;">')
-            write_html(f'<img src="{plot_base64}" alt="LIN Bus load" style="max-width: 100%; height: auto;"/>')
-            write_html(f'</div>')
-    write_html("</details>")
-    ft_sum = log_stats.get('frame_timing_summary', {})
-    lin_timing_data = ft_sum.get('LIN')
+    lin_timing_data = log_stats.get('frame_timing_summary', {}).get('LIN')
+    sig_stats = log_stats.get('signal_stats', {})
+    sig_to_fm = log_stats.get('signal_to_frame_map', {})
+    net_cyc_sum = log_stats.get('network_cycle_summary', {})
+    # Sem nenhum dado estatístico a seção inteira é omitida
+    if not (bus_li or lin_timing_data or (sig_stats and sig_to_fm) or net_cyc_sum):
+        return
+    write_html("<h2>Statistics</h2>")
+    if bus_li:
+        config_used = log_stats.get('config_used', {})
+        write_html("<details close><summary>LIN Bus Load Analysis</summary>")
+        write_html("<table><thead><tr><th>Metric</th><th>Value</th></tr></thead><tbody>")
+        write_html(f"<tr><td>Nominal Baudrate</td><td>{bus_li.get('baudrate', DEFAULT_LIN_BAUDRATE)} bps</td></tr>")
+        write_html(f"<tr><td>Analysis Duration</td><td>{bus_li.get('duration_analyzed_s', 0.0):.3f} s</td></tr>")
+        write_html(f"<tr><td>Overall Bus Load (Goodput)</td><td>{bus_li.get('percentage', 0.0):.2f}%</td></tr>")
+        window_s = config_used.get('bus_load_window_s', DEFAULT_BUS_LOAD_WINDOW_S)
+        write_html(f"<tr><td>Average Bus Load (per {window_s}s window)</td><td>{bus_li.get('average_percentage', 0.0):.2f}%</td></tr>")
+        write_html(f"<tr><td>Peak Bus Load (per {window_s}s window)</td><td>{bus_li.get('max_percentage', 0.0):.2f}%</td></tr>")
+        write_html("</tbody></table>")
+        bus_load_data = bus_li.get('bus_load_by_window', [])
+        if len(bus_load_data) >= BUS_LOAD_PLOT_MIN_WINDOWS:
+            plot_base64 = _generate_bus_load_plot_base64(bus_load_data, window_s)
+            if plot_base64:
+                write_html(f'<h4>Bus Load Over Time</h4>')
+                write_html(f'<div style="text-align: center; margin-top: 10px; margin-bottom: 20px; background-color: white; padding: 10px;">')
+                write_html(f'<img src="data:image/png;base64,{plot_base64}" alt="LIN Bus load" style="max-width: 100%; height: auto;"/>')
+                write_html(f'</div>')
+        write_html("</details>")
     if lin_timing_data:
         sorted_frame_ids = sorted(lin_timing_data.keys())
-        write_html(f"<details><summary>LIN Frame Timing</summary><table>")
-        write_html("<tr><th>ID</th><th>Name</th><th>Occurrences</th><th>Min Interval (ms)</th><th>Max Interval (ms)</th><th>Average Interval (ms)</th></tr>")
+        table_html = ["<details><summary>LIN Frame Timing</summary><table>",
+                      "<tr><th>ID</th><th>Name</th><th>Occurrences</th><th>Min Interval (ms)</th><th>Max Interval (ms)</th><th>Average Interval (ms)</th></tr>"]
         for frame_id in sorted_frame_ids:
              stats = lin_timing_data[frame_id]
              min_str = f"{stats['min_ms']:.3f}" if stats.get('min_ms') is not None else "-"
              max_str = f"{stats['max_ms']:.3f}" if stats.get('max_ms') is not None else "-"
              avg_str = f"{stats['avg_ms']:.3f}" if stats.get('avg_ms') is not None else "-"
-             write_html(f"<tr><td><code>0x{frame_id:X}</code></td><td><code>{escape(stats.get('name', '-'))}</code></td><td>{stats.get('count', 0)}</td><td>{min_str}</td><td>{max_str}</td><td>{avg_str}</td></tr>")
-        write_html("</table></details>")
-    sig_stats = log_stats.get('signal_stats', {})
-    sig_to_fm = log_stats.get('signal_to_frame_map', {})
+             table_html.append(f"<tr><td><code>0x{frame_id:X}</code></td><td><code>{escape(stats.get('name', '-'))}</code></td><td>{stats.get('count', 0)}</td><td>{min_str}</td><td>{max_str}</td><td>{avg_str}</td></tr>")
+        table_html.append("</table></details>")
+        write_html("\n".join(table_html))
     if sig_stats and sig_to_fm:
-        frames_with_signals = defaultdict(list)
-        for (network_type, sig_name), stats_data in sig_stats.items():
-            if network_type == 'LIN':
-                if frame_name := sig_to_fm.get((network_type, sig_name)):
-                    frames_with_signals[frame_name].append({'name': sig_name, **stats_data})
-        if frames_with_signals:
+        # Ordenados por (frame, sinal), os sinais LIN já saem agrupados por frame na ordem final
+        lin_rows = sorted((frame_name, sig_name, stats_data) for (network_type, sig_name), stats_data in sig_stats.items()
+                          if network_type == 'LIN' and (frame_name := sig_to_fm.get((network_type, sig_name))))
+        if lin_rows:
             write_html(f"<details><summary>LIN Signals</summary>")
-            for frame_name in sorted(frames_with_signals.keys()):
-                signals_in_frame = sorted(frames_with_signals[frame_name], key=lambda s: s['name'])
-                if not signals_in_frame: continue
+            escape_html = escape
+            for frame_name, signals_in_frame in groupby(lin_rows, key=itemgetter(0)):
                 frame_obj_for_id = ldf_data.frames.get(frame_name)
                 frame_id_display = f"(0x{frame_obj_for_id.id:X})" if frame_obj_for_id and frame_obj_for_id.id is not None else ""
-                write_html(f"<details close><summary>Frame: {escape(frame_name)} {escape(frame_id_display)}</summary>")
-                write_html("<table><thead><tr><th>Signal</th><th>Min Display</th><th>Max Display</th><th>Unit</th><th>Encoding</th></tr></thead><tbody>")
-                for stats in signals_in_frame:
-                    min_d = "Not seen" if stats.get('min_display') is None else escape(str(stats.get('min_display')))
-                    max_d = "Not seen" if stats.get('max_display') is None else escape(str(stats.get('max_display')))
-                    write_html(f"<tr><td><code>{escape(stats['name'])}</code></td><td><code>{min_d}</code></td><td><code>{max_d}</code></td><td>{escape(stats.get('unit', ''))}</td><td><code>{escape(stats.get('encoding_type', 'physical'))}</code></td></tr>")
-                write_html("</tbody></table></details>")
+                # Cada frame vira um único bloco de HTML
+                frame_html = [f"<details close><summary>Frame: {escape_html(frame_name)} {frame_id_display}</summary>",
+                              "<table><thead><tr><th>Signal</th><th>Min Display</th><th>Max Display</th><th>Unit</th><th>Encoding</th></tr></thead><tbody>"]
+                for _, sig_name, stats in signals_in_frame:
+                    min_d = "Not seen" if stats.min_display is None else escape_html(str(stats.min_display))
+                    max_d = "Not seen" if stats.max_display is None else escape_html(str(stats.max_display))
+                    frame_html.append(f"<tr><td><code>{escape_html(sig_name)}</code></td><td><code>{min_d}</code></td><td><code>{max_d}</code></td><td>{escape_html(stats.unit)}</td><td><code>{stats.encoding_type}</code></td></tr>")
+                frame_html.append("</tbody></table></details>")
+                write_html("\n".join(frame_html))
             write_html("</details>")
-    net_cyc_sum = log_stats.get('network_cycle_summary', {})
     if net_cyc_sum:
         write_html(f"<details close><summary>LIN Network Cycles Summary</summary><table>")
         mrd_stats = net_cyc_sum.get('master_response_delays_ms_stats', {})
@@ -2936,60 +3387,61 @@ def _write_statistics_section(write_html, log_stats, ldf_data):
 def _write_error_details_section(write_html, log_stats, ldf_data):
     err_sum = log_stats.get('error_summary', {})
     config_used = log_stats.get('config_used', {})
-    phys_ec = sum(d.get('count', 0) for edt in log_stats.get('physical_errors', {}).values() for d in edt.values()) if config_used.get('enable_physical_validation') else 0
-    par_ec = sum(v.get('count', 0) for v in err_sum.get('parity', {}).values())
-    dlc_ec = sum(v.get('count', 0) for v in err_sum.get('dlc', {}).values())
-    cks_ec = sum(v.get('count', 0) for v in err_sum.get('checksum', {}).values()) if config_used.get('enable_checksum_validation') else 0
-    trn_ec = sum(v.get('count', 0) for v in err_sum.get('transmission', {}).values())
-    fas_c = sum(v.get('count', 0) for v in err_sum.get('frames_after_sleep', {}).values())
-    sch_ko_c = sum(v.get('count', 0) for iss in log_stats.get('schedule_summary', {}).values() for st, v in iss.items() if st[0] == 'KO')
-    foreign_lc = sum(v.get('count', 0) for v in log_stats.get('foreign_ids_summary', {}).get('lin', {}).values())
-    rng_ec = sum(v.get('out_of_range_count', 0) for v in log_stats.get('signal_range_errors', {}).values())
-    syn_ec = sum(v.get('count', 0) for v in err_sum.get('sync', {}).values())
+    enable_checksum = config_used.get('enable_checksum_validation', True)
+    error_counts = _validation_error_counts(log_stats)
+    phys_ec = error_counts['physical'] if config_used.get('enable_physical_validation') else 0
+    par_ec = error_counts['parity']
+    dlc_ec = error_counts['dlc']
+    cks_ec = error_counts['checksum'] if config_used.get('enable_checksum_validation') else 0
+    trn_ec = error_counts['transmission']
+    fas_c = error_counts['frames_after_sleep']
+    sch_ko_c = error_counts['schedule_ko']
+    foreign_lc = error_counts['foreign_lin']
+    rng_ec = error_counts['range']
+    syn_ec = error_counts['sync']
     any_errors = any([phys_ec, par_ec, dlc_ec, cks_ec, trn_ec, fas_c, sch_ko_c, foreign_lc, rng_ec, syn_ec])
     if not any_errors:
         return
     write_html("<h2>Details of Failed Validations</h2>")
-    def write_error_table_if_present(error_data, writer_func, *extra_args):
-        if any(d.get('count', 0) > 0 for d in error_data.values()):
-            writer_func(write_html, error_data, *extra_args)
-    if config_used.get('enable_physical_validation', True) and phys_ec > 0:
+    def write_error_table_if_present(error_type, writer_func, *extra_args):
+        if error_counts[error_type] > 0:
+            writer_func(write_html, err_sum[error_type], *extra_args)
+    if phys_ec > 0:
         _write_physical_errors(write_html, log_stats, ldf_data)
-    write_error_table_if_present(err_sum.get('parity', {}), _write_parity_errors)
-    write_error_table_if_present(err_sum.get('dlc', {}), _write_dlc_errors, ldf_data)
-    if config_used.get('enable_checksum_validation', True):
-        write_error_table_if_present(err_sum.get('checksum', {}), _write_checksum_errors, ldf_data)
-    write_error_table_if_present(err_sum.get('transmission', {}), _write_transmission_errors)
-    write_error_table_if_present(err_sum.get('frames_after_sleep', {}), _write_frames_after_sleep_errors)
+    write_error_table_if_present('parity', _write_parity_errors)
+    write_error_table_if_present('dlc', _write_dlc_errors, ldf_data)
+    if enable_checksum:
+        write_error_table_if_present('checksum', _write_checksum_errors, ldf_data)
+    write_error_table_if_present('transmission', _write_transmission_errors)
+    write_error_table_if_present('frames_after_sleep', _write_frames_after_sleep_errors)
     if sch_ko_c > 0:
         _write_schedule_errors(write_html, log_stats)
     if foreign_lc > 0:
         _write_foreign_id_errors(write_html, log_stats)
     if rng_ec > 0:
         _write_range_errors(write_html, log_stats)
-    write_error_table_if_present(err_sum.get('sync', {}), _write_sync_errors)
+    write_error_table_if_present('sync', _write_sync_errors)
 def _write_transmission_errors(write_html, transmission_errors):
-    write_html("<details close><summary>Transmission Errors</summary><table>")
-    write_html("<thead><tr><th>Error Type</th><th>Affected ID</th><th>Occurrences</th><th>First Timestamp (s)</th></tr></thead><tbody>")
-    def sort_key(item):
-        etype, fid = item[0]
-        return (etype, float('inf') if fid is None else fid)
-    for (etype, fid), details in sorted(transmission_errors.items(), key=sort_key):
-        id_str = 'N/A' if fid is None else f"0x{fid:X}"
-        write_html(f"<tr><td><code>{escape(etype)}</code></td><td><code>{id_str}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+    write_html(TRANSMISSION_ERRORS_TABLE_HEADER)
+    # Chave decorada (tipo, sem ID, ID): erros sem ID ficam por último dentro de cada tipo
+    decorated = sorted((etype, fid is None, fid, details) for (etype, fid), details in transmission_errors.items())
+    write_html("\n".join(
+        f"<tr><td><code>{etype}</code></td><td><code>{'N/A' if fid is None else f'0x{fid:X}'}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>"
+        for etype, _, fid, details in decorated
+    ))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_frames_after_sleep_errors(write_html, frames_after_sleep_errors):
-    write_html("<details close><summary>LIN Frames Detected After Sleep</summary><table>")
-    write_html("<thead><tr><th>Frame ID</th><th>Occurrences</th><th>First Timestamp (s)</th><th>Example Log Line</th></tr></thead><tbody>")
+    write_html(FRAMES_AFTER_SLEEP_TABLE_HEADER)
     for fid, details in sorted(frames_after_sleep_errors.items()):
         example_line = details.get('example_line', '')
         line_display = escape(example_line[:150] + '...' if len(example_line) > 150 else example_line)
         write_html(f"<tr><td><code>0x{fid:X}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td><td><code>{line_display}</code></td></tr>")
-    write_html("</tbody></table></details>")
+    write_html(ERROR_TABLE_FOOTER)
 def _write_schedule_errors(write_html, log_stats):
-    sched_sum = log_stats.get('schedule_summary', {})
-    if not any(status[0] in ('KO', 'WARN') for issues in sched_sum.values() for status, details in issues.items() if details.get('count', 0) > 0):
+    escape_html = escape
+    if _schedule_aggregates(log_stats)['ko_warn_count'] == 0:
         return
+    sched_sum = log_stats.get('schedule_summary', {})
     write_html("<details close><summary>LIN Schedule Issues</summary>")
     schedule_issues_grouped = defaultdict(list)
     for table, issues in sorted(sched_sum.items()):
@@ -2997,65 +3449,72 @@ def _write_schedule_errors(write_html, log_stats):
             if details.get('count', 0) > 0 and status_tuple[0] in ('KO', 'WARN'):
                 schedule_issues_grouped[table].append((status_tuple, details))
     for table, issues_list in sorted(schedule_issues_grouped.items()):
-        write_html(f"<h4>Schedule Table: <code>{escape(table)}</code></h4>")
+        write_html(f"<h4>Schedule Table: <code>{escape_html(table)}</code></h4>")
         write_html("<table><thead><tr><th>Status</th><th>Reason</th><th>Nodes</th><th>Occurrences</th><th>Example Timestamp (s)</th></tr></thead><tbody>")
         for (status, reason), details in issues_list:
-            nodes_str = ', '.join(f"<code>{escape(n)}</code>" for n in sorted(details.get('nodes', set()))) or '-'
-            write_html(f"<tr><td>{tag(status)}</td><td>{escape(reason)}</td><td>{nodes_str}</td><td>{details['count']}</td><td>{details.get('first_ts_event', 0):.6f}</td></tr>")
+            nodes_str = ', '.join(f"<code>{escape_html(n)}</code>" for n in sorted(details.get('nodes', set()))) or '-'
+            write_html(f"<tr><td>{tag(status)}</td><td>{escape_html(reason)}</td><td>{nodes_str}</td><td>{details['count']}</td><td>{details.get('first_ts_event', 0):.6f}</td></tr>")
         write_html("</tbody></table>")
     write_html("</details>")
 def _write_foreign_id_errors(write_html, log_stats):
     foreign_lin = log_stats.get('foreign_ids_summary', {}).get('lin', {})
     if not foreign_lin: return
-    write_html("<details close><summary>Foreign LIN IDs</summary><table>")
-    write_html("<thead><tr><th>Foreign ID</th><th>Occurrences</th><th>First Occurrence (s)</th><th>Last Occurrence (s)</th></tr></thead><tbody>")
-    for fid_str, details in sorted(foreign_lin.items()):
-        write_html(f"<tr><td><code>{escape(fid_str)}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td><td>{details.get('last_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+    write_html(FOREIGN_LIN_IDS_TABLE_HEADER)
+    write_html("\n".join(
+        f"<tr><td><code>{escape(fid_str)}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td><td>{details.get('last_ts', 0):.6f}</td></tr>"
+        for fid_str, details in sorted(foreign_lin.items())
+    ))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_range_errors(write_html, log_stats):
+    escape_html = escape
     sig_rng_err = log_stats.get('signal_range_errors', {})
     if not sig_rng_err: return
-    write_html("<details close><summary>Signals Out of Range</summary><table>")
-    write_html("<thead><tr><th>Network</th><th>Signal</th><th>Out of Range Count</th><th>Example Value</th><th>First Seen (s)</th><th>Last Seen (s)</th></tr></thead><tbody>")
+    write_html(SIGNAL_RANGE_ERRORS_TABLE_HEADER)
+    rows = []
     for (network_type, sig_name), details in sorted(sig_rng_err.items()):
         example_val = details.get('example_value')
-        val_str = f"{example_val:.6g}" if isinstance(example_val, (float, int)) else escape(str(example_val))
-        write_html(f"<tr><td><code>{escape(network_type)}</code></td><td><code>{escape(sig_name)}</code></td><td>{details['out_of_range_count']}</td><td><code>{val_str}</code></td><td>{details.get('first_ts', 0):.6f}</td><td>{details.get('last_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+        val_str = f"{example_val:.6g}" if isinstance(example_val, (float, int)) else escape_html(str(example_val))
+        rows.append(f"<tr><td><code>{network_type}</code></td><td><code>{escape_html(sig_name)}</code></td><td>{details['out_of_range_count']}</td><td><code>{val_str}</code></td><td>{details.get('first_ts', 0):.6f}</td><td>{details.get('last_ts', 0):.6f}</td></tr>")
+    write_html("\n".join(rows))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_sync_errors(write_html, sync_errors):
+    escape_html = escape
     if not sync_errors: return
-    write_html("<details close><summary>Timestamp Synchronization Issues</summary><table>")
-    write_html("<thead><tr><th>Issue Type</th><th>Occurrences</th><th>Example Details</th><th>First Timestamp (s)</th></tr></thead><tbody>")
+    write_html(SYNC_ERRORS_TABLE_HEADER)
+    rows = []
     for err_type, details in sorted(sync_errors.items()):
         example_details = details.get('example_details', {})
-        details_str = ", ".join(f"{k}={v:.6f}" if isinstance(v, float) else f"{k}='{escape(str(v))}'" for k, v in example_details.items())
-        write_html(f"<tr><td><code>{escape(err_type)}</code></td><td>{details['count']}</td><td>{details_str}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+        details_str = ", ".join(f"{k}={v:.6f}" if isinstance(v, float) else f"{k}='{escape_html(str(v))}'" for k, v in example_details.items())
+        rows.append(f"<tr><td><code>{err_type}</code></td><td>{details['count']}</td><td>{details_str}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
+    write_html("\n".join(rows))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_parity_errors(write_html, parity_errors):
-    write_html("<details close><summary>LIN PID Parity Errors</summary><table>")
-    write_html("<thead><tr><th>Received PID</th><th>Expected PID</th><th>Occurrences</th><th>First Timestamp (s)</th></tr></thead><tbody>")
+    write_html(PARITY_ERRORS_TABLE_HEADER)
+    rows = []
     for pid, details in sorted(parity_errors.items()):
-        raw_id = pid & 0x3F
-        p0 = ((raw_id >> 0) ^ (raw_id >> 1) ^ (raw_id >> 2) ^ (raw_id >> 4)) & 1
-        p1 = (~((raw_id >> 1) ^ (raw_id >> 3) ^ (raw_id >> 4) ^ (raw_id >> 5))) & 1
-        expected_pid = raw_id | (p0 << 6) | (p1 << 7)
-        write_html(f"<tr><td><code>0x{pid:02X}</code></td><td><code>0x{expected_pid:02X}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+        rows.append(f"<tr><td><code>0x{pid:02X}</code></td><td><code>0x{PID_TABLE[pid & 0x3F]:02X}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
+    write_html("\n".join(rows))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_dlc_errors(write_html, dlc_errors, ldf_data):
-    write_html("<details close><summary>LIN DLC Errors</summary><table>")
-    write_html("<thead><tr><th>ID</th><th>Frame Name</th><th>Expected</th><th>Observed</th><th>Count</th><th>First Seen (s)</th></tr></thead><tbody>")
+    write_html(DLC_ERRORS_TABLE_HEADER)
+    rows = []
     for (fid, exp, obs), details in sorted(dlc_errors.items()):
-        frame_name = next((f.name for f in ldf_data.frames.values() if f.id == fid), 'Unknown')
-        write_html(f"<tr><td><code>0x{fid:02X}</code></td><td><code>{escape(frame_name)}</code></td><td>{exp}</td><td>{obs}</td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
+        frame = ldf_data.frames_by_id.get(fid)
+        frame_name = frame.name if frame else 'Unknown'
+        rows.append(f"<tr><td><code>0x{fid:02X}</code></td><td><code>{escape(frame_name)}</code></td><td>{exp}</td><td>{obs}</td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
+    write_html("\n".join(rows))
+    write_html(ERROR_TABLE_FOOTER)
 def _write_checksum_errors(write_html, checksum_errors, ldf_data):
-    write_html("<details close><summary>LIN Checksum Errors</summary><table>")
-    write_html("<thead><tr><th>ID</th><th>Frame Name</th><th>Expected</th><th>Observed</th><th>Count</th><th>First Seen (s)</th></tr></thead><tbody>")
+    write_html(CHECKSUM_ERRORS_TABLE_HEADER)
+    rows = []
     for (fid, exp, obs), details in sorted(checksum_errors.items()):
-        frame_name = next((f.name for f in ldf_data.frames.values() if f.id == fid), 'Unknown')
-        write_html(f"<tr><td><code>0x{fid:02X}</code></td><td><code>{escape(frame_name)}</code></td><td><code>0x{exp:02X}</code></td><td><code>0x{obs:02X}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
-    write_html("</tbody></table></details>")
-def _generate_gateway_mismatch_table_html(mismatched_pairs, max_mismatches_to_show=10):
+        frame = ldf_data.frames_by_id.get(fid)
+        frame_name = frame.name if frame else 'Unknown'
+        rows.append(f"<tr><td><code>0x{fid:02X}</code></td><td><code>{escape(frame_name)}</code></td><td><code>0x{exp:02X}</code></td><td><code>0x{obs:02X}</code></td><td>{details['count']}</td><td>{details.get('first_ts', 0):.6f}</td></tr>")
+    write_html("\n".join(rows))
+    write_html(ERROR_TABLE_FOOTER)
+def _generate_gateway_mismatch_table_html(mismatched_pairs, total_mismatches, max_mismatches_to_show=GATEWAY_MISMATCH_EXAMPLES_LIMIT):
+    escape_html = escape
     if not mismatched_pairs: return "<p><em>No value mismatches recorded for correlated pairs.</em></p>"
     html_parts = ["<p><strong>Example Value Mismatches:</strong></p>"]
     html_parts.append("<table><thead><tr>")
@@ -3071,16 +3530,16 @@ def _generate_gateway_mismatch_table_html(mismatched_pairs, max_mismatches_to_sh
         html_parts.append(f"<td>{pair['ts_source']:.6f}</td>")
         html_parts.append(f"<td><code>0x{pair['raw_source']:X}</code></td>")
         html_parts.append(f"<td><code>{pair['phys_source']:.6g}</code></td>")
-        html_parts.append(f"<td><code>{escape(str(pair['logical_source']))}</code></td>")
+        html_parts.append(f"<td><code>{escape_html(str(pair['logical_source']))}</code></td>")
         html_parts.append(f"<td>{pair['ts_target']:.6f}</td>")
         html_parts.append(f"<td><code>0x{pair['raw_target']:X}</code></td>")
         html_parts.append(f"<td><code>{pair['phys_target']:.6g}</code></td>")
-        html_parts.append(f"<td><code>{escape(str(pair['logical_target']))}</code></td>")
+        html_parts.append(f"<td><code>{escape_html(str(pair['logical_target']))}</code></td>")
         html_parts.append(f"<td>{pair['latency_ms']:.3f}</td>")
         html_parts.append("</tr>")
     html_parts.append("</tbody></table>")
-    if len(mismatched_pairs) > max_mismatches_to_show:
-        html_parts.append(f"<p style='font-size:0.8em; color:grey;'>Displaying first {max_mismatches_to_show} of {len(mismatched_pairs)} mismatches.</p>")
+    if total_mismatches > max_mismatches_to_show:
+        html_parts.append(f"<p style='font-size:0.8em; color:grey;'>Displaying first {max_mismatches_to_show} of {total_mismatches} mismatches.</p>")
     return "".join(html_parts)
 def _write_gateway_view_section(write_html, log_stats):
     write_html("<h2>Gateway Analysis</h2>")
@@ -3090,10 +3549,14 @@ def _write_gateway_view_section(write_html, log_stats):
         return
     write_html("<details close><summary>Gateway Latency & Correlation Overview</summary><table>")
     write_html("<thead><tr><th>Mapping</th><th>Source Events</th><th>Correlated Pairs</th><th>Uncorrelated (Lost)</th><th>Avg Latency (ms)</th><th>Min (ms)</th><th>Max (ms)</th></tr></thead><tbody>")
-    sorted_results = sorted(gw_res.items(), key=lambda item: f"{item[1].get('mapping_info', {}).get('source_signal', '')}")
-    for idx, res in sorted_results:
+    # Rótulo de cada mapeamento montado e ordenado uma única vez, para a visão geral e para as divergências
+    labeled_results = []
+    for res in gw_res.values():
         mi = res.get('mapping_info', {})
         map_label = f"<code>[{mi.get('source_network', '')}].{mi.get('source_signal', '')} → [{mi.get('target_network', '')}].{mi.get('target_signal', '')}</code>"
+        labeled_results.append((f"{mi.get('source_signal', '')}", map_label, res))
+    labeled_results.sort(key=itemgetter(0))
+    for _, map_label, res in labeled_results:
         ls = res.get('latency_stats', {})
         correlated_count = ls.get('count', 0)
         total_comparisons = res.get('comparisons', 0)
@@ -3105,31 +3568,37 @@ def _write_gateway_view_section(write_html, log_stats):
         max_ms_str = f"{ls.get('max', 0) * 1000:.3f}" if ls.get('max') != float('-inf') else "-"
         write_html(f"<tr><td>{map_label}</td><td>{total_comparisons}</td><td>{correlated_count}</td><td>{lost_tag}</td><td>{avg_ms_str}</td><td>{min_ms_str}</td><td>{max_ms_str}</td></tr>")
     write_html("</tbody></table></details>")
-    mappings_with_mismatches = sorted([(idx, res) for idx, res in gw_res.items() if res.get('mismatches_value', 0) + res.get('mismatches_type', 0) > 0], key=lambda item: f"{item[1].get('mapping_info', {}).get('source_signal', '')}")
+    mappings_with_mismatches = [(map_label, res) for _, map_label, res in labeled_results if res.get('mismatches_value', 0) + res.get('mismatches_type', 0) > 0]
     if mappings_with_mismatches:
         write_html("<details close><summary>Gateway Value Mismatches</summary>")
-        for idx, res in mappings_with_mismatches:
-            mi = res.get('mapping_info', {})
-            map_label = f"<code>[{mi.get('source_network')}].{mi.get('source_signal')} → [{mi.get('target_network')}].{mi.get('target_signal')}</code>"
+        for map_label, res in mappings_with_mismatches:
             mismatch_count = res.get('mismatches_value', 0) + res.get('mismatches_type', 0)
             write_html(f"<h4>Mapping: {map_label} ({mismatch_count} mismatches)</h4>")     
             mismatch_examples = res.get('mismatch_examples', [])
             if mismatch_examples:
-                write_html(_generate_gateway_mismatch_table_html(mismatch_examples))
+                write_html(_generate_gateway_mismatch_table_html(mismatch_examples, mismatch_count))
         write_html("</details>")
+def report_filename_for_log(log_path: str) -> str:
+    """Nome padrão do relatório de um log: LR_<nome do log sem extensão>.html, no diretório corrente."""
+    return f"LR_{os.path.splitext(os.path.basename(log_path))[0]}.html"
 def generate_html_report(log_stats, args, ldf_data: LDFData, log_path, ldf_path,
                          dbc_paths: Dict[str, Union[str, List[str]]],
                          can_dbcs: Dict[str, Dict[int, DBCMessage]],
                          user_gateway_map: Optional[List[Dict[str, Any]]]):
-    output_file_path = log_stats['config_used'].get('output_file')
+    config_used = log_stats['config_used']
+    output_file_path = config_used.get('output_file')
     if output_file_path:
         report_filename = output_file_path
     else:
-        report_filename = f"LR_{os.path.splitext(os.path.basename(log_path))[0]}.html"
+        report_filename = report_filename_for_log(log_path)
+    # Grava num arquivo temporário e só o renomeia ao final, para uma falha não deixar um relatório truncado
+    tmp_filename = f"{report_filename}.{os.getpid()}.tmp"
     try:
-        with open(report_filename, 'w', encoding='utf-8') as f_report:
+        # O relatório vai direto para o arquivo, por um buffer grande, em vez de ser montado inteiro em memória
+        with open(tmp_filename, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER_BYTES) as f_report:
+            write_report = f_report.write
             def write_html(html_content):
-                f_report.write(html_content + "\n")
+                write_report(html_content + "\n")
             _write_report_header(write_html, log_stats)
             _write_summary_tables(write_html, log_stats, args, can_dbcs, ldf_data)
             _write_statistics_section(write_html, log_stats, ldf_data)
@@ -3141,22 +3610,39 @@ def generate_html_report(log_stats, args, ldf_data: LDFData, log_path, ldf_path,
             _write_slave_reliability_section(write_html, log_stats)
             _write_schedule_jitter_section(write_html, log_stats, ldf_data)
             _write_physical_metrics_table(write_html, log_stats)
-            if log_stats.get('config_used', {}).get('enable_gateway_validation'):
+            if config_used.get('enable_gateway_validation'):
                 _write_gateway_view_section(write_html, log_stats)
             write_html("</body></html>")
+        os.replace(tmp_filename, report_filename)
         print(f"LINSpector report generated: {report_filename}")
         return report_filename
     except (IOError, FileNotFoundError) as e:
         print(f"Failed to write Linspector report to '{report_filename}'. Please ensure the directory exists and you have write permissions. Error: {e}")
         return None
-def main():
+    finally:
+        if os.path.exists(tmp_filename):
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+def require_file(path: str, label: str) -> os.stat_result:
+    """Faz um único stat do arquivo de entrada e o devolve; encerra com erro se não existir ou não for um arquivo regular."""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not S_ISREG(file_stat.st_mode):
+        print(f"ERROR: {label} file not found: {path}")
+        sys.exit(1)
+    return file_stat
+def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=f"{SCRIPT_NAME} v{SCRIPT_VERSION} - Analyze LIN/CAN logs based on LDF/DBC definitions.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     parser.add_argument('--config', type=str, help="Path to a JSON configuration file. CLI arguments override file values.")
     parser.add_argument('--ldf', help='Path to the LIN Description File (LDF).')
-    parser.add_argument('--log', help='Path to the log file to analyze.')
+    parser.add_argument('--log', nargs='+', help='Path(s) to the log file(s) to analyze. Several logs are analyzed in parallel, one report each.')
     parser.add_argument('--gm', '--gateway_map', dest='gateway_map_file', type=str, help='Path to the JSON file with gateway signal mappings.')
     parser.add_argument('--can1_dbc', nargs='+', help='Path(s) to the DBC file(s) for CAN1.')
     parser.add_argument('--can2_dbc', nargs='+', help='Path(s) to the DBC file(s) for CAN2.')
@@ -3173,109 +3659,124 @@ def main():
     parser.add_argument('--disable_physical', action='store_true', help='Disable LIN physical layer validation.')
     parser.add_argument('--disable_schedule', action='store_true', help='Disable LIN schedule validation.')
     parser.add_argument('--disable_gateway', action='store_true', help='Disable all gateway validation.')
-    args = parser.parse_args()
-    if args.config:
-        if not os.path.isfile(args.config):
-            print(f"ERROR: Configuration file not found: {args.config}")
-            sys.exit(1)
+    parser.add_argument('--disable_range', action='store_true', help='Disable signal min/max range validation.')
+    parser.add_argument('--signals', type=str, help='Comma-separated signal names to decode; other signals are skipped in signal statistics.')
+    return parser
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Lê a linha de comando (ou argv), aplicando o arquivo --config como valores padrão que a CLI pode sobrescrever."""
+    parser = build_arg_parser()
+    # Primeira fase só procura --config, para que a linha de comando completa seja lida uma única vez, já com os padrões do arquivo
+    config_parser = argparse.ArgumentParser(add_help=False)
+    config_parser.add_argument('--config', type=str)
+    config_args, _ = config_parser.parse_known_args(argv)
+    if config_args.config:
+        require_file(config_args.config, "Configuration")
         try:
-            with open(args.config, 'r') as f:
-                config_data = json.load(f)
+            config_data = read_json_file(config_args.config)
             parser.set_defaults(**config_data)
         except json.JSONDecodeError as e:
             print(f"ERROR: Syntax error in JSON configuration file: {e}")
             sys.exit(1)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if not args.log:
         parser.error("The --log argument is required (either via CLI or configuration file).")
     if not args.ldf:
         parser.error("The --ldf argument is required (either via CLI or configuration file).")
-    if not os.path.isfile(args.log):
-        print(f"ERROR: Log file not found: {args.log}")
-        sys.exit(1)
-    if not os.path.isfile(args.ldf):
-        print(f"ERROR: LDF file not found: {args.ldf}")
-        sys.exit(1)
+    return args
+def load_ldf_input(ldf_path: str) -> Tuple[LDFData, Dict[str, Any]]:
+    """Carrega o LDF (com cache em disco) e agrupa schedules equivalentes; devolve (ldf_data, schedule_maps)."""
+    ldf_stat = require_file(ldf_path, "LDF")
     try:
-        ldf_data = parse_ldf(args.ldf)
+        ldf_data = parse_ldf_cached(ldf_path, ldf_stat)
         if ldf_data and ldf_data.schedules:
-            original_schedules = ldf_data.schedules.copy()
-            unique_schedules, orig_to_rep, rep_to_grouped = group_equivalent_schedules(original_schedules)
+            unique_schedules, orig_to_rep, rep_to_grouped = group_equivalent_schedules(ldf_data.schedules)
             ldf_data.schedules = unique_schedules
             schedule_maps = {'orig_to_rep': orig_to_rep, 'rep_to_grouped': rep_to_grouped}
         else:
             schedule_maps = {}
     except Exception as e:
-        print(f"ERROR: Failed to parse LDF file '{args.ldf}': {e}")
+        print(f"ERROR: Failed to parse LDF file '{ldf_path}': {e}")
         sys.exit(1)
-    can_dbcs_loaded = {}
-    dbc_paths_for_report = {}
+    return ldf_data, schedule_maps
+def dbc_channels_from_args(args: argparse.Namespace) -> Dict[str, List[str]]:
+    """Canais CAN/CAN FD que receberam ao menos um DBC na linha de comando."""
     dbc_channel_args = {
         'CAN1': args.can1_dbc, 'CAN2': args.can2_dbc, 'CAN3': args.can3_dbc,
         'CANFD1': args.canfd1_dbc, 'CANFD2': args.canfd2_dbc, 'CANFD3': args.canfd3_dbc
     }
-    any_dbc_provided = any(v for v in dbc_channel_args.values())
-    for channel_name, dbc_paths in dbc_channel_args.items():
-        if dbc_paths:
-            for path in dbc_paths:
-                if not os.path.isfile(path):
-                    print(f"ERROR: DBC file not found: {path}")
-                    sys.exit(1)
-            try:
-                messages, _ = parse_dbcs_for_channel(dbc_paths)
-                if messages:
-                    can_dbcs_loaded[channel_name] = messages
-                    dbc_paths_for_report[channel_name] = dbc_paths
-            except Exception as e:
-                print(f"ERROR: Failed to parse DBC files for {channel_name}: {e}")
-                sys.exit(1)
-    enable_gateway_validation = not args.disable_gateway and args.gateway_map_file and any_dbc_provided
-    user_gateway_map = None
-    gateway_lookup_for_processing = {}
-    gateway_map_warnings = []
-    
-    if enable_gateway_validation:
-        user_gateway_map = load_gateway_map(args.gateway_map_file)
-        if user_gateway_map:
-            gateway_lookup = {'source': defaultdict(lambda: defaultdict(list)), 'target': defaultdict(lambda: defaultdict(list))}
-            ldf_sigs_by_name = {s.name: s for f in ldf_data.frames.values() for s in f.signals}
-            dbc_sigs_by_name = {sig.name: sig for dbc in can_dbcs_loaded.values() for msg in dbc.values() for sig in msg.signals}
-
-            for map_index, mapping in enumerate(user_gateway_map):
-                mapping['map_index'] = map_index
-                
-                src_details = find_message_details_for_gateway(mapping['source_network'], mapping['source_message'], mapping['source_signal'], ldf_data, can_dbcs_loaded, gateway_map_warnings, map_index, 'source')
-                tgt_details = find_message_details_for_gateway(mapping['target_network'], mapping['target_message'], mapping['target_signal'], ldf_data, can_dbcs_loaded, gateway_map_warnings, map_index, 'target')
-
-                if src_details:
-                    if mapping['source_network'] == 'LIN':
-                        mapping['_source_signal_obj'] = ldf_sigs_by_name.get(mapping['source_signal'])
-                    else:
-                        mapping['_source_signal_obj'] = dbc_sigs_by_name.get(mapping['source_signal'])
-                    if mapping.get('_source_signal_obj'):
-                         gateway_lookup['source'][mapping['source_network']][src_details[0]].append(mapping)
-
-                if tgt_details:
-                    if mapping['target_network'] == 'LIN':
-                        mapping['_target_signal_obj'] = ldf_sigs_by_name.get(mapping['target_signal'])
-                    else:
-                        mapping['_target_signal_obj'] = dbc_sigs_by_name.get(mapping['target_signal'])
-                    if mapping.get('_target_signal_obj'):
-                        gateway_lookup['target'][mapping['target_network']][tgt_details[0]].append(mapping)
-
-            gateway_lookup_for_processing = gateway_lookup
-        else:
-            enable_gateway_validation = False
-            
-    enable_schedule_validation = not args.disable_schedule and bool(ldf_data.schedules)
-    config = {
+    return {channel_name: dbc_paths for channel_name, dbc_paths in dbc_channel_args.items() if dbc_paths}
+def load_dbc_inputs(dbc_channels: Dict[str, List[str]]) -> Tuple[Dict[str, Dict[int, DBCMessage]], Dict[str, List[str]]]:
+    """Carrega os DBCs de cada canal (em paralelo quando há mais de um); devolve (mensagens por canal, DBCs por canal para o relatório)."""
+    can_dbcs_loaded = {}
+    dbc_paths_for_report = {}
+    # Um stat por arquivo, mesmo que o DBC seja repetido em vários canais
+    dbc_stats = {path: require_file(path, "DBC") for dbc_paths in dbc_channels.values() for path in dbc_paths}
+    # Canais com a mesma lista de DBCs (na mesma ordem) compartilham um único parsing
+    unique_path_sets = list(dict.fromkeys(tuple(dbc_paths) for dbc_paths in dbc_channels.values()))
+    path_set_futures = {}
+    if len(unique_path_sets) > 1:
+        # As listas são independentes: cada uma é parseada em um processo próprio
+        with ProcessPoolExecutor(max_workers=min(len(unique_path_sets), os.cpu_count() or 1)) as executor:
+            path_set_futures = {path_set: executor.submit(parse_dbcs_for_channel_cached, list(path_set), [dbc_stats[path] for path in path_set]) for path_set in unique_path_sets}
+    parsed_path_sets = {}
+    for channel_name, dbc_paths in dbc_channels.items():
+        try:
+            path_set = tuple(dbc_paths)
+            if path_set not in parsed_path_sets:
+                path_set_future = path_set_futures.get(path_set)
+                parsed_path_sets[path_set] = path_set_future.result() if path_set_future else parse_dbcs_for_channel_cached(dbc_paths, [dbc_stats[path] for path in dbc_paths])
+            messages, _ = parsed_path_sets[path_set]
+            if messages:
+                can_dbcs_loaded[channel_name] = messages
+                dbc_paths_for_report[channel_name] = dbc_paths
+        except Exception as e:
+            print(f"ERROR: Failed to parse DBC files for {channel_name}: {e}")
+            sys.exit(1)
+    return can_dbcs_loaded, dbc_paths_for_report
+def build_gateway_lookup(user_gateway_map: List[Dict[str, Any]], ldf_data: LDFData, can_dbcs_loaded: Dict[str, Dict[int, DBCMessage]],
+                         gateway_map_warnings: List[Dict[str, Any]]) -> Dict[str, Dict[Tuple[str, int], List[Dict[str, Any]]]]:
+    """Resolve cada mapeamento do gateway (frame e sinal de origem/destino) e os indexa por (rede, ID do frame) em cada papel."""
+    # Mapeamentos indexados por (rede, ID do frame) em cada papel
+    gateway_lookup = {'source': {}, 'target': {}}
+    ldf_sigs_by_name = ldf_data.signals_by_name
+    # Sinais DBC indexados por canal, montados só para os canais citados no mapa (nomes repetidos entre canais não se sobrepõem)
+    dbc_sigs_by_network: Dict[str, Dict[str, DBCSignal]] = {}
+    def dbc_signal(network_name, signal_name):
+        network_sigs = dbc_sigs_by_network.get(network_name)
+        if network_sigs is None:
+            network_sigs = dbc_sigs_by_network[network_name] = {sig.name: sig for msg in can_dbcs_loaded.get(network_name.upper(), {}).values() for sig in msg.signals}
+        return network_sigs.get(signal_name)
+    gateway_name_lookups = build_gateway_name_lookups(ldf_data, can_dbcs_loaded)
+    for map_index, mapping in enumerate(user_gateway_map):
+        mapping['map_index'] = map_index
+        src_details = find_message_details_for_gateway(mapping['source_network'], mapping['source_message'], mapping['source_signal'], ldf_data, can_dbcs_loaded, gateway_map_warnings, map_index, 'source', gateway_name_lookups)
+        tgt_details = find_message_details_for_gateway(mapping['target_network'], mapping['target_message'], mapping['target_signal'], ldf_data, can_dbcs_loaded, gateway_map_warnings, map_index, 'target', gateway_name_lookups)
+        if src_details:
+            if mapping['source_network'] == 'LIN':
+                mapping['_source_signal_obj'] = ldf_sigs_by_name.get(mapping['source_signal'])
+            else:
+                mapping['_source_signal_obj'] = dbc_signal(mapping['source_network'], mapping['source_signal'])
+            if mapping.get('_source_signal_obj'):
+                gateway_lookup['source'].setdefault((mapping['source_network'], src_details[0]), []).append(mapping)
+        if tgt_details:
+            if mapping['target_network'] == 'LIN':
+                mapping['_target_signal_obj'] = ldf_sigs_by_name.get(mapping['target_signal'])
+            else:
+                mapping['_target_signal_obj'] = dbc_signal(mapping['target_network'], mapping['target_signal'])
+            if mapping.get('_target_signal_obj'):
+                gateway_lookup['target'].setdefault((mapping['target_network'], tgt_details[0]), []).append(mapping)
+    return gateway_lookup
+def build_config(args: argparse.Namespace, log_path: str, schedule_maps: Dict[str, Any],
+                 enable_schedule_validation: bool, enable_gateway_validation: bool) -> Dict[str, Any]:
+    """Monta o dicionário de configuração repassado a process_log_file a partir dos argumentos já validados."""
+    return {
         "ldf_file": args.ldf,
-        "log_file": args.log,
+        "log_file": log_path,
         "gateway_map_file": args.gateway_map_file,
         "gateway_tolerance": args.gateway_tolerance,
         "lin_baudrate": args.lin_baudrate,
         "bus_load_window_s": args.bus_load_window_s,
-        "exclude_gateway_signals": set(s.strip() for s in args.exclude_gateway_signals.split(',')) if args.exclude_gateway_signals else set(),
+        "exclude_gateway_signals": frozenset(map(str.strip, args.exclude_gateway_signals.split(','))) if args.exclude_gateway_signals else frozenset(),
         "schedule_tolerance_factor": 0.1,
         "schedule_min_tolerance_s": DEFAULT_SCHEDULE_MIN_ABSOLUTE_TOLERANCE_S,
         "schedule_maps": schedule_maps,
@@ -3284,35 +3785,100 @@ def main():
         "enable_physical_validation": not args.disable_physical,
         "enable_schedule_validation": enable_schedule_validation,
         "enable_gateway_validation": enable_gateway_validation,
+        "enable_range_validation": not args.disable_range,
+        "signals_of_interest": frozenset(s.strip() for s in args.signals.split(',') if s.strip()) if args.signals else None,
     }
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    log_paths = [args.log] if isinstance(args.log, str) else list(args.log)
+    for log_path in log_paths:
+        require_file(log_path, "Log")
+    # O mesmo log informado mais de uma vez é analisado uma única vez
+    unique_logs: Dict[str, str] = {}
+    for log_path in log_paths:
+        unique_logs.setdefault(os.path.realpath(log_path), log_path)
+    log_paths = list(unique_logs.values())
+    # Logs de diretórios diferentes com o mesmo nome gravariam o mesmo relatório ao mesmo tempo
+    logs_by_report = defaultdict(list)
+    for log_path in log_paths:
+        logs_by_report[report_filename_for_log(log_path)].append(log_path)
+    for report_filename, colliding_logs in logs_by_report.items():
+        if len(colliding_logs) > 1:
+            print(f"ERROR: Logs {', '.join(colliding_logs)} would all be written to the same report '{report_filename}'. Rename them or analyze them separately.")
+            sys.exit(1)
+    ldf_data, schedule_maps = load_ldf_input(args.ldf)
+    dbc_channels = dbc_channels_from_args(args)
+    can_dbcs_loaded, dbc_paths_for_report = load_dbc_inputs(dbc_channels)
+    enable_gateway_validation = not args.disable_gateway and args.gateway_map_file and bool(dbc_channels)
+    user_gateway_map = None
+    gateway_lookup_for_processing = {}
+    gateway_map_warnings = []
+    if enable_gateway_validation:
+        user_gateway_map = load_gateway_map(args.gateway_map_file)
+        if user_gateway_map:
+            gateway_lookup_for_processing = build_gateway_lookup(user_gateway_map, ldf_data, can_dbcs_loaded, gateway_map_warnings)
+        else:
+            enable_gateway_validation = False
+    enable_schedule_validation = not args.disable_schedule and bool(ldf_data.schedules)
+    config = build_config(args, log_paths[0], schedule_maps, enable_schedule_validation, enable_gateway_validation)
+    if len(log_paths) == 1:
+        analyze_log(log_paths[0], ldf_data, can_dbcs_loaded, gateway_lookup_for_processing, config,
+                    user_gateway_map, gateway_map_warnings, dbc_paths_for_report)
+        return
+    analyze = partial(analyze_log, ldf_data=ldf_data, can_dbcs=can_dbcs_loaded, gateway_lookup=gateway_lookup_for_processing,
+                      config=config, user_gateway_map=user_gateway_map, gateway_map_warnings=gateway_map_warnings,
+                      dbc_paths_for_report=dbc_paths_for_report)
+    with ProcessPoolExecutor(max_workers=min(len(log_paths), os.cpu_count() or 1)) as executor:
+        log_futures = [(log_path, executor.submit(analyze, log_path)) for log_path in log_paths]
+        # Cada log é conferido isoladamente: a falha de um não esconde o resultado dos demais
+        for log_path, log_future in log_futures:
+            try:
+                report_filename = log_future.result()
+            except Exception as e:
+                print(f"ERROR: Failed to analyze log '{log_path}': {e}")
+                continue
+            if not report_filename:
+                print(f"ERROR: No report generated for log '{log_path}'.")
+def analyze_log(log_path: str, ldf_data: LDFData, can_dbcs: Dict[str, Dict[int, DBCMessage]], gateway_lookup: Dict[str, Any],
+                config: Dict[str, Any], user_gateway_map: Optional[List[Dict[str, Any]]], gateway_map_warnings: list,
+                dbc_paths_for_report: Dict[str, List[str]]) -> Optional[str]:
+    """
+    Analisa um único log e gera o relatório HTML correspondente.
+
+    É uma função de módulo (e não um trecho de main) para poder ser despachada
+    a processos separados quando vários logs são informados em --log.
+
+    Returns:
+        Optional[str]: Caminho do relatório gerado, ou None em caso de falha
+    """
+    config = dict(config, log_file=log_path)
     log_stats = process_log_file(
-        log_path=args.log,
+        log_path=log_path,
         ldf_data=ldf_data,
-        can_dbcs=can_dbcs_loaded,
-        gateway_lookup=gateway_lookup_for_processing,
+        can_dbcs=can_dbcs,
+        gateway_lookup=gateway_lookup,
         config=config,
         progress_callback=None
     )
     log_stats['gateway_map_warnings'] = gateway_map_warnings
     log_stats['ldf_data_for_report'] = ldf_data
     config['dbc_files'] = dbc_paths_for_report
-    class ArgsForReport:
-        def __init__(self, config_dict):
-            self.gm = config_dict.get('gateway_map_file')
-            self.enable_physical_validation = config_dict.get('enable_physical_validation', True)
-            self.enable_checksum_validation = config_dict.get('enable_checksum_validation', True)
-            self.enable_schedule_validation = config_dict.get('enable_schedule_validation', True)
-            self.gateway_map_warnings_runtime = log_stats.get('gateway_map_warnings', [])
-            self.dbc_files = config_dict.get('dbc_files', {})
-    args_for_report = ArgsForReport(config)
-    generate_html_report(
+    args_for_report = SimpleNamespace(
+        gm=config.get('gateway_map_file'),
+        enable_physical_validation=config.get('enable_physical_validation', True),
+        enable_checksum_validation=config.get('enable_checksum_validation', True),
+        enable_schedule_validation=config.get('enable_schedule_validation', True),
+        gateway_map_warnings_runtime=gateway_map_warnings,
+        dbc_files=dbc_paths_for_report
+    )
+    return generate_html_report(
         log_stats=log_stats,
         args=args_for_report,
         ldf_data=ldf_data,
         log_path=config['log_file'],
         ldf_path=config['ldf_file'],
         dbc_paths=config['dbc_files'],
-        can_dbcs=can_dbcs_loaded,
+        can_dbcs=can_dbcs,
         user_gateway_map=user_gateway_map
     )
 if __name__ == "__main__":